@@ -0,0 +1,24 @@
+-- Migration 015: Strategy Agent event aggregation indexes
+--
+-- load_niche_metrics_from_db counts recent CRITICAL/HIGH economic events per
+-- category (recent_events CTE). These indexes let both sides of that join
+-- run as index-only scans.
+
+-- =============================================================================
+-- ECONOMIC EVENTS: recent urgent events
+-- =============================================================================
+-- Note: NOW() is not immutable, so the 7-day window cannot be part of the
+-- predicate. detected_at leads the key instead, making the window a range scan
+-- over urgent events only; asin is carried for the join probe.
+CREATE INDEX IF NOT EXISTS idx_economic_events_urgent_recent
+ON economic_events(detected_at DESC, asin)
+WHERE urgency IN ('CRITICAL', 'HIGH');
+
+-- =============================================================================
+-- ASINS: asin -> category_id lookup
+-- =============================================================================
+CREATE INDEX IF NOT EXISTS idx_asins_asin_category
+ON asins(asin) INCLUDE (category_id);
+
+COMMENT ON INDEX idx_economic_events_urgent_recent IS 'Strategy Agent: recent CRITICAL/HIGH events per ASIN (index-only scan)';
+COMMENT ON INDEX idx_asins_asin_category IS 'Strategy Agent: covering asin -> category_id lookup for event aggregation';
@@ -0,0 +1,17 @@
+-- Migration 016: Token budget discovery / scanning split
+--
+-- token_budget only tracked total tokens_used, so the discovery / scanning
+-- allocation (discovery_allocation_pct / scanning_allocation_pct) could not
+-- be enforced. TokenBudgetManager now charges each run type separately.
+
+ALTER TABLE token_budget
+    ADD COLUMN IF NOT EXISTS discovery_tokens_used INTEGER DEFAULT 0,
+    ADD COLUMN IF NOT EXISTS scanning_tokens_used INTEGER DEFAULT 0;
+
+-- Existing usage was all reported as scanning
+UPDATE token_budget
+SET scanning_tokens_used = tokens_used - COALESCE(discovery_tokens_used, 0)
+WHERE scanning_tokens_used = 0 AND tokens_used > 0;
+
+COMMENT ON COLUMN token_budget.discovery_tokens_used IS 'Tokens charged to category discovery (capped by discovery_allocation_pct)';
+COMMENT ON COLUMN token_budget.scanning_tokens_used IS 'Tokens charged to regular scanning (capped by scanning_allocation_pct)';
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Smartacus Numba Cache Warmer
+============================
+
+Compiles the opportunity scoring kernels (_score_row, _score_batch_core)
+once and stores the machine code in numba's on-disk cache (cache=True).
+Short-lived jobs (cron scans, run_controlled) then load the compiled
+kernels at import instead of paying the LLVM compilation on their first
+batch.
+
+Run it at build/deploy time, after installing requirements, from the
+same image and Python as the jobs:
+    Command: python scripts/warm_numba_cache.py
+
+The cache lives next to the sources (__pycache__) unless NUMBA_CACHE_DIR
+points elsewhere; it must be readable by the jobs. Without numba the
+scorer uses its NumPy/Python paths and this script has nothing to do.
+"""
+
+import sys
+import time
+import logging
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+)
+logger = logging.getLogger("smartacus.numba_cache")
+
+
+def main():
+    from src.scoring import opportunity_scorer
+
+    if not opportunity_scorer.HAS_NUMBA:
+        logger.info("numba not installed: nothing to compile")
+        return 0
+
+    start = time.perf_counter()
+    # A two-product batch compiles _score_batch_core (and _score_row it calls)
+    scorer = opportunity_scorer.OpportunityScorer()
+    scorer.score_batch([{"product_id": "WARMUP_1"}, {"product_id": "WARMUP_2", "fba_fees": 3.5}])
+    logger.info(f"Scoring kernels compiled and cached in {time.perf_counter() - start:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
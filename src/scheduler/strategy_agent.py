@@ -14,17 +14,49 @@ Features:
 - Deterministic scoring with optional LLM override
 - Cold start protection (min 2 runs before PAUSE)
 - Event boost for critical signals
+- Optional Thompson sampling on density (seedable, off by default)
 """
 
 import os
 import json
+import time
 import logging
 import hashlib
-from datetime import datetime, timedelta
-from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Literal, Tuple, Any
+import sqlite3
+import threading
+from itertools import chain, repeat
+from operator import itemgetter
+from datetime import datetime, timedelta, timezone
+from dataclasses import dataclass, field, fields, InitVar
+from typing import List, Dict, Optional, Literal, Tuple, Any, Iterable, Iterator
 from enum import Enum
 
+import numpy as np
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import xxhash
+    HAS_XXHASH = True
+except ImportError:
+    HAS_XXHASH = False
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit (bare or parametrized use)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
 logger = logging.getLogger(__name__)
 
 
@@ -32,15 +64,17 @@ logger = logging.getLogger(__name__)
 # LLM CONFIGURATION (normalized)
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class LLMConfig:
     """Normalized LLM configuration."""
-    provider: str = "openai"      # openai, anthropic
-    model: str = "gpt-4o-mini"    # Model to use
+    provider: str = "openai"       # openai, anthropic
+    model: str = "gpt-4o-mini"     # Model to use
     api_key: Optional[str] = None
     max_tokens: int = 500
     temperature: float = 0.1
-    cache_ttl_hours: int = 24     # Cache TTL for responses
+    cache_ttl_hours: int = 24      # Cache TTL for responses
+    timeout_seconds: float = 10.0  # Per-request timeout (a hung call must not stall decide())
+    max_retries: int = 2           # Client-side retries on transient errors
 
     @classmethod
     def from_env(cls) -> "LLMConfig":
@@ -66,6 +100,8 @@ class LLMConfig:
             max_tokens=int(os.getenv("LLM_MAX_TOKENS", "500")),
             temperature=float(os.getenv("LLM_TEMPERATURE", "0.1")),
             cache_ttl_hours=int(os.getenv("LLM_CACHE_TTL_HOURS", "24")),
+            timeout_seconds=float(os.getenv("LLM_TIMEOUT_SECONDS", "10")),
+            max_retries=int(os.getenv("LLM_MAX_RETRIES", "2")),
         )
 
 
@@ -116,35 +152,76 @@ LLM_RESPONSE_SCHEMA = {
 
 
 # =============================================================================
-# LLM RESPONSE CACHE (Redis-backed with in-memory fallback)
+# LLM RESPONSE CACHE (Redis-backed with on-disk SQLite fallback)
 # =============================================================================
 
 class LLMResponseCache:
     """
-    Redis-backed cache for LLM responses with in-memory fallback.
+    Redis-backed cache for LLM responses with on-disk fallback.
 
-    Uses Redis if available, otherwise falls back to in-memory cache.
+    Uses Redis if connected, otherwise a local SQLite file so cached
+    decisions survive process restarts (no paid re-calls after a deploy).
+    An in-memory dict is the last resort if the disk store is unusable.
     Cache keys are prefixed with 'llm:strategy:' for namespace isolation.
+
+    Environment variables:
+        LLM_CACHE_PATH - SQLite file (default: ~/.smartacus/llm_cache.sqlite,
+                         empty string disables the disk tier)
     """
 
     CACHE_PREFIX = "llm:strategy"
+    DEFAULT_DISK_PATH = "~/.smartacus/llm_cache.sqlite"
 
-    def __init__(self):
+    # Rows kept in the disk tier; expired rows and the oldest beyond this
+    # are pruned on every write (keys change every cycle)
+    DISK_MAX_ENTRIES = 1000
+
+    def __init__(self, disk_path: Optional[str] = None):
         self._redis_cache = None
         self._memory_cache: Dict[str, Tuple[datetime, Dict]] = {}
+        if disk_path is None:
+            disk_path = os.getenv("LLM_CACHE_PATH", self.DEFAULT_DISK_PATH)
+        self._disk_path = os.path.expanduser(disk_path) if disk_path else None
+        self._disk = None  # Opened lazily on first access
+        self._disk_lock = threading.Lock()
         self._init_redis()
 
     def _init_redis(self) -> None:
         """Initialize Redis cache if available."""
         try:
             from src.cache import get_cache
-            self._redis_cache = get_cache()
-            logger.debug(f"LLM cache using backend: {self._redis_cache.get_stats()['backend']}")
+            cache = get_cache()
+            backend = cache.get_stats()["backend"]
+            logger.debug(f"LLM cache using backend: {backend}")
+            # The shared cache's memory fallback does not survive restarts:
+            # only use it when actually backed by Redis, else go to disk.
+            if backend == "redis":
+                self._redis_cache = cache
         except ImportError:
-            logger.debug("Redis cache module not available, using in-memory cache")
+            logger.debug("Redis cache module not available, using disk cache")
         except Exception as e:
             logger.warning(f"Failed to initialize Redis cache: {e}")
 
+    def _get_disk(self) -> Optional[sqlite3.Connection]:
+        """Open the SQLite store on first use (None if disabled/unusable)."""
+        if self._disk is None and self._disk_path:
+            try:
+                os.makedirs(os.path.dirname(self._disk_path) or ".", exist_ok=True)
+                conn = sqlite3.connect(self._disk_path, check_same_thread=False)
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS llm_cache ("
+                    "key TEXT PRIMARY KEY, cached_at REAL NOT NULL, response TEXT NOT NULL)"
+                )
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS llm_cache_cached_at ON llm_cache (cached_at)"
+                )
+                conn.commit()
+                self._disk = conn
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"LLM disk cache unavailable ({self._disk_path}): {e}")
+                self._disk_path = None
+        return self._disk
+
     def _compute_cache_key(
         self,
         niches: List["NicheMetrics"],
@@ -179,7 +256,27 @@ class LLMResponseCache:
             except Exception as e:
                 logger.warning(f"Redis get failed: {e}")
 
-        # Fallback to memory cache
+        # Fallback to disk cache
+        disk = self._get_disk()
+        if disk is not None:
+            try:
+                with self._disk_lock:
+                    row = disk.execute(
+                        "SELECT cached_at, response FROM llm_cache WHERE key = ?",
+                        (key,),
+                    ).fetchone()
+                    if row is None:
+                        return None
+                    if time.time() - row[0] > ttl_hours * 3600:
+                        disk.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                        disk.commit()
+                        return None
+                logger.debug(f"Disk cache hit for {key}")
+                return json.loads(row[1])
+            except (sqlite3.Error, ValueError) as e:
+                logger.warning(f"Disk cache get failed: {e}")
+
+        # Last resort: memory cache
         if key not in self._memory_cache:
             return None
         cached_at, response = self._memory_cache[key]
@@ -201,7 +298,30 @@ class LLMResponseCache:
             except Exception as e:
                 logger.warning(f"Redis set failed: {e}")
 
-        # Fallback to memory cache
+        # Fallback to disk cache (TTL checked on read, expired rows pruned here)
+        disk = self._get_disk()
+        if disk is not None:
+            try:
+                now = time.time()
+                with self._disk_lock:
+                    disk.execute(
+                        "INSERT OR REPLACE INTO llm_cache (key, cached_at, response) VALUES (?, ?, ?)",
+                        (key, now, json.dumps(response)),
+                    )
+                    disk.execute(
+                        "DELETE FROM llm_cache WHERE cached_at < ?", (now - ttl_hours * 3600,)
+                    )
+                    disk.execute(
+                        "DELETE FROM llm_cache WHERE key NOT IN "
+                        "(SELECT key FROM llm_cache ORDER BY cached_at DESC LIMIT ?)",
+                        (self.DISK_MAX_ENTRIES,),
+                    )
+                    disk.commit()
+                return
+            except (sqlite3.Error, TypeError, ValueError) as e:
+                logger.warning(f"Disk cache set failed: {e}")
+
+        # Last resort: memory cache
         self._memory_cache[key] = (datetime.utcnow(), response)
 
     def clear(self) -> None:
@@ -213,6 +333,16 @@ class LLMResponseCache:
             except Exception as e:
                 logger.warning(f"Redis clear failed: {e}")
 
+        # Clear disk
+        disk = self._get_disk()
+        if disk is not None:
+            try:
+                with self._disk_lock:
+                    disk.execute("DELETE FROM llm_cache")
+                    disk.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Disk cache clear failed: {e}")
+
         # Clear memory
         self._memory_cache.clear()
 
@@ -221,6 +351,7 @@ class LLMResponseCache:
         stats = {
             "memory_keys": len(self._memory_cache),
             "redis_available": self._redis_cache is not None,
+            "disk_path": self._disk_path,
         }
         if self._redis_cache:
             try:
@@ -229,12 +360,24 @@ class LLMResponseCache:
                 stats["redis_connected"] = redis_stats.get("connected", False)
             except Exception:
                 pass
+        if self._disk is not None:
+            try:
+                with self._disk_lock:
+                    stats["disk_keys"] = self._disk.execute(
+                        "SELECT COUNT(*) FROM llm_cache"
+                    ).fetchone()[0]
+            except sqlite3.Error:
+                pass
         return stats
 
 
 # Global cache instance (singleton)
 _llm_cache = LLMResponseCache()
 
+# Shared OpenAI clients, keyed by (api_key, timeout, max_retries)
+_openai_clients: Dict[Tuple, Any] = {}
+_openai_clients_lock = threading.Lock()
+
 
 # =============================================================================
 # DATA MODELS
@@ -247,7 +390,11 @@ class NicheStatus(str, Enum):
     PAUSE = "PAUSE"      # Low yield, skip this cycle
 
 
-@dataclass
+# Enum.value goes through a descriptor; serializers use this table instead
+_STATUS_CACHE: Dict[NicheStatus, str] = {s: s.value for s in NicheStatus}
+
+
+@dataclass(slots=True, frozen=True)
 class NicheMetrics:
     """
     Performance metrics for a niche (category + domain).
@@ -282,17 +429,32 @@ class NicheMetrics:
     is_active: bool = False
     priority: int = 5                # 1=highest, 10=lowest
 
-    def __post_init__(self):
-        """Compute derived metrics."""
+    # Composite score computed by the loader's SQL (None = score in Python)
+    precomputed_score: Optional[float] = None
+
+    # Reference time for days_since_scan (pass one value for a whole batch)
+    now: InitVar[Optional[datetime]] = None
+
+    def __post_init__(self, now: Optional[datetime]):
+        """Compute derived metrics (frozen: set once via object.__setattr__)."""
         if self.total_asins_scanned > 0:
-            self.density = self.total_opportunities / self.total_asins_scanned
+            object.__setattr__(self, "density", self.total_opportunities / self.total_asins_scanned)
         if self.total_tokens_used > 0:
-            self.value_per_1k_tokens = (self.total_value_detected / self.total_tokens_used) * 1000
+            object.__setattr__(
+                self, "value_per_1k_tokens",
+                (self.total_value_detected / self.total_tokens_used) * 1000,
+            )
         if self.last_scanned_at:
-            self.days_since_scan = (datetime.utcnow() - self.last_scanned_at).days
+            last_scanned_at = self.last_scanned_at
+            if last_scanned_at.tzinfo is not None:
+                # TIMESTAMPTZ columns come back aware; compare in naive UTC
+                last_scanned_at = last_scanned_at.astimezone(timezone.utc).replace(tzinfo=None)
+            object.__setattr__(
+                self, "days_since_scan", ((now or datetime.utcnow()) - last_scanned_at).days
+            )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NicheAssessment:
     """Assessment result for a single niche."""
     niche_id: int
@@ -306,7 +468,7 @@ class NicheAssessment:
     confidence: float = 1.0          # 0-1, lower if LLM override used
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LLMMetrics:
     """Metrics for LLM consultation (for cost/impact tracking)."""
     provider: str = ""
@@ -320,7 +482,7 @@ class LLMMetrics:
     changed_decision: bool = False
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StrategyDecision:
     """Complete strategy decision for a cycle."""
     cycle_id: str
@@ -340,6 +502,7 @@ class StrategyDecision:
 
     def to_dict(self) -> Dict:
         """Convert to dictionary for logging/storage."""
+        status_str = _STATUS_CACHE
         result = {
             "cycle_id": self.cycle_id,
             "decided_at": self.decided_at.isoformat(),
@@ -354,8 +517,8 @@ class StrategyDecision:
                     "niche_id": a.niche_id,
                     "name": a.name,
                     "domain": a.domain,
-                    "status": a.status.value,
-                    "score": round(a.score, 3),
+                    "status": status_str[a.status],
+                    "score": a.score,
                     "tokens": a.tokens_allocated,
                     "max_asins": a.max_asins,
                     "justification": a.justification,
@@ -385,10 +548,76 @@ class StrategyDecision:
         return result
 
 
+# Slotted dataclasses have no __dict__: field names for serialization
+_ASSESSMENT_FIELDS = tuple(f.name for f in fields(NicheAssessment))
+
+
+@njit(cache=True)
+def _score_kernel(
+    vpt, density, days, events, runs, freshness, cold_bonus,
+    density_good, stale_days, min_runs, recent_days, rotation_penalty, boost,
+):
+    """
+    Fused single-pass loop over the strategy score (see _score_niche).
+
+    Compiled by numba when installed (cache=True keeps the machine code on
+    disk between processes); the NumPy path in _score_niches_vectorized is
+    used otherwise. No fastmath: results stay bit-identical to the scalar
+    and SQL versions of the formula.
+    """
+    n = vpt.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    for i in range(n):
+        has_events = events[i] > 0
+        d = min(max(days[i], 0), stale_days)
+        base = (
+            min(1.0, vpt[i] / 100) * 0.40 +
+            min(1.0, density[i] / density_good) * 0.30 +
+            freshness[d] * 0.20 +
+            (1.0 if has_events else 0.0) * 0.10
+        )
+        if runs[i] == 0:
+            bonus = cold_bonus[0]
+        elif runs[i] < min_runs:
+            bonus = cold_bonus[1]
+        else:
+            bonus = 0.0
+        score = min(1.0, base + bonus)
+        if has_events:
+            score = min(1.0, score * boost)
+        elif days[i] < recent_days:
+            score = score * rotation_penalty
+        out[i] = score
+    return out
+
+
 # =============================================================================
 # STRATEGY AGENT
 # =============================================================================
 
+def _build_freshness_lookup(stale_days: int, recent_days: int) -> Tuple[float, ...]:
+    """
+    Precompute the freshness curve for each whole day in [0, stale_days].
+
+    days_since_scan is an integer, so the granular curve only ever takes
+    stale_days + 1 distinct values: index with min(days, stale_days).
+    """
+    lookup = []
+    for days in range(stale_days + 1):
+        if days >= stale_days:
+            freshness = 1.0   # Urgent refresh needed
+        elif days >= 7:
+            # Linear interpolation 7d→14d: 0.5→1.0
+            freshness = 0.5 + 0.5 * ((days - 7) / (stale_days - 7))
+        elif days >= recent_days:
+            # Linear interpolation 2d→7d: 0.2→0.5
+            freshness = 0.2 + 0.3 * ((days - recent_days) / (7 - recent_days))
+        else:
+            freshness = 0.1   # Just scanned, lowest priority
+        lookup.append(freshness)
+    return tuple(lookup)
+
+
 class StrategyAgent:
     """
     Intelligent resource allocator for Smartacus.
@@ -427,23 +656,58 @@ class StrategyAgent:
     # Event boost (can override rotation penalty)
     EVENT_BOOST_MULTIPLIER = 1.5  # Boost score if critical events
 
-    def __init__(self, enable_llm: bool = False, llm_config: Optional[LLMConfig] = None):
+    # In-process LLM decision memo (scores drift slowly between cycles)
+    LLM_MEMO_TTL_SECONDS = 3600
+    LLM_MEMO_MAX_ENTRIES = 128
+
+    # Freshness curve per day (replaces the if/elif chain in _score_niche),
+    # rebuilt by __init_subclass__ when a subclass overrides the day constants
+    _FRESHNESS_LOOKUP = _build_freshness_lookup(STALE_DAYS, RECENTLY_SCANNED_DAYS)
+    _FRESHNESS_ARRAY = np.array(_FRESHNESS_LOOKUP)
+
+    # Cold start bonus: (never scanned, fewer than MIN_RUNS_BEFORE_PAUSE runs)
+    _COLD_BONUS = (0.3, 0.15)
+    _COLD_BONUS_ARRAY = np.array(_COLD_BONUS)
+    _NO_COLD_BONUS_ARRAY = np.zeros(len(_COLD_BONUS))
+
+    # Registries at least this large are scored by the numba kernel
+    NUMBA_MIN_NICHES = 256
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._FRESHNESS_LOOKUP = _build_freshness_lookup(cls.STALE_DAYS, cls.RECENTLY_SCANNED_DAYS)
+        cls._FRESHNESS_ARRAY = np.array(cls._FRESHNESS_LOOKUP)
+
+    def __init__(
+        self,
+        enable_llm: bool = False,
+        llm_config: Optional[LLMConfig] = None,
+        thompson_sampling: bool = False,
+        seed: Optional[int] = None,
+    ):
         """
         Initialize Strategy Agent.
 
         Args:
             enable_llm: If True, may consult LLM for ambiguous decisions
             llm_config: Optional LLM configuration (loads from env if None)
+            thompson_sampling: If True, score density from a Beta posterior
+                sample instead of the point estimate (replaces cold start bonus)
+            seed: Seed for the sampling RNG (reproducible cycles)
         """
         self.enable_llm = enable_llm
         self.llm_config = llm_config or LLMConfig.from_env()
+        self.thompson_sampling = thompson_sampling
+        self._rng = np.random.default_rng(seed)
         self._cycle_counter = 0
         self._last_llm_metrics: Optional[LLMMetrics] = None
+        self._openai_client = None  # Created on first consultation, then reused
+        self._llm_memo: Dict[bytes, Tuple[float, Dict]] = {}
 
     def decide(
         self,
         budget: int,
-        niches: List[NicheMetrics],
+        niches: Iterable[NicheMetrics],
         force_include: Optional[List[int]] = None,
     ) -> StrategyDecision:
         """
@@ -451,27 +715,35 @@ class StrategyAgent:
 
         Args:
             budget: Total tokens available for this cycle
-            niches: List of niche metrics to evaluate
+            niches: Niche metrics to evaluate (list or any iterable, e.g.
+                iter_niche_metrics_from_db; consumed once)
             force_include: Niche IDs that must be scanned (user override)
 
         Returns:
             StrategyDecision with allocations and justifications
         """
+        if not isinstance(niches, list):
+            niches = list(niches)
         self._cycle_counter += 1
-        cycle_id = self._generate_cycle_id()
+        now = datetime.utcnow()
+        cycle_id = self._generate_cycle_id(now)
 
         logger.info(f"Strategy cycle {cycle_id}: {len(niches)} niches, {budget} tokens")
 
         # Score and classify each niche
-        scored_niches: List[Tuple[NicheMetrics, float]] = []
-        for niche in niches:
-            score = self._score_niche(niche)
-            scored_niches.append((niche, score))
-
-        # Sort by score descending
-        scored_niches.sort(key=lambda x: x[1], reverse=True)
+        if not self.thompson_sampling and niches and all(
+            n.precomputed_score is not None for n in niches
+        ):
+            # Scored in SQL by load_niche_metrics_from_db (same formula)
+            scores = np.fromiter(
+                (n.precomputed_score for n in niches), dtype=np.float64, count=len(niches)
+            )
+        else:
+            density_samples = self._sample_density(niches) if self.thompson_sampling else None
+            scores = self._score_niches_vectorized(niches, density_samples)
+        scored_niches: List[Tuple[NicheMetrics, float]] = list(zip(niches, scores.tolist()))
 
-        # Classify into EXPLOIT / EXPLORE / PAUSE
+        # Classify into EXPLOIT / EXPLORE / PAUSE (order-independent)
         exploits: List[Tuple[NicheMetrics, float]] = []
         explores: List[Tuple[NicheMetrics, float]] = []
         pauses: List[Tuple[NicheMetrics, float]] = []
@@ -495,6 +767,13 @@ class StrategyAgent:
             else:
                 pauses.append((niche, score))
 
+        # Each bucket in score order (scan order = priority for funded ones;
+        # persisted assessments keep the descending-score order for PAUSE
+        # too). The whole bucket is funded, so there is no top-K to select.
+        exploits.sort(key=itemgetter(1), reverse=True)
+        explores.sort(key=itemgetter(1), reverse=True)
+        pauses.sort(key=itemgetter(1), reverse=True)
+
         # Maybe consult LLM for ambiguous cases
         llm_consulted = False
         llm_override_reason = None
@@ -504,6 +783,10 @@ class StrategyAgent:
             if llm_result:
                 exploits, explores, llm_override_reason = llm_result
                 llm_consulted = True
+                # Moved niches were appended: restore score order (near-sorted
+                # runs, so TimSort is ~linear here)
+                exploits.sort(key=itemgetter(1), reverse=True)
+                explores.sort(key=itemgetter(1), reverse=True)
 
         # Calculate budget allocation
         budget_exploit = int(budget * self.EXPLOIT_RATIO)
@@ -545,7 +828,7 @@ class StrategyAgent:
 
         return StrategyDecision(
             cycle_id=cycle_id,
-            decided_at=datetime.utcnow(),
+            decided_at=now,
             budget_total=budget,
             budget_exploit=budget_exploit,
             budget_explore=budget_explore,
@@ -557,7 +840,109 @@ class StrategyAgent:
             llm_metrics=self._last_llm_metrics,
         )
 
-    def _score_niche(self, niche: NicheMetrics) -> float:
+    def _sample_density(self, niches: List[NicheMetrics]) -> np.ndarray:
+        """
+        Draw one Thompson sample of each niche's opportunity density.
+
+        Posterior Beta(1 + opportunities, 1 + scanned - opportunities):
+        under-observed niches get wide posteriors and are explored
+        naturally, mature niches converge on their measured density.
+        """
+        n = len(niches)
+        opps = np.fromiter((niche.total_opportunities for niche in niches), dtype=np.float64, count=n)
+        scanned = np.fromiter((niche.total_asins_scanned for niche in niches), dtype=np.float64, count=n)
+        misses = np.maximum(scanned - opps, 0.0)
+        return self._rng.beta(1.0 + opps, 1.0 + misses)
+
+    def _score_niches_vectorized(
+        self,
+        niches: List[NicheMetrics],
+        density_samples: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Score all niches at once (same formula as _score_niche).
+
+        Packs the inputs into one array per metric (structure of arrays)
+        and evaluates the composite with NumPy, so the per-niche cost is
+        a handful of C-level vector ops instead of Python branching.
+
+        Args:
+            niches: Niches to score
+            density_samples: Thompson samples replacing density (optional)
+
+        Returns:
+            Array of scores between 0 and 1, aligned with niches
+        """
+        n = len(niches)
+        vpt = np.fromiter((x.value_per_1k_tokens for x in niches), dtype=np.float64, count=n)
+        days = np.fromiter((x.days_since_scan for x in niches), dtype=np.int64, count=n)
+        events = np.fromiter((x.recent_critical_events for x in niches), dtype=np.int64, count=n)
+        runs = np.fromiter((x.total_runs for x in niches), dtype=np.int64, count=n)
+
+        if HAS_NUMBA and n >= self.NUMBA_MIN_NICHES:
+            return self._score_niches_kernel(vpt, days, events, runs, niches, density_samples)
+
+        if density_samples is None:
+            density = np.fromiter((x.density for x in niches), dtype=np.float64, count=n)
+            new_bonus, young_bonus = self._COLD_BONUS
+            cold_start_bonus = np.where(
+                runs == 0, new_bonus, np.where(runs < self.MIN_RUNS_BEFORE_PAUSE, young_bonus, 0.0)
+            )
+        else:
+            density = density_samples
+            cold_start_bonus = 0.0
+
+        value_score = np.minimum(1.0, vpt / 100)
+        density_score = np.minimum(1.0, density / self.DENSITY_GOOD)
+        freshness_score = self._FRESHNESS_ARRAY[np.clip(days, 0, self.STALE_DAYS)]
+        has_events = events > 0
+        event_score = has_events.astype(np.float64)
+
+        base_score = (
+            value_score * 0.40 +
+            density_score * 0.30 +
+            freshness_score * 0.20 +
+            event_score * 0.10
+        )
+        final_score = np.minimum(1.0, base_score + cold_start_bonus)
+
+        # Rotation penalty unless critical events, then event boost
+        rotated = (days < self.RECENTLY_SCANNED_DAYS) & ~has_events
+        final_score = np.where(rotated, final_score * self.ROTATION_PENALTY, final_score)
+        final_score = np.where(
+            has_events, np.minimum(1.0, final_score * self.EVENT_BOOST_MULTIPLIER), final_score
+        )
+
+        if rotated.any():
+            logger.debug(f"Rotation penalty applied to {int(rotated.sum())} recently scanned niches")
+
+        return final_score
+
+    def _score_niches_kernel(
+        self,
+        vpt: np.ndarray,
+        days: np.ndarray,
+        events: np.ndarray,
+        runs: np.ndarray,
+        niches: List[NicheMetrics],
+        density_samples: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """Score packed niche arrays with the fused _score_kernel loop."""
+        if density_samples is None:
+            density = np.fromiter((x.density for x in niches), dtype=np.float64, count=len(niches))
+            cold_bonus = self._COLD_BONUS_ARRAY
+        else:
+            density = np.asarray(density_samples, dtype=np.float64)
+            cold_bonus = self._NO_COLD_BONUS_ARRAY
+
+        return _score_kernel(
+            vpt, density, days, events, runs, self._FRESHNESS_ARRAY, cold_bonus,
+            float(self.DENSITY_GOOD), self.STALE_DAYS, self.MIN_RUNS_BEFORE_PAUSE,
+            self.RECENTLY_SCANNED_DAYS, float(self.ROTATION_PENALTY),
+            float(self.EVENT_BOOST_MULTIPLIER),
+        )
+
+    def _score_niche(self, niche: NicheMetrics, density_sample: Optional[float] = None) -> float:
         """
         Compute composite score for a niche with rotation awareness.
 
@@ -572,39 +957,46 @@ class StrategyAgent:
           (ROTATION_PENALTY multiplier) UNLESS they have critical events.
         - This ensures categories naturally rotate day-to-day.
 
+        Thompson sampling (density_sample given):
+        - The sampled density replaces the point estimate and the cold
+          start bonus (posterior width already rewards new niches).
+
         Returns:
             Score between 0 and 1
         """
+        # Bind class constants once (LOAD_FAST instead of attribute lookups)
+        density_good = self.DENSITY_GOOD
+        stale_days = self.STALE_DAYS
+        min_runs = self.MIN_RUNS_BEFORE_PAUSE
+        rotation_penalty = self.ROTATION_PENALTY
+        boost = self.EVENT_BOOST_MULTIPLIER
+        events = niche.recent_critical_events
+
         # Value per token (normalize to 0-1, assuming 100 EUR/1k tokens is excellent)
         value_score = min(1.0, niche.value_per_1k_tokens / 100)
 
         # Density (5% or higher is excellent)
-        density_score = min(1.0, niche.density / self.DENSITY_GOOD)
+        density = niche.density if density_sample is None else density_sample
+        density_score = min(1.0, density / density_good)
 
-        # Freshness — granular curve instead of 3 buckets
+        # Freshness — granular curve, precomputed per day
         days = niche.days_since_scan
-        if days >= self.STALE_DAYS:
-            freshness_score = 1.0   # Urgent refresh needed
-        elif days >= 7:
-            # Linear interpolation 7d→14d: 0.5→1.0
-            freshness_score = 0.5 + 0.5 * ((days - 7) / (self.STALE_DAYS - 7))
-        elif days >= self.RECENTLY_SCANNED_DAYS:
-            # Linear interpolation 2d→7d: 0.2→0.5
-            freshness_score = 0.2 + 0.3 * ((days - self.RECENTLY_SCANNED_DAYS) / (7 - self.RECENTLY_SCANNED_DAYS))
-        else:
-            freshness_score = 0.1   # Just scanned, lowest priority
+        freshness_score = self._FRESHNESS_LOOKUP[min(max(days, 0), stale_days)]
 
         # Event boost
-        if niche.recent_critical_events > 0:
+        if events > 0:
             event_score = 1.0
         else:
             event_score = 0.0
 
         # Cold start bonus (new niches get exploration boost)
-        if niche.total_runs == 0:
-            cold_start_bonus = 0.3
-        elif niche.total_runs < self.MIN_RUNS_BEFORE_PAUSE:
-            cold_start_bonus = 0.15
+        runs = niche.total_runs
+        if density_sample is not None:
+            cold_start_bonus = 0.0
+        elif runs == 0:
+            cold_start_bonus = self._COLD_BONUS[0]
+        elif runs < min_runs:
+            cold_start_bonus = self._COLD_BONUS[1]
         else:
             cold_start_bonus = 0.0
 
@@ -621,16 +1013,17 @@ class StrategyAgent:
 
         # Rotation penalty: recently scanned niches get deprioritized
         # UNLESS they have critical events (events override rotation)
-        if days < self.RECENTLY_SCANNED_DAYS and niche.recent_critical_events == 0:
-            final_score *= self.ROTATION_PENALTY
-            logger.debug(
-                f"Rotation penalty for {niche.name}: scanned {days}d ago, "
-                f"score {final_score/self.ROTATION_PENALTY:.3f} → {final_score:.3f}"
-            )
+        if days < self.RECENTLY_SCANNED_DAYS and events == 0:
+            final_score *= rotation_penalty
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"Rotation penalty for {niche.name}: scanned {days}d ago, "
+                    f"score {final_score/rotation_penalty:.3f} → {final_score:.3f}"
+                )
 
         # Apply event boost multiplier if critical events (overrides rotation)
-        if niche.recent_critical_events > 0:
-            final_score = min(1.0, final_score * self.EVENT_BOOST_MULTIPLIER)
+        if events > 0:
+            final_score = min(1.0, final_score * boost)
 
         return final_score
 
@@ -643,6 +1036,10 @@ class StrategyAgent:
         """
         Allocate tokens proportionally to niche scores.
 
+        Uses largest-remainder (Hamilton) rounding so the proportional
+        shares sum exactly to the budget, then applies the per-niche
+        minimums (50 tokens, COLD_START_TOKENS for new niches).
+
         Args:
             niches: List of (niche, score) tuples
             budget: Total tokens to allocate
@@ -654,55 +1051,65 @@ class StrategyAgent:
         if not niches or budget <= 0:
             return []
 
-        assessments = []
-        total_score = sum(score for _, score in niches)
-
+        n = len(niches)
+        scores = np.fromiter((score for _, score in niches), dtype=np.float64, count=n)
+        total_score = scores.sum()
         if total_score == 0:
             # Equal allocation if all scores are 0
-            per_niche = budget // len(niches)
-            for niche, score in niches:
-                tokens = per_niche
-                max_asins = self._tokens_to_asins(tokens)
-                assessments.append(NicheAssessment(
-                    niche_id=niche.niche_id,
-                    name=niche.name,
-                    domain=niche.domain,
-                    status=status,
-                    score=score,
-                    tokens_allocated=tokens,
-                    max_asins=max_asins,
-                    justification=self._justify(niche, score, status),
-                    confidence=1.0,
-                ))
-            return assessments
-
-        # Proportional allocation with value guard
-        for niche, score in niches:
-            proportion = score / total_score
-            tokens = int(budget * proportion)
-
-            # Minimum allocation for cold start
-            if niche.total_runs < self.MIN_RUNS_BEFORE_PAUSE:
-                tokens = max(tokens, self.COLD_START_TOKENS)
-
-            # Ensure at least some allocation if included
-            tokens = max(tokens, 50)  # Minimum 50 tokens
-
-            max_asins = self._tokens_to_asins(tokens)
-
-            # VALUE GUARD: Reduce allocation for low-value niches
-            # (only applies to mature niches with enough data to judge)
-            value_guard_applied = False
-            if (niche.total_runs >= self.MIN_RUNS_BEFORE_PAUSE
-                    and niche.value_per_1k_tokens < self.MIN_VALUE_PER_1K
-                    and niche.value_per_1k_tokens > 0):
-                max_asins = min(max_asins, self.LOW_VALUE_ASIN_CAP)
-                tokens = min(tokens, self._asins_to_tokens(max_asins))
-                value_guard_applied = True
+            scores = np.ones(n)
+            total_score = float(n)
+
+        # Largest remainder: floor every share, hand the leftover tokens
+        # to the largest fractional parts (stable: ties go to higher rank)
+        raw = budget * scores / total_score
+        floors = np.floor(raw).astype(np.int64)
+        remainder = budget - int(floors.sum())
+        if remainder > 0:
+            top = np.argsort(floors - raw, kind="stable")[:remainder]
+            floors[top] += 1
+
+        # Minimum allocation: cold start niches get COLD_START_TOKENS,
+        # everyone else at least 50 tokens
+        runs = np.fromiter((niche.total_runs for niche, _ in niches), dtype=np.int64, count=n)
+        mature = runs >= self.MIN_RUNS_BEFORE_PAUSE
+        minimums = np.where(mature, 50, max(self.COLD_START_TOKENS, 50))
+        tokens_arr = np.maximum(floors, minimums)
+
+        # All ASIN caps in one vectorized pass
+        max_asins_arr = self._tokens_to_asins_batch(tokens_arr)
+
+        # VALUE GUARD: Reduce allocation for low-value niches
+        # (only applies to mature niches with enough data to judge)
+        vpt = np.fromiter((niche.value_per_1k_tokens for niche, _ in niches), dtype=np.float64, count=n)
+        guarded = mature & (vpt < self.MIN_VALUE_PER_1K) & (vpt > 0)
+        if guarded.any():
+            max_asins_arr = np.where(guarded, np.minimum(max_asins_arr, self.LOW_VALUE_ASIN_CAP), max_asins_arr)
+            tokens_arr = np.where(guarded, np.minimum(tokens_arr, self._asins_to_tokens(max_asins_arr)), tokens_arr)
+
+        # Justification flags in one pass (only the relevant bucket's)
+        n_false = [False] * n
+        if status == NicheStatus.EXPLOIT:
+            dens = np.fromiter((niche.density for niche, _ in niches), dtype=np.float64, count=n)
+            dense = (dens >= self.DENSITY_GOOD).tolist()
+            valuable = (vpt > 50).tolist()
+            stale = n_false
+        else:
+            days = np.fromiter((niche.days_since_scan for niche, _ in niches), dtype=np.int64, count=n)
+            dense = valuable = n_false
+            stale = (days >= self.STALE_DAYS).tolist()
 
-            justification = self._justify(niche, score, status)
+        justify = self._justify
+        min_value = self.MIN_VALUE_PER_1K
+        assessments = []
+        for (niche, score), tokens, max_asins, value_guard_applied, is_dense, is_valuable, is_stale in zip(
+            niches, tokens_arr.tolist(), max_asins_arr.tolist(), guarded.tolist(), dense, valuable, stale
+        ):
+            justification = justify(niche, score, status, is_dense, is_valuable, is_stale)
             if value_guard_applied:
-                justification += f"; VALUE GUARD: capped to {max_asins} ASINs (value {niche.value_per_1k_tokens:.1f} EUR/1k < {self.MIN_VALUE_PER_1K})"
+                justification += (
+                    f"; VALUE GUARD: capped to {max_asins} ASINs "
+                    f"(value {niche.value_per_1k_tokens:.1f} EUR/1k < {min_value})"
+                )
 
             assessments.append(NicheAssessment(
                 niche_id=niche.niche_id,
@@ -728,33 +1135,59 @@ class StrategyAgent:
             return 0
         return max(1, (tokens - 5) // 2)
 
+    @staticmethod
+    def _tokens_to_asins_batch(tokens: np.ndarray) -> np.ndarray:
+        """Vectorized _tokens_to_asins over an array of token allocations."""
+        tokens = tokens.astype(np.int64, copy=False)
+        return np.where(tokens < 10, 0, np.maximum(1, (tokens - 5) // 2))
+
     def _asins_to_tokens(self, asins: int) -> int:
         """Convert ASIN count to estimated token cost."""
         return 5 + (asins * 2)
 
-    def _justify(self, niche: NicheMetrics, score: float, status: NicheStatus) -> str:
-        """Generate human-readable justification."""
-        parts = []
+    def _justify(
+        self,
+        niche: NicheMetrics,
+        score: float,
+        status: NicheStatus,
+        dense: Optional[bool] = None,
+        valuable: Optional[bool] = None,
+        stale: Optional[bool] = None,
+    ) -> str:
+        """
+        Generate human-readable justification.
 
-        if status == NicheStatus.EXPLOIT:
-            parts.append(f"High score ({score:.2f})")
-            if niche.density >= self.DENSITY_GOOD:
-                parts.append(f"excellent density ({niche.density:.1%})")
-            if niche.value_per_1k_tokens > 50:
-                parts.append(f"good value ({niche.value_per_1k_tokens:.0f} EUR/1k tokens)")
+        dense / valuable / stale may be passed precomputed (vectorized in
+        _allocate_tokens); fragments are only formatted when they appear.
+        """
+        events = niche.recent_critical_events
+        events_part = f"{events} critical events" if events > 0 else None
 
+        if status == NicheStatus.EXPLOIT:
+            if dense is None:
+                dense = niche.density >= self.DENSITY_GOOD
+            if valuable is None:
+                valuable = niche.value_per_1k_tokens > 50
+            parts = (
+                f"High score ({score:.2f})",
+                f"excellent density ({niche.density:.1%})" if dense else None,
+                f"good value ({niche.value_per_1k_tokens:.0f} EUR/1k tokens)" if valuable else None,
+                events_part,
+            )
         elif status == NicheStatus.EXPLORE:
-            if niche.total_runs < self.MIN_RUNS_BEFORE_PAUSE:
-                parts.append(f"cold start ({niche.total_runs} runs)")
-            else:
-                parts.append(f"testing hypothesis (score {score:.2f})")
-            if niche.days_since_scan >= self.STALE_DAYS:
-                parts.append("needs refresh")
-
-        if niche.recent_critical_events > 0:
-            parts.append(f"{niche.recent_critical_events} critical events")
+            if stale is None:
+                stale = niche.days_since_scan >= self.STALE_DAYS
+            parts = (
+                f"cold start ({niche.total_runs} runs)"
+                if niche.total_runs < self.MIN_RUNS_BEFORE_PAUSE
+                else f"testing hypothesis (score {score:.2f})",
+                "needs refresh" if stale else None,
+                events_part,
+            )
+        else:
+            parts = (events_part,)
 
-        return "; ".join(parts) if parts else f"score {score:.2f}"
+        return "; ".join(p for p in parts if p) or f"score {score:.2f}"
 
     def _justify_pause(self, niche: NicheMetrics, score: float) -> str:
         """Generate justification for PAUSE status."""
@@ -777,22 +1210,21 @@ class StrategyAgent:
         """
         Check if there are ambiguous cases worth LLM consultation.
 
-        Ambiguous = two niches with very close scores near threshold.
+        Ambiguous = two niches with very close scores near threshold
+        (within 0.05 of each other, one of them within 0.1 of EXPLOIT).
+
+        Sorted sweep: such a pair exists iff an adjacent pair of sorted
+        scores qualifies, and both members of any qualifying pair lie
+        within 0.15 of the threshold — O(N log N) instead of O(N²).
         """
-        all_scored = exploits + explores
-        if len(all_scored) < 2:
-            return False
-
-        # Check for score ties near threshold
-        for i, (n1, s1) in enumerate(all_scored):
-            for n2, s2 in all_scored[i+1:]:
-                score_diff = abs(s1 - s2)
-                near_threshold = (
-                    abs(s1 - self.EXPLOIT_THRESHOLD) < 0.1 or
-                    abs(s2 - self.EXPLOIT_THRESHOLD) < 0.1
-                )
-                if score_diff < 0.05 and near_threshold:
-                    return True
+        threshold = self.EXPLOIT_THRESHOLD
+        band = sorted(
+            s for _, s in chain(exploits, explores) if abs(s - threshold) < 0.15
+        )
+
+        for s1, s2 in zip(band, band[1:]):
+            if s2 - s1 < 0.05 and (abs(s1 - threshold) < 0.1 or abs(s2 - threshold) < 0.1):
+                return True
 
         return False
 
@@ -825,14 +1257,23 @@ class StrategyAgent:
             logger.debug("LLM consultation skipped: no API key configured")
             return None
 
-        # Check cache first
-        all_niches = [n for n, _ in exploits + explores]
-        cache_key = _llm_cache._compute_cache_key(
-            all_niches, budget, (self.EXPLOIT_THRESHOLD, self.EXPLORE_THRESHOLD)
-        )
-        cached = _llm_cache.get(cache_key, self.llm_config.cache_ttl_hours)
-        if cached:
-            logger.info(f"LLM cache hit for key {cache_key}")
+        # Check in-process memo first (no Redis/disk round-trip)
+        memo_key = self._llm_memo_key(exploits, explores, budget)
+        cached = self._recall_llm_response(memo_key)
+        if cached is not None:
+            logger.info("LLM memo hit for current score signature")
+        else:
+            # Then the shared response cache
+            all_niches = [n for n, _ in chain(exploits, explores)]
+            cache_key = _llm_cache._compute_cache_key(
+                all_niches, budget, (self.EXPLOIT_THRESHOLD, self.EXPLORE_THRESHOLD)
+            )
+            cached = _llm_cache.get(cache_key, self.llm_config.cache_ttl_hours)
+            if cached:
+                logger.info(f"LLM cache hit for key {cache_key}")
+                self._remember_llm_response(memo_key, cached)
+
+        if cached is not None:
             self._last_llm_metrics = LLMMetrics(
                 provider=self.llm_config.provider,
                 model=self.llm_config.model,
@@ -844,7 +1285,7 @@ class StrategyAgent:
             return None
 
         try:
-            return self._call_llm_for_decision(exploits, explores, budget, cache_key)
+            return self._call_llm_for_decision(exploits, explores, budget, cache_key, memo_key)
         except Exception as e:
             logger.warning(f"LLM consultation failed: {e}")
             return None
@@ -855,6 +1296,7 @@ class StrategyAgent:
         explores: List[Tuple[NicheMetrics, float]],
         budget: int,
         cache_key: str,
+        memo_key: Optional[bytes] = None,
     ) -> Optional[Tuple[List, List, str]]:
         """
         Call LLM API to resolve ambiguous allocation decisions.
@@ -868,23 +1310,24 @@ class StrategyAgent:
         Returns:
             Tuple of (new_exploits, new_explores, override_reason) or None
         """
-        import time
-        try:
-            from openai import OpenAI
-        except ImportError:
-            logger.warning("OpenAI package not installed. Run: pip install openai")
+        client = self._get_openai_client()
+        if client is None:
             return None
 
         # Build context for LLM
-        all_niches = exploits + explores
+        # (bucket label travels with each entry: no membership re-scan)
         niche_data = []
-        for niche, score in all_niches:
+        labelled = chain(
+            zip(exploits, repeat("EXPLOIT")),
+            zip(explores, repeat("EXPLORE")),
+        )
+        for (niche, score), current_status in labelled:
             niche_data.append({
                 "id": niche.niche_id,
                 "name": niche.name,
                 "domain": niche.domain,
                 "score": round(score, 3),
-                "current_status": "EXPLOIT" if (niche, score) in exploits else "EXPLORE",
+                "current_status": current_status,
                 "metrics": {
                     "runs": niche.total_runs,
                     "density": f"{niche.density:.1%}",
@@ -935,8 +1378,6 @@ Si le classement déterministe est correct:
 {{"should_override": false, "recommended_order": [], "rationale": [], "confidence": 1.0, "disagreements": []}}
 """
 
-        client = OpenAI(api_key=self.llm_config.api_key)
-
         logger.info(f"Consulting LLM ({self.llm_config.model}) for ambiguous allocation...")
         start_time = time.time()
 
@@ -975,6 +1416,8 @@ Si le classement déterministe est correct:
 
         # Cache the response (use configured TTL)
         _llm_cache.set(cache_key, result, ttl_hours=self.llm_config.cache_ttl_hours)
+        if memo_key is not None:
+            self._remember_llm_response(memo_key, result)
 
         # Track metrics
         changed_decision = result.get("should_override", False)
@@ -1002,6 +1445,64 @@ Si le classement déterministe est correct:
         # Apply with veto policy
         return self._apply_llm_response(result, exploits, explores, budget)
 
+    @staticmethod
+    def _llm_memo_key(
+        exploits: List[Tuple[NicheMetrics, float]],
+        explores: List[Tuple[NicheMetrics, float]],
+        budget: int,
+    ) -> bytes:
+        """Digest of (niche_id, score rounded to 0.01) pairs + budget."""
+        signature = sorted((n.niche_id, round(s, 2)) for n, s in chain(exploits, explores))
+        return hashlib.blake2b(
+            f"{signature}|{budget}".encode(), digest_size=16
+        ).digest()
+
+    def _recall_llm_response(self, memo_key: bytes) -> Optional[Dict]:
+        """Return the memoized LLM response if still fresh."""
+        entry = self._llm_memo.get(memo_key)
+        if entry is None:
+            return None
+        stored_at, response = entry
+        if time.time() - stored_at > self.LLM_MEMO_TTL_SECONDS:
+            del self._llm_memo[memo_key]
+            return None
+        return response
+
+    def _remember_llm_response(self, memo_key: bytes, response: Dict) -> None:
+        """Memoize an LLM response (oldest entry evicted when full)."""
+        self._llm_memo.pop(memo_key, None)
+        if len(self._llm_memo) >= self.LLM_MEMO_MAX_ENTRIES:
+            del self._llm_memo[next(iter(self._llm_memo))]
+        self._llm_memo[memo_key] = (time.time(), response)
+
+    def _get_openai_client(self):
+        """
+        Get the OpenAI client, importing and constructing it once.
+
+        Clients are shared process-wide per (api_key, timeout, retries),
+        so every agent (one per SmartScheduler) reuses the same HTTP
+        connection pool and TLS session.
+        """
+        if self._openai_client is None:
+            config = self.llm_config
+            client_key = (config.api_key, config.timeout_seconds, config.max_retries)
+            with _openai_clients_lock:
+                client = _openai_clients.get(client_key)
+                if client is None:
+                    try:
+                        from openai import OpenAI
+                    except ImportError:
+                        logger.warning("OpenAI package not installed. Run: pip install openai")
+                        return None
+                    client = OpenAI(
+                        api_key=config.api_key,
+                        timeout=config.timeout_seconds,
+                        max_retries=config.max_retries,
+                    )
+                    _openai_clients[client_key] = client
+            self._openai_client = client
+        return self._openai_client
+
     def _apply_llm_response(
         self,
         result: Dict,
@@ -1017,8 +1518,9 @@ Si le classement déterministe est correct:
         - Cannot change budget allocation ratios
         - Can only reorder/reclassify between EXPLOIT and EXPLORE
         """
-        new_exploits = list(exploits)
-        new_explores = list(explores)
+        # niche_id -> (niche, score) side indices: O(1) lookup and move
+        exploit_idx = {entry[0].niche_id: entry for entry in exploits}
+        explore_idx = {entry[0].niche_id: entry for entry in explores}
         vetoed_count = 0
 
         for change in result.get("rationale", []):
@@ -1030,17 +1532,11 @@ Si le classement déterministe est correct:
                 continue
 
             # Find the niche
-            found_niche = None
-            found_score = 0
-            for niche, score in exploits + explores:
-                if niche.niche_id == niche_id:
-                    found_niche = niche
-                    found_score = score
-                    break
-
-            if not found_niche:
+            entry = exploit_idx.get(niche_id) or explore_idx.get(niche_id)
+            if entry is None:
                 logger.warning(f"LLM referenced unknown niche_id: {niche_id}")
                 continue
+            found_niche, found_score = entry
 
             # VETO CHECK: Cannot promote to EXPLOIT if score too low
             if new_status == "EXPLOIT" and found_score < self.EXPLORE_THRESHOLD:
@@ -1049,15 +1545,16 @@ Si le classement déterministe est correct:
                 continue
 
             # Apply change
-            if new_status == "EXPLOIT" and (found_niche, found_score) in new_explores:
-                new_explores.remove((found_niche, found_score))
-                new_exploits.append((found_niche, found_score))
+            if new_status == "EXPLOIT" and niche_id in explore_idx:
+                exploit_idx[niche_id] = explore_idx.pop(niche_id)
                 logger.info(f"LLM override: {found_niche.name} EXPLORE -> EXPLOIT ({reason_codes})")
-            elif new_status == "EXPLORE" and (found_niche, found_score) in new_exploits:
-                new_exploits.remove((found_niche, found_score))
-                new_explores.append((found_niche, found_score))
+            elif new_status == "EXPLORE" and niche_id in exploit_idx:
+                explore_idx[niche_id] = exploit_idx.pop(niche_id)
                 logger.info(f"LLM override: {found_niche.name} EXPLOIT -> EXPLORE ({reason_codes})")
 
+        new_exploits = list(exploit_idx.values())
+        new_explores = list(explore_idx.values())
+
         if vetoed_count > 0:
             logger.warning(f"Vetoed {vetoed_count} LLM recommendations")
 
@@ -1090,27 +1587,41 @@ Si le classement déterministe est correct:
         if budget < 100:
             notes.append(f"LOW BUDGET: Only {budget} tokens available. Limited scanning possible.")
 
+        # Single pass: stale count + single-run explores (hypotheses)
+        stale_days = self.STALE_DAYS
+        stale_count = 0
+        for niche, _ in exploits:
+            if niche.days_since_scan >= stale_days:
+                stale_count += 1
+        hypotheses = []
+        for niche, _ in explores:
+            if niche.days_since_scan >= stale_days:
+                stale_count += 1
+            if niche.total_runs == 1:
+                hypotheses.append(niche)
+
         # Risk: Stale data
-        stale_count = sum(1 for n, _ in exploits + explores if n.days_since_scan >= self.STALE_DAYS)
         if stale_count > 0:
-            notes.append(f"STALE DATA: {stale_count} niches haven't been scanned in {self.STALE_DAYS}+ days.")
+            notes.append(f"STALE DATA: {stale_count} niches haven't been scanned in {stale_days}+ days.")
 
         # Risk: Over-concentration
         if len(exploits) == 1 and not explores:
             notes.append("CONCENTRATION RISK: All tokens allocated to single niche.")
 
         # Hypothesis to invalidate
-        for niche, score in explores:
-            if niche.total_runs == 1:
-                notes.append(f"HYPOTHESIS: {niche.name} ({niche.domain}) needs validation (1 run)")
+        for niche in hypotheses:
+            notes.append(f"HYPOTHESIS: {niche.name} ({niche.domain}) needs validation (1 run)")
 
         return notes
 
-    def _generate_cycle_id(self) -> str:
+    def _generate_cycle_id(self, now: Optional[datetime] = None) -> str:
         """Generate unique cycle ID."""
-        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-        hash_input = f"{timestamp}_{self._cycle_counter}"
-        short_hash = hashlib.md5(hash_input.encode()).hexdigest()[:6]
+        timestamp = (now or datetime.utcnow()).strftime("%Y%m%d_%H%M%S")
+        hash_input = f"{timestamp}_{self._cycle_counter}".encode()
+        if HAS_XXHASH:
+            short_hash = xxhash.xxh3_64_hexdigest(hash_input)[:6]
+        else:
+            short_hash = hashlib.blake2b(hash_input, digest_size=3).hexdigest()
         return f"cycle_{timestamp}_{short_hash}"
 
 
@@ -1118,11 +1629,75 @@ Si le classement déterministe est correct:
 # HELPER FUNCTIONS
 # =============================================================================
 
+def _niche_score_sql(agent_cls: type = StrategyAgent) -> str:
+    """
+    SQL twin of StrategyAgent._score_niche over the loader's CTEs.
+
+    Built from the agent's class constants so thresholds stay in one
+    place; the freshness curve is inlined as the precomputed per-day
+    array. All arithmetic runs in float8, in the same order as Python.
+
+    Takes one query parameter, the cycle's reference time as naive UTC
+    (the now given to NicheMetrics), so days_since_scan matches Python
+    whatever the session TimeZone.
+    """
+    freshness = ", ".join(repr(v) for v in agent_cls._FRESHNESS_LOOKUP)
+    cold = agent_cls._COLD_BONUS
+    return f"""
+    CROSS JOIN LATERAL (
+        SELECT
+            COALESCE(FLOOR(EXTRACT(EPOCH FROM (
+                (%s::timestamp AT TIME ZONE 'UTC') - cr.last_scanned_at
+            )) / 86400)::int, 999) AS days,
+            COALESCE(re.critical_events, 0) AS events,
+            COALESCE(pa.total_runs, 0) AS runs
+    ) d
+    CROSS JOIN LATERAL (
+        SELECT LEAST(1.0::float8,
+            LEAST(1.0::float8, CASE WHEN pa.total_tokens_used > 0
+                THEN pa.total_value_detected::float8 / pa.total_tokens_used * 1000 ELSE 0 END / 100) * 0.40::float8
+            + LEAST(1.0::float8, CASE WHEN pa.total_asins_scanned > 0
+                THEN pa.total_opportunities::float8 / pa.total_asins_scanned ELSE 0 END
+                / {agent_cls.DENSITY_GOOD!r}::float8) * 0.30::float8
+            + (ARRAY[{freshness}]::float8[])[LEAST(GREATEST(d.days, 0), {agent_cls.STALE_DAYS}) + 1] * 0.20::float8
+            + CASE WHEN d.events > 0 THEN 0.10::float8 ELSE 0.0::float8 END
+            + CASE WHEN d.runs = 0 THEN {cold[0]!r}::float8
+                   WHEN d.runs < {agent_cls.MIN_RUNS_BEFORE_PAUSE} THEN {cold[1]!r}::float8
+                   ELSE 0.0::float8 END
+        ) AS capped
+    ) b
+    CROSS JOIN LATERAL (
+        SELECT CASE
+            WHEN d.events > 0 THEN LEAST(1.0::float8, b.capped * {agent_cls.EVENT_BOOST_MULTIPLIER!r}::float8)
+            WHEN d.days < {agent_cls.RECENTLY_SCANNED_DAYS} THEN b.capped * {agent_cls.ROTATION_PENALTY!r}::float8
+            ELSE b.capped
+        END AS score
+    ) sc"""
+
+
 def load_niche_metrics_from_db(conn) -> List[NicheMetrics]:
     """
     Load niche metrics from database.
 
+    Materialized wrapper around iter_niche_metrics_from_db, for callers
+    that close the connection before deciding.
+    """
+    return list(iter_niche_metrics_from_db(conn))
+
+
+def iter_niche_metrics_from_db(conn, itersize: int = 1000) -> Iterator[NicheMetrics]:
+    """
+    Stream niche metrics from database.
+
     Joins category_registry with category_performance and economic_events.
+    The composite strategy score is computed in the same query (see
+    _niche_score_sql) and rows come back best-first, so decide() skips
+    its Python scoring pass.
+
+    Rows are read through a named (server-side) cursor in batches of
+    itersize, so the full result set is never held twice in memory.
+    Named cursors need a transaction: on an autocommit connection a
+    regular client-side cursor is used instead.
     """
     query = """
     WITH perf_agg AS (
@@ -1139,13 +1714,18 @@ def load_niche_metrics_from_db(conn) -> List[NicheMetrics]:
         GROUP BY category_id
     ),
     recent_events AS (
+        -- Filter before the join (idx_economic_events_urgent_recent),
+        -- then probe asins via idx_asins_asin_category (migration 015)
         SELECT
             a.category_id,
             COUNT(*) as critical_events
-        FROM economic_events e
-        JOIN asins a ON e.asin = a.asin
-        WHERE e.detected_at > NOW() - INTERVAL '7 days'
-        AND e.urgency IN ('CRITICAL', 'HIGH')
+        FROM (
+            SELECT asin
+            FROM economic_events
+            WHERE detected_at > NOW() - INTERVAL '7 days'
+            AND urgency IN ('CRITICAL', 'HIGH')
+        ) e
+        JOIN asins a USING (asin)
         GROUP BY a.category_id
     )
     SELECT
@@ -1162,63 +1742,111 @@ def load_niche_metrics_from_db(conn) -> List[NicheMetrics]:
         COALESCE(pa.total_tokens_used, 0) as total_tokens_used,
         COALESCE(pa.total_value_detected, 0) as total_value_detected,
         COALESCE(pa.avg_score, 0) as avg_score,
-        COALESCE(re.critical_events, 0) as recent_critical_events
+        COALESCE(re.critical_events, 0) as recent_critical_events,
+        sc.score
     FROM category_registry cr
     LEFT JOIN perf_agg pa ON cr.category_id = pa.category_id
     LEFT JOIN recent_events re ON cr.category_id = re.category_id
+    """ + _niche_score_sql() + """
     WHERE cr.is_active = true
-    ORDER BY cr.priority ASC, cr.last_scanned_at ASC NULLS FIRST;
+    ORDER BY sc.score DESC, cr.priority ASC, cr.last_scanned_at ASC NULLS FIRST;
     """
 
-    with conn.cursor() as cur:
-        cur.execute(query)
-        rows = cur.fetchall()
-
-    metrics = []
-    for row in rows:
-        metrics.append(NicheMetrics(
-            niche_id=row[0],
-            name=row[1],
-            domain=row[2],
-            is_active=row[3],
-            priority=row[4],
-            last_scanned_at=row[5],
-            total_runs=row[6],
-            total_asins_scanned=row[7],
-            total_opportunities=row[8],
-            high_value_opps=row[9],
-            total_tokens_used=row[10],
-            total_value_detected=float(row[11]) if row[11] else 0.0,
-            avg_score=float(row[12]) if row[12] else 0.0,
-            recent_critical_events=row[13],
-        ))
-
-    return metrics
+    cursor_name = None if getattr(conn, "autocommit", False) else "niche_load"
+    with conn.cursor(name=cursor_name) as cur:
+        if cursor_name is not None:
+            cur.itersize = itersize
+        # One clock read for the whole batch, shared with the SQL score
+        now = datetime.utcnow()
+        cur.execute(query, (now,))
+
+        for row in cur:
+            yield _build_niche_metrics(row, now)
+
+
+def _build_niche_metrics(row: Tuple, now: datetime) -> NicheMetrics:
+    """Build NicheMetrics from a load_niche_metrics_from_db row."""
+    return NicheMetrics(
+        niche_id=row[0],
+        name=row[1],
+        domain=row[2],
+        is_active=row[3],
+        priority=row[4],
+        last_scanned_at=row[5],
+        total_runs=row[6],
+        total_asins_scanned=row[7],
+        total_opportunities=row[8],
+        high_value_opps=row[9],
+        total_tokens_used=row[10],
+        total_value_detected=float(row[11]) if row[11] else 0.0,
+        avg_score=float(row[12]) if row[12] else 0.0,
+        recent_critical_events=row[13],
+        precomputed_score=row[14],
+        now=now,
+    )
 
 
-def save_strategy_decision(conn, decision: StrategyDecision) -> None:
-    """Save strategy decision to database for audit."""
-    import json
+def _decision_row(decision: StrategyDecision) -> Tuple:
+    """Build the strategy_decisions row for a decision."""
+    if HAS_ORJSON:
+        # orjson serializes (slotted) dataclasses and enums natively
+        assessments_json = orjson.dumps(decision.assessments).decode()
+        risk_notes_json = orjson.dumps(decision.risk_notes).decode()
+    else:
+        assessments_json = json.dumps(
+            [{name: getattr(a, name) for name in _ASSESSMENT_FIELDS} for a in decision.assessments],
+            default=str,
+        )
+        risk_notes_json = json.dumps(decision.risk_notes)
+
+    return (
+        decision.cycle_id,
+        decision.decided_at,
+        decision.budget_total,
+        decision.budget_exploit,
+        decision.budget_explore,
+        decision.budget_reserve,
+        assessments_json,
+        risk_notes_json,
+        decision.llm_consulted,
+        decision.llm_override_reason,
+    )
 
-    query = """
+
+_INSERT_DECISIONS_SQL = """
     INSERT INTO strategy_decisions (
         cycle_id, decided_at, budget_total, budget_exploit, budget_explore, budget_reserve,
         assessments, risk_notes, llm_consulted, llm_override_reason
-    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+    ) VALUES %s
     ON CONFLICT (cycle_id) DO NOTHING;
+"""
+
+
+def save_strategy_decision(conn, decision: StrategyDecision) -> None:
+    """Save strategy decision to database for audit."""
+    save_strategy_decisions_bulk(conn, [decision])
+
+
+def save_strategy_decisions_bulk(
+    conn,
+    decisions: List[StrategyDecision],
+    page_size: int = 500,
+) -> None:
+    """
+    Save many strategy decisions (backfill/replay) in one round-trip per page.
+
+    Uses a multi-row INSERT via execute_values; one commit for the batch.
     """
+    if not decisions:
+        return
+
+    from psycopg2.extras import execute_values
 
     with conn.cursor() as cur:
-        cur.execute(query, (
-            decision.cycle_id,
-            decision.decided_at,
-            decision.budget_total,
-            decision.budget_exploit,
-            decision.budget_explore,
-            decision.budget_reserve,
-            json.dumps([a.__dict__ for a in decision.assessments], default=str),
-            json.dumps(decision.risk_notes),
-            decision.llm_consulted,
-            decision.llm_override_reason,
-        ))
+        execute_values(
+            cur,
+            _INSERT_DECISIONS_SQL,
+            [_decision_row(d) for d in decisions],
+            page_size=page_size,
+        )
     conn.commit()
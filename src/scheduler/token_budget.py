@@ -16,15 +16,82 @@ Allocation Strategy:
 """
 
 import os
+import time
+import calendar
+import atexit
 import logging
-from datetime import datetime
-from typing import Optional, Dict, Any
-from dataclasses import dataclass
+import threading
+import weakref
+from contextlib import contextmanager
+from functools import lru_cache
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any, Tuple, Sequence
+from dataclasses import dataclass, replace
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@lru_cache(maxsize=1)
+def _budget_settings() -> Dict[str, float]:
+    """
+    Parse budget settings from env once per process.
+
+    Deferred to the first TokenBudgetManager (not import time) so that
+    entry points calling load_dotenv() after importing still apply.
+    """
+    return {
+        "monthly_limit": int(os.getenv("KEEPA_MONTHLY_TOKEN_LIMIT", "900000")),
+        "tokens_per_minute": int(os.getenv("KEEPA_TOKENS_PER_MINUTE", "21")),
+        "discovery_pct": int(os.getenv("KEEPA_DISCOVERY_BUDGET_PCT", "20")),
+        "scanning_pct": int(os.getenv("KEEPA_SCANNING_BUDGET_PCT", "80")),
+        "tokens_per_asin": int(os.getenv("KEEPA_TOKENS_PER_ASIN", "2")),
+        "tokens_per_discovery": int(os.getenv("KEEPA_TOKENS_PER_DISCOVERY", "5")),
+        "status_ttl": float(os.getenv("BUDGET_STATUS_TTL", "5")),
+    }
+
+
+# Process-wide connection pool shared by every TokenBudgetManager
+# (created on first use; managers given an explicit conn never touch it)
+_POOL = None
+_POOL_LOCK = threading.Lock()
+
+
+def _get_pool():
+    """Get or create the shared psycopg2 connection pool."""
+    global _POOL
+    if _POOL is None:
+        with _POOL_LOCK:
+            if _POOL is None:
+                from psycopg2.pool import ThreadedConnectionPool
+                _POOL = ThreadedConnectionPool(
+                    minconn=1,
+                    maxconn=int(os.getenv("DATABASE_POOL_MAX", "10")),
+                    host=os.getenv("DATABASE_HOST", "localhost"),
+                    port=int(os.getenv("DATABASE_PORT", "5432")),
+                    dbname=os.getenv("DATABASE_NAME", "smartacus"),
+                    user=os.getenv("DATABASE_USER", "postgres"),
+                    password=os.getenv("DATABASE_PASSWORD", ""),
+                    sslmode=os.getenv("DATABASE_SSL_MODE", "prefer"),
+                )
+                logger.info("Token budget connection pool created")
+    return _POOL
+
+
+# Buffered managers on pooled connections, flushed at interpreter exit
+_LIVE_MANAGERS: "weakref.WeakSet[TokenBudgetManager]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_all_managers() -> None:
+    """Flush pending usage of every live manager before exit."""
+    for manager in list(_LIVE_MANAGERS):
+        try:
+            manager.flush()
+        except Exception as e:
+            logger.error(f"Token budget flush at exit failed: {e}")
+
+
+@dataclass(slots=True, frozen=True)
 class BudgetStatus:
     """Current budget status."""
     month: str
@@ -54,46 +121,310 @@ class TokenBudgetManager:
         KEEPA_SCANNING_BUDGET_PCT: % for scanning (default: 80)
         KEEPA_TOKENS_PER_ASIN: Tokens per ASIN query (default: 2)
         KEEPA_TOKENS_PER_DISCOVERY: Tokens per discovery query (default: 5)
+        BUDGET_STATUS_TTL: Seconds a budget status is cached (default: 5)
+        DATABASE_POOL_MAX: Max pooled connections (default: 10)
     """
 
-    def __init__(self, conn=None):
+    def __init__(self, conn=None, buffered: bool = False):
         """
         Initialize budget manager.
 
         Args:
-            conn: Optional psycopg2 connection. If None, creates new connection.
+            conn: Optional psycopg2 connection. If None, connections are
+                borrowed from the shared pool for each operation.
+            buffered: Opt-in write-behind for record_run: usage is summed in
+                memory and written by flush(). Buffered usage is lost if the
+                process dies before a flush, and other processes do not see
+                it. With pooled connections it is flushed automatically
+                (FLUSH_MAX_DELTAS, FLUSH_MAX_AGE_SECONDS, exit); with an
+                injected conn only by an explicit flush() or close(), so no
+                commit ever lands in the middle of the caller's transaction.
         """
         self.conn = conn
-        self._owns_connection = False
-
-        # Load from env with sensible defaults
-        self.monthly_limit = int(os.getenv("KEEPA_MONTHLY_TOKEN_LIMIT", "900000"))
-        self.tokens_per_minute = int(os.getenv("KEEPA_TOKENS_PER_MINUTE", "21"))
-        self.discovery_pct = int(os.getenv("KEEPA_DISCOVERY_BUDGET_PCT", "20"))
-        self.scanning_pct = int(os.getenv("KEEPA_SCANNING_BUDGET_PCT", "80"))
-        self.tokens_per_asin = int(os.getenv("KEEPA_TOKENS_PER_ASIN", "2"))
-        self.tokens_per_discovery = int(os.getenv("KEEPA_TOKENS_PER_DISCOVERY", "5"))
-
-    def _get_connection(self):
-        """Get or create database connection."""
-        if self.conn:
-            return self.conn
-
-        import psycopg2
-        self.conn = psycopg2.connect(
-            host=os.getenv("DATABASE_HOST", "localhost"),
-            port=int(os.getenv("DATABASE_PORT", "5432")),
-            dbname=os.getenv("DATABASE_NAME", "smartacus"),
-            user=os.getenv("DATABASE_USER", "postgres"),
-            password=os.getenv("DATABASE_PASSWORD", ""),
-            sslmode=os.getenv("DATABASE_SSL_MODE", "prefer"),
-        )
-        self._owns_connection = True
-        return self.conn
+        self.buffered = buffered
+
+        # Load from env with sensible defaults (parsed once per process)
+        settings = _budget_settings()
+        self.monthly_limit = settings["monthly_limit"]
+        self.tokens_per_minute = settings["tokens_per_minute"]
+        self.discovery_pct = settings["discovery_pct"]
+        self.scanning_pct = settings["scanning_pct"]
+        self.tokens_per_asin = settings["tokens_per_asin"]
+        self.tokens_per_discovery = settings["tokens_per_discovery"]
+
+        # Short-lived BudgetStatus cache per month (0 disables). Writes made
+        # through this manager refresh it from their RETURNING row.
+        self._status_ttl = settings["status_ttl"]
+        self._status_cache: Dict[str, Tuple[float, BudgetStatus]] = {}
+
+        # Current month string and the epoch time at which it expires
+        self._month_cache: Tuple[float, str] = (0.0, "")
+        # Days left in the month and the epoch time (next UTC midnight) it expires
+        self._day_cache: Tuple[float, int] = (0.0, 0)
+
+        # Write-behind buffer: usage deltas summed in memory and written
+        # with one UPDATE (see flush)
+        self._pending = self._empty_pending()
+        self._pending_month: Optional[str] = None
+        self._pending_count = 0
+        self._pending_lock = threading.RLock()
+        self._flush_timer: Optional[threading.Timer] = None
+
+        # Automatic flushes (batch size, timer, exit) only on pooled
+        # connections: they would commit an injected connection's open
+        # transaction from another thread or at an arbitrary point
+        self._auto_flush = buffered and conn is None
+        if self._auto_flush:
+            _LIVE_MANAGERS.add(self)
+
+    @contextmanager
+    def _conn(self):
+        """
+        Yield a database connection for one operation.
+
+        Uses the injected connection if any, otherwise borrows one from
+        the shared pool and returns it afterwards (rolled back on error).
+        """
+        if self.conn is not None:
+            yield self.conn
+            return
+
+        pool = _get_pool()
+        conn = pool.getconn()
+        try:
+            yield conn
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            pool.putconn(conn)
 
     def _current_month(self) -> str:
-        """Get current month as YYYY-MM string."""
-        return datetime.utcnow().strftime("%Y-%m")
+        """
+        Get current month as YYYY-MM string.
+
+        Memoized until the next UTC month boundary (one float compare per
+        call instead of utcnow + strftime).
+        """
+        now = time.time()
+        expires_at, month = self._month_cache
+        if now < expires_at:
+            return month
+
+        dt = datetime.fromtimestamp(now, tz=timezone.utc)
+        month = dt.strftime("%Y-%m")
+        if dt.month == 12:
+            next_month = datetime(dt.year + 1, 1, 1, tzinfo=timezone.utc)
+        else:
+            next_month = datetime(dt.year, dt.month + 1, 1, tzinfo=timezone.utc)
+        self._month_cache = (next_month.timestamp(), month)
+        return month
+
+    # token_budget columns behind BudgetStatus (see _status_from_row)
+    _STATUS_COLUMNS = """
+        month_year, monthly_limit, tokens_used, tokens_remaining,
+        discovery_allocation_pct, scanning_allocation_pct,
+        runs_completed, categories_scanned, opportunities_found,
+        discovery_tokens_used, scanning_tokens_used
+    """
+
+    # Per run type: (usage column, allocation pct column)
+    _RUN_TYPE_COLUMNS = {
+        "discovery": ("discovery_tokens_used", "discovery_allocation_pct"),
+        "scanning": ("scanning_tokens_used", "scanning_allocation_pct"),
+    }
+
+    # Insert-if-missing and read back in one statement. The outer SELECT
+    # does not see the row inserted by the CTE (same snapshot), hence the
+    # UNION ALL: exactly one branch returns the month's row.
+    _FETCH_OR_CREATE_SQL = """
+        WITH ins AS (
+            INSERT INTO token_budget (month_year, monthly_limit, discovery_allocation_pct, scanning_allocation_pct)
+            VALUES (%s, %s, %s, %s)
+            ON CONFLICT (month_year) DO NOTHING
+            RETURNING """ + _STATUS_COLUMNS + """
+        )
+        SELECT * FROM ins
+        UNION ALL
+        SELECT """ + _STATUS_COLUMNS + """
+        FROM token_budget
+        WHERE month_year = %s AND NOT EXISTS (SELECT 1 FROM ins)
+        LIMIT 1
+    """
+
+    def _fetch_or_create(self, month: str) -> tuple:
+        """
+        Fetch the budget row for a month, creating it with defaults if needed.
+
+        One round-trip and one commit. If a concurrent writer inserts the
+        row between our snapshot and our INSERT, neither branch returns it:
+        the statement is simply run again (the row is then visible).
+        """
+        params = (month, self.monthly_limit, self.discovery_pct, self.scanning_pct, month)
+
+        with self._conn() as conn, conn.cursor() as cur:
+            for _ in range(2):
+                cur.execute(self._FETCH_OR_CREATE_SQL, params)
+                row = cur.fetchone()
+                if row:
+                    break
+            conn.commit()
+
+        if not row:
+            raise RuntimeError(f"Budget not found for {month}")
+        return row
+
+    def _status_from_row(self, row: tuple) -> BudgetStatus:
+        """Build BudgetStatus from a token_budget row (see _FETCH_OR_CREATE_SQL)."""
+        monthly_limit = row[1]
+        tokens_used = row[2]
+        discovery_pct = row[4]
+        scanning_pct = row[5]
+
+        discovery_budget = int(monthly_limit * discovery_pct / 100)
+        scanning_budget = int(monthly_limit * scanning_pct / 100)
+
+        return BudgetStatus(
+            month=row[0],
+            monthly_limit=monthly_limit,
+            tokens_used=tokens_used,
+            tokens_remaining=row[3],
+            discovery_budget=discovery_budget,
+            scanning_budget=scanning_budget,
+            discovery_used=row[9] or 0,
+            scanning_used=row[10] or 0,
+            runs_completed=row[6],
+            categories_scanned=row[7],
+            utilization_pct=(tokens_used / monthly_limit * 100) if monthly_limit > 0 else 0,
+        )
+
+    # Write-behind thresholds (buffered managers on pooled connections):
+    # flush after this many deltas, or this many seconds after the first
+    # one (background timer)
+    FLUSH_MAX_DELTAS = 32
+    FLUSH_MAX_AGE_SECONDS = 2.0
+
+    @staticmethod
+    def _empty_pending() -> Dict[str, int]:
+        return {"discovery": 0, "scanning": 0, "runs": 0, "categories": 0, "opps": 0}
+
+    def _with_pending(self, status: BudgetStatus) -> BudgetStatus:
+        """Overlay buffered (not yet flushed) usage on a status from the DB."""
+        with self._pending_lock:
+            if self._pending_month != status.month or not self._pending_count:
+                return status
+            pending = dict(self._pending)
+
+        pending_tokens = pending["discovery"] + pending["scanning"]
+        tokens_used = status.tokens_used + pending_tokens
+        return replace(
+            status,
+            tokens_used=tokens_used,
+            tokens_remaining=status.tokens_remaining - pending_tokens,
+            discovery_used=status.discovery_used + pending["discovery"],
+            scanning_used=status.scanning_used + pending["scanning"],
+            runs_completed=status.runs_completed + pending["runs"],
+            categories_scanned=status.categories_scanned + pending["categories"],
+            utilization_pct=(tokens_used / status.monthly_limit * 100) if status.monthly_limit > 0 else 0,
+        )
+
+    def _buffer_usage(
+        self,
+        month: str,
+        tokens_used: int = 0,
+        run_type: str = "scanning",
+        runs: int = 0,
+        categories: int = 0,
+        opps: int = 0,
+    ) -> None:
+        """Add a usage delta to the write-behind buffer."""
+        if run_type not in self._RUN_TYPE_COLUMNS:
+            raise ValueError(f"Unknown run_type: {run_type}")
+
+        with self._pending_lock:
+            if self._pending_month not in (None, month):
+                # Month rolled over: settle the previous month first
+                self.flush()
+
+            self._pending_month = month
+            pending = self._pending
+            pending[run_type] += tokens_used
+            pending["runs"] += runs
+            pending["categories"] += categories
+            pending["opps"] += opps
+            self._pending_count += 1
+
+            if not self._auto_flush:
+                return
+            if self._pending_count >= self.FLUSH_MAX_DELTAS:
+                self.flush()
+            elif self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.FLUSH_MAX_AGE_SECONDS, self._timed_flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def _timed_flush(self) -> None:
+        """Timer callback: flush, logging instead of raising (no caller)."""
+        try:
+            self.flush()
+        except Exception as e:
+            logger.error(f"Token budget write-behind flush failed: {e}")
+
+    def flush(self) -> None:
+        """
+        Write buffered usage with a single UPDATE.
+
+        On failure the deltas are put back in the buffer (and the error is
+        raised), so nothing is lost before the next flush.
+        """
+        with self._pending_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._pending_count:
+                return
+
+            month = self._pending_month
+            pending = self._pending
+            try:
+                with self._conn() as conn, conn.cursor() as cur:
+                    cur.execute("""
+                        UPDATE token_budget
+                        SET
+                            tokens_used = tokens_used + %s,
+                            discovery_tokens_used = discovery_tokens_used + %s,
+                            scanning_tokens_used = scanning_tokens_used + %s,
+                            runs_completed = runs_completed + %s,
+                            categories_scanned = categories_scanned + %s,
+                            opportunities_found = opportunities_found + %s,
+                            updated_at = NOW()
+                        WHERE month_year = %s
+                        RETURNING """ + self._STATUS_COLUMNS,
+                                (
+                                    pending["discovery"] + pending["scanning"],
+                                    pending["discovery"], pending["scanning"],
+                                    pending["runs"], pending["categories"], pending["opps"], month,
+                                ))
+                    row = cur.fetchone()
+                    conn.commit()
+            except Exception:
+                logger.error(f"Token budget flush failed, keeping {self._pending_count} pending deltas")
+                raise
+
+            logger.debug(f"Flushed {self._pending_count} budget deltas for {month}: {pending}")
+            self._pending = self._empty_pending()
+            self._pending_month = None
+            self._pending_count = 0
+            self._cache_status(row)
+
+    def _cache_status(self, row: Optional[tuple]) -> Optional[BudgetStatus]:
+        """Build the status from a fresh token_budget row and cache it."""
+        if not row:
+            return None
+        status = self._status_from_row(row)
+        if self._status_ttl > 0:
+            self._status_cache[status.month] = (time.monotonic(), status)
+        return status
 
     def ensure_budget_exists(self, month: Optional[str] = None) -> None:
         """
@@ -101,89 +432,63 @@ class TokenBudgetManager:
 
         Creates with default values if not exists.
         """
-        month = month or self._current_month()
-        conn = self._get_connection()
-
-        with conn.cursor() as cur:
-            cur.execute("""
-                INSERT INTO token_budget (month_year, monthly_limit, discovery_allocation_pct, scanning_allocation_pct)
-                VALUES (%s, %s, %s, %s)
-                ON CONFLICT (month_year) DO NOTHING
-            """, (month, self.monthly_limit, self.discovery_pct, self.scanning_pct))
-            conn.commit()
+        self._fetch_or_create(month or self._current_month())
 
     def get_status(self, month: Optional[str] = None) -> BudgetStatus:
         """
         Get current budget status.
 
+        Creates the month's budget row on first access (single round-trip).
+        Served from an in-process cache for BUDGET_STATUS_TTL seconds, with
+        buffered (not yet flushed) usage applied on top.
+
         Returns:
             BudgetStatus with all budget metrics
         """
         month = month or self._current_month()
-        self.ensure_budget_exists(month)
-        conn = self._get_connection()
-
-        with conn.cursor() as cur:
-            cur.execute("""
-                SELECT
-                    month_year,
-                    monthly_limit,
-                    tokens_used,
-                    tokens_remaining,
-                    discovery_allocation_pct,
-                    scanning_allocation_pct,
-                    runs_completed,
-                    categories_scanned,
-                    opportunities_found
-                FROM token_budget
-                WHERE month_year = %s
-            """, (month,))
-            row = cur.fetchone()
 
-            if not row:
-                # Should not happen after ensure_budget_exists
-                raise RuntimeError(f"Budget not found for {month}")
+        # Under the buffer lock: a concurrent flush cannot slip between
+        # reading the base status and overlaying the pending deltas
+        with self._pending_lock:
+            cached = self._status_cache.get(month)
+            if cached is not None and time.monotonic() - cached[0] < self._status_ttl:
+                return self._with_pending(cached[1])
 
-            monthly_limit = row[1]
-            tokens_used = row[2]
-            discovery_pct = row[4]
-            scanning_pct = row[5]
-
-            discovery_budget = int(monthly_limit * discovery_pct / 100)
-            scanning_budget = int(monthly_limit * scanning_pct / 100)
-
-            return BudgetStatus(
-                month=row[0],
-                monthly_limit=monthly_limit,
-                tokens_used=tokens_used,
-                tokens_remaining=row[3],
-                discovery_budget=discovery_budget,
-                scanning_budget=scanning_budget,
-                discovery_used=0,  # TODO: track separately
-                scanning_used=tokens_used,
-                runs_completed=row[6],
-                categories_scanned=row[7],
-                utilization_pct=(tokens_used / monthly_limit * 100) if monthly_limit > 0 else 0,
-            )
+            return self._with_pending(self._cache_status(self._fetch_or_create(month)))
 
-    def can_run(self, estimated_tokens: int, month: Optional[str] = None) -> bool:
+    def can_run(
+        self,
+        estimated_tokens: int,
+        month: Optional[str] = None,
+        run_type: Optional[str] = None,
+    ) -> bool:
         """
         Check if we have budget for a run.
 
         Args:
             estimated_tokens: Estimated tokens needed for the run
             month: Optional month to check
+            run_type: "discovery" or "scanning" to also check that
+                allocation (default: total budget only)
 
         Returns:
             True if budget allows the run
         """
         status = self.get_status(month)
-        return status.tokens_remaining >= estimated_tokens
+        remaining = status.tokens_remaining
+        if run_type == "discovery":
+            remaining = min(remaining, status.discovery_budget - status.discovery_used)
+        elif run_type == "scanning":
+            remaining = min(remaining, status.scanning_budget - status.scanning_used)
+        return remaining >= estimated_tokens
 
     def reserve_tokens(self, amount: int, run_type: str = "scanning") -> bool:
         """
         Reserve tokens for a run.
 
+        Refused when either the monthly budget or the run type's allocation
+        (discovery / scanning) would be exceeded.
+
         Args:
             amount: Number of tokens to reserve
             run_type: "discovery" or "scanning"
@@ -191,75 +496,159 @@ class TokenBudgetManager:
         Returns:
             True if reservation successful
         """
-        if not self.can_run(amount):
-            logger.warning(f"Cannot reserve {amount} tokens - budget exceeded")
-            return False
-
+        if run_type not in self._RUN_TYPE_COLUMNS:
+            raise ValueError(f"Unknown run_type: {run_type}")
         month = self._current_month()
-        conn = self._get_connection()
 
-        with conn.cursor() as cur:
-            cur.execute("""
+        # Admission and write in one conditional UPDATE (no check-then-write
+        # race between workers). Usage still sitting in the write-behind
+        # buffer counts against the remaining budget.
+        with self._pending_lock:
+            if self._pending_month == month:
+                pending_tokens = self._pending["discovery"] + self._pending["scanning"]
+                pending_type = self._pending[run_type]
+            else:
+                pending_tokens = pending_type = 0
+
+            args = (month, amount, run_type, amount + pending_tokens, amount + pending_type)
+            row = self._reserve(*args)
+            if row is None and month not in self._status_cache:
+                # First write of the month: the budget row may not exist yet
+                self.ensure_budget_exists(month)
+                row = self._reserve(*args)
+
+            if row is None:
+                logger.warning(f"Cannot reserve {amount} tokens for {run_type} - budget exceeded")
+                return False
+
+            self._cache_status(row)
+
+        logger.info(f"Reserved {amount} tokens for {run_type}. Remaining: {row[3] - pending_tokens}")
+        return True
+
+    def _reserve(
+        self,
+        month: str,
+        amount: int,
+        run_type: str,
+        required: int,
+        required_type: int,
+    ) -> Optional[tuple]:
+        """
+        Charge amount to the month and run type if both the monthly budget
+        (`required` tokens left) and the run type's allocation
+        (`required_type` tokens left) allow it.
+        """
+        used_col, pct_col = self._RUN_TYPE_COLUMNS[run_type]
+        with self._conn() as conn, conn.cursor() as cur:
+            cur.execute(f"""
                 UPDATE token_budget
                 SET tokens_used = tokens_used + %s,
+                    {used_col} = {used_col} + %s,
                     updated_at = NOW()
                 WHERE month_year = %s
-                RETURNING tokens_remaining
-            """, (amount, month))
+                AND tokens_remaining >= %s
+                AND {used_col} + %s <= monthly_limit * {pct_col} / 100
+                RETURNING """ + self._STATUS_COLUMNS, (amount, amount, month, required, required_type))
             row = cur.fetchone()
             conn.commit()
-
-            if row:
-                logger.info(f"Reserved {amount} tokens for {run_type}. Remaining: {row[0]}")
-                return True
-
-        return False
+        return row
 
     def record_run(
         self,
         tokens_used: int,
         categories_scanned: int = 1,
         opportunities_found: int = 0,
+        run_type: str = "scanning",
     ) -> None:
         """
         Record a completed run.
 
+        Written immediately with one UPDATE. A buffered manager keeps it in
+        memory until the next flush() instead (see __init__).
+
         Args:
             tokens_used: Actual tokens consumed
             categories_scanned: Number of categories scanned
             opportunities_found: Number of opportunities found
+            run_type: "discovery" or "scanning"
         """
-        month = self._current_month()
-        conn = self._get_connection()
-
-        with conn.cursor() as cur:
-            cur.execute("""
-                UPDATE token_budget
-                SET
-                    tokens_used = tokens_used + %s,
-                    runs_completed = runs_completed + 1,
-                    categories_scanned = categories_scanned + %s,
-                    opportunities_found = opportunities_found + %s,
-                    updated_at = NOW()
-                WHERE month_year = %s
-            """, (tokens_used, categories_scanned, opportunities_found, month))
-            conn.commit()
+        with self._pending_lock:
+            self._buffer_usage(
+                self._current_month(),
+                tokens_used=tokens_used,
+                run_type=run_type,
+                runs=1,
+                categories=categories_scanned,
+                opps=opportunities_found,
+            )
+            if not self.buffered:
+                self.flush()
 
         logger.info(f"Recorded run: {tokens_used} tokens, {categories_scanned} categories, {opportunities_found} opportunities")
 
+    def record_runs_bulk(
+        self,
+        runs: Sequence[Tuple[int, int, int]],
+        month: Optional[str] = None,
+        run_type: str = "scanning",
+    ) -> None:
+        """
+        Record several completed runs with one UPDATE.
+
+        Totals are summed once, merged with any buffered usage and flushed
+        immediately.
+
+        Args:
+            runs: (tokens_used, categories_scanned, opportunities_found) per run
+            month: Month to charge (default: current month)
+            run_type: "discovery" or "scanning"
+        """
+        if not runs:
+            return
+
+        tokens_used, categories_scanned, opportunities_found = (sum(col) for col in zip(*runs))
+        with self._pending_lock:
+            self._buffer_usage(
+                month or self._current_month(),
+                tokens_used=tokens_used,
+                run_type=run_type,
+                runs=len(runs),
+                categories=categories_scanned,
+                opps=opportunities_found,
+            )
+            self.flush()
+
+        logger.info(
+            f"Recorded {len(runs)} runs: {tokens_used} tokens, "
+            f"{categories_scanned} categories, {opportunities_found} opportunities"
+        )
+
     def get_daily_budget(self) -> int:
         """
         Calculate recommended daily token budget.
 
+        Uses the (TTL-cached) status and the exact length of the month.
+
         Returns:
             Tokens to use per day to spread evenly across month
         """
         status = self.get_status()
-        today = datetime.utcnow().day
-        days_in_month = 30  # Approximation
-        days_remaining = max(1, days_in_month - today + 1)
-
-        return status.tokens_remaining // days_remaining
+        return status.tokens_remaining // self._days_remaining()
+
+    def _days_remaining(self) -> int:
+        """Days left in the current UTC month, today included (memoized per day)."""
+        now = time.time()
+        expires_at, days_remaining = self._day_cache
+        if now < expires_at:
+            return days_remaining
+
+        dt = datetime.fromtimestamp(now, tz=timezone.utc)
+        days_in_month = calendar.monthrange(dt.year, dt.month)[1]
+        days_remaining = max(1, days_in_month - dt.day + 1)
+        next_midnight = (now // 86400 + 1) * 86400
+        self._day_cache = (next_midnight, days_remaining)
+        return days_remaining
 
     def get_tokens_for_asins(self, asin_count: int) -> int:
         """
@@ -276,7 +665,10 @@ class TokenBudgetManager:
         return self.tokens_per_discovery + (asin_count * self.tokens_per_asin)
 
     def close(self):
-        """Close connection if we own it."""
-        if self._owns_connection and self.conn:
-            self.conn.close()
-            self.conn = None
+        """
+        Flush buffered usage.
+
+        Pooled connections are returned after each operation and injected
+        connections belong to the caller, so there is nothing to close.
+        """
+        self.flush()
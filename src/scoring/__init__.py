@@ -29,6 +29,7 @@ from .opportunity_scorer import (
     ScoringResult,
     ComponentScore,
     OpportunityStatus,
+    ProductFeatures,
 )
 from .scoring_config import (
     ScoringConfig,
@@ -47,6 +48,7 @@ __all__ = [
     "ScoringResult",
     "ComponentScore",
     "OpportunityStatus",
+    "ProductFeatures",
     "ScoringConfig",
     "DEFAULT_CONFIG",
     # Economic scorer (avec coût du temps)
@@ -26,20 +26,70 @@ This module does NOT modify thresholds automatically.
 It produces a diagnostic report that a human uses to tune scoring_config.py.
 """
 
+import os
 import json
+import math
 import logging
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 from .opportunity_scorer import OpportunityScorer, ScoringResult, OpportunityStatus
 from .scoring_config import ScoringConfig, DEFAULT_CONFIG
 
 logger = logging.getLogger(__name__)
 
+# Per-process scorer for parallel calibration runs (set by _init_worker)
+_worker_scorer: Optional[OpportunityScorer] = None
+
+
+def _init_worker(config: ScoringConfig) -> None:
+    """ProcessPoolExecutor initializer: build the worker's scorer once."""
+    global _worker_scorer
+    _worker_scorer = OpportunityScorer(config)
+
+
+def _score_one(product_data: Dict[str, Any]) -> ScoringResult:
+    """Score one case in a worker process."""
+    return _worker_scorer.score(product_data)
+
 
-@dataclass
+def _welford_update(
+    acc: Dict[str, Tuple[int, float, float]], name: str, value: float
+) -> None:
+    """Fold one observation into the running (n, mean, M2) of `name` (Welford)."""
+    n, mean, m2 = acc.get(name, (0, 0.0, 0.0))
+    n += 1
+    d = value - mean
+    mean += d / n
+    m2 += d * (value - mean)
+    acc[name] = (n, mean, m2)
+
+
+def _welford_stats(
+    acc: Dict[str, Tuple[int, float, float]]
+) -> Dict[str, Dict[str, float]]:
+    """Per-component bias / population std from Welford accumulators."""
+    return {
+        name: {
+            "avg_delta": round(mean, 2),
+            "std_delta": round(math.sqrt(m2 / n), 2),
+            "n": n,
+        }
+        for name, (n, mean, m2) in acc.items()
+    }
+
+
+@dataclass(slots=True, frozen=True)
 class CalibrationCase:
     """
     A single calibration case: product data + expected outcome.
@@ -54,7 +104,7 @@ class CalibrationCase:
     tags: List[str] = field(default_factory=list)  # e.g. ["q4_2024", "verified"]
 
 
-@dataclass
+@dataclass(slots=True)
 class CaseResult:
     """Result of evaluating one calibration case."""
     case: CalibrationCase
@@ -69,7 +119,7 @@ class CaseResult:
         return self.score_in_range and self.status_match
 
 
-@dataclass
+@dataclass(slots=True)
 class CalibrationReport:
     """Aggregated calibration report."""
     config_used: str
@@ -79,54 +129,64 @@ class CalibrationReport:
     failed: int
     results: List[CaseResult]
     component_stats: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    failed_results: List[CaseResult] = field(default_factory=list)  # built by run()
 
     @property
     def pass_rate(self) -> float:
         return self.passed / self.total_cases if self.total_cases > 0 else 0.0
 
-    def summary(self) -> str:
-        """Human-readable summary."""
-        lines = [
-            "=" * 60,
-            "SMARTACUS CALIBRATION REPORT",
-            "=" * 60,
-            f"Run at:      {self.run_at}",
-            f"Cases:       {self.total_cases}",
-            f"Passed:      {self.passed} ({self.pass_rate:.0%})",
-            f"Failed:      {self.failed}",
-            "",
-        ]
+    def summary(self, include_failed: bool = True, max_failed: int = 50) -> str:
+        """
+        Human-readable summary.
+
+        Args:
+            include_failed: Include the failed-cases section
+            max_failed: Failed cases listed before truncating with "(+N more)"
+        """
+        return "\n".join(self._summary_lines(include_failed, max_failed))
+
+    def _summary_lines(self, include_failed: bool, max_failed: int) -> Iterator[str]:
+        """Lines of summary(), generated lazily."""
+        yield "=" * 60
+        yield "SMARTACUS CALIBRATION REPORT"
+        yield "=" * 60
+        yield f"Run at:      {self.run_at}"
+        yield f"Cases:       {self.total_cases}"
+        yield f"Passed:      {self.passed} ({self.pass_rate:.0%})"
+        yield f"Failed:      {self.failed}"
+        yield ""
 
         # Component-level stats
         if self.component_stats:
-            lines.append("--- Component Accuracy ---")
+            yield "--- Component Accuracy ---"
             for comp, stats in sorted(self.component_stats.items()):
-                lines.append(
+                yield (
                     f"  {comp:15s}  avg_delta={stats['avg_delta']:+.1f}  "
                     f"std={stats['std_delta']:.1f}  "
                     f"bias={'HIGH' if stats['avg_delta'] > 2 else 'LOW' if stats['avg_delta'] < -2 else 'OK'}"
                 )
-            lines.append("")
+            yield ""
 
         # Failed cases detail
-        failed_cases = [r for r in self.results if not r.passed]
-        if failed_cases:
-            lines.append("--- Failed Cases ---")
-            for r in failed_cases:
+        if include_failed and self.failed_results:
+            yield "--- Failed Cases ---"
+            for r in self.failed_results[:max_failed]:
                 pid = r.case.product_data.get("product_id", "?")
                 expected_range = r.case.expected_score_range
-                lines.append(
+                yield (
                     f"  {pid}: score={r.actual_result.total_score} "
                     f"expected=[{expected_range[0]}-{expected_range[1]}] "
                     f"status={r.actual_result.status.value} "
                     f"expected_status={r.case.expected_status}"
                 )
                 if r.case.notes:
-                    lines.append(f"    notes: {r.case.notes}")
-            lines.append("")
+                    yield f"    notes: {r.case.notes}"
+            hidden = len(self.failed_results) - max_failed
+            if hidden > 0:
+                yield f"  ... (+{hidden} more)"
+            yield ""
 
-        lines.append("=" * 60)
-        return "\n".join(lines)
+        yield "=" * 60
 
     def to_dict(self) -> Dict[str, Any]:
         """Serializable dict for JSON export."""
@@ -148,7 +208,7 @@ class CalibrationReport:
                     "score_delta": r.score_delta,
                     "notes": r.case.notes,
                 }
-                for r in self.results if not r.passed
+                for r in self.failed_results
             ],
         }
 
@@ -161,25 +221,66 @@ class CalibrationRunner:
     that helps identify scoring drift or miscalibration.
     """
 
+    # Below this many cases a process pool costs more than it saves
+    PARALLEL_MIN_CASES = 32
+
+    # Scoring results kept across run() calls (scoring is pure)
+    SCORE_CACHE_SIZE = 4096
+
     def __init__(self, config: Optional[ScoringConfig] = None):
         self.config = config or DEFAULT_CONFIG
         self.scorer = OpportunityScorer(self.config)
+        self._score_cache: "OrderedDict[Tuple, ScoringResult]" = OrderedDict()
+
+    def _score_cached(self, product_data: Dict[str, Any]) -> ScoringResult:
+        """
+        Score product_data through a per-runner LRU cache.
 
-    def run(self, cases: List[CalibrationCase]) -> CalibrationReport:
+        Keyed by the frozen product_data (the runner's config is fixed).
+        Cases with unhashable values (e.g. _expected_components) bypass it.
+        """
+        try:
+            key = tuple(sorted(product_data.items()))
+            hash(key)
+        except TypeError:
+            return self.scorer.score(product_data)
+
+        cache = self._score_cache
+        result = cache.get(key)
+        if result is not None:
+            cache.move_to_end(key)
+            return result
+
+        result = self.scorer.score(product_data)
+        cache[key] = result
+        if len(cache) > self.SCORE_CACHE_SIZE:
+            cache.popitem(last=False)
+        return result
+
+    def run(
+        self,
+        cases: List[CalibrationCase],
+        parallel: Union[bool, int] = False,
+    ) -> CalibrationReport:
         """
         Run all calibration cases and produce a report.
 
         Args:
             cases: List of CalibrationCase with known expected outcomes.
+            parallel: Score cases in a process pool (True = one worker per
+                CPU, int = worker count). Ignored below PARALLEL_MIN_CASES.
 
         Returns:
             CalibrationReport with pass/fail details and diagnostics.
         """
         results: List[CaseResult] = []
+        failed_results: List[CaseResult] = []
+        results_append = results.append
+        failed_append = failed_results.append
+        # Running (n, mean, M2) per component, see _welford_update
+        welford: Dict[str, Tuple[int, float, float]] = {}
 
-        for case in cases:
-            result = self.scorer.score(case.product_data)
-
+        for case, result in zip(cases, self._score_cases(cases, parallel)):
             # Check score range
             lo, hi = case.expected_score_range
             score_in_range = lo <= result.total_score <= hi
@@ -193,26 +294,33 @@ class CalibrationRunner:
 
             # Component deltas (if expected sub-scores provided)
             component_deltas = {}
-            expected_components = case.product_data.get("_expected_components", {})
-            for comp_name, expected_score in expected_components.items():
-                actual_comp = result.component_scores.get(comp_name)
-                if actual_comp:
-                    component_deltas[comp_name] = actual_comp.score - expected_score
-
-            results.append(CaseResult(
+            expected_components = case.product_data.get("_expected_components")
+            if expected_components:
+                actual_components = result.component_scores
+                for comp_name, expected_score in expected_components.items():
+                    actual_comp = actual_components.get(comp_name)
+                    if actual_comp:
+                        delta = actual_comp.score - expected_score
+                        component_deltas[comp_name] = delta
+                        _welford_update(welford, comp_name, delta)
+
+            case_result = CaseResult(
                 case=case,
                 actual_result=result,
                 score_in_range=score_in_range,
                 status_match=status_match,
                 score_delta=score_delta,
                 component_deltas=component_deltas,
-            ))
+            )
+            results_append(case_result)
+            if not case_result.passed:
+                failed_append(case_result)
 
-        # Aggregate component stats
-        component_stats = self._compute_component_stats(results)
+        # Aggregate component stats (accumulated during the loop)
+        component_stats = _welford_stats(welford)
 
-        passed = sum(1 for r in results if r.passed)
-        failed = len(results) - passed
+        failed = len(failed_results)
+        passed = len(results) - failed
 
         return CalibrationReport(
             config_used="DEFAULT_CONFIG",
@@ -222,40 +330,37 @@ class CalibrationRunner:
             failed=failed,
             results=results,
             component_stats=component_stats,
+            failed_results=failed_results,
         )
 
-    def _compute_component_stats(
-        self, results: List[CaseResult]
-    ) -> Dict[str, Dict[str, float]]:
-        """Compute per-component bias and variance."""
-        from collections import defaultdict
-        import math
-
-        comp_deltas: Dict[str, List[int]] = defaultdict(list)
-
-        for r in results:
-            for comp_name, delta in r.component_deltas.items():
-                comp_deltas[comp_name].append(delta)
-
-        stats = {}
-        for comp_name, deltas in comp_deltas.items():
-            if not deltas:
-                continue
-            avg = sum(deltas) / len(deltas)
-            variance = sum((d - avg) ** 2 for d in deltas) / len(deltas)
-            stats[comp_name] = {
-                "avg_delta": round(avg, 2),
-                "std_delta": round(math.sqrt(variance), 2),
-                "n": len(deltas),
-            }
-
-        return stats
+    def _score_cases(
+        self,
+        cases: List[CalibrationCase],
+        parallel: Union[bool, int],
+    ) -> List[ScoringResult]:
+        """Score every case, in a process pool when worthwhile."""
+        if not parallel or len(cases) < self.PARALLEL_MIN_CASES:
+            score = self._score_cached
+            return [score(case.product_data) for case in cases]
+
+        workers = (os.cpu_count() or 1) if parallel is True else int(parallel)
+        chunksize = max(1, len(cases) // (4 * workers))
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(self.config,)
+        ) as executor:
+            return list(executor.map(
+                _score_one, (case.product_data for case in cases), chunksize=chunksize
+            ))
 
     def save_report(self, report: CalibrationReport, path: Path) -> None:
-        """Save calibration report to JSON file."""
+        """Save calibration report to JSON file (orjson when installed)."""
         path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w") as f:
-            json.dump(report.to_dict(), f, indent=2)
+        data = report.to_dict()
+        if HAS_ORJSON:
+            path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(path, "w") as f:
+                json.dump(data, f, indent=2)
         logger.info(f"Calibration report saved to {path}")
 
 
@@ -263,7 +368,7 @@ class CalibrationRunner:
 # BUILT-IN CALIBRATION CASES (Car Phone Mounts niche)
 # ============================================================================
 
-NICHE_CALIBRATION_CASES: List[CalibrationCase] = [
+NICHE_CALIBRATION_CASES: Tuple[CalibrationCase, ...] = (
     CalibrationCase(
         product_data={
             "product_id": "CAL_EXCEPTIONAL_01",
@@ -399,4 +504,4 @@ NICHE_CALIBRATION_CASES: List[CalibrationCase] = [
         notes="Low-margin, saturated market, low velocity — not worth pursuing",
         tags=["anchor", "niche_typical"],
     ),
-]
+)
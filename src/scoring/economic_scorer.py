@@ -28,14 +28,40 @@ OUTPUT:
     - Classement par value × time
 """
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Iterable
 from enum import Enum
 from decimal import Decimal
+from operator import attrgetter
+import heapq
+import logging
 import math
+import os
+import threading
+import time
+
+import numpy as np
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit (bare or parametrized use)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
 
 from .opportunity_scorer import OpportunityScorer, ScoringResult, ComponentScore
 
+logger = logging.getLogger(__name__)
+
 
 class TimeWindow(Enum):
     """Classification de la fenêtre temporelle."""
@@ -46,7 +72,291 @@ class TimeWindow(Enum):
     EXTENDED = "extended"     # > 90 jours - Pas d'urgence
 
 
-@dataclass
+# Paliers des facteurs temporels, du plus fort au plus faible.
+# Seuils décroissants (ruptures: >=, autres: >); le dernier facteur/label
+# s'applique sous le plus petit seuil.
+_STOCKOUT_BOUNDS = (3.0, 1.0, 0.5)
+_CHURN_BOUNDS = (0.30, 0.20, 0.10)
+_VOLATILITY_BOUNDS = (0.20, 0.10)
+_BSR_BOUNDS = (0.10, 0.0, -0.05)
+_STOCKOUT_FACTORS = (1.5, 1.2, 1.0, 0.8)
+_STOCKOUT_LABELS = (
+    "Très fréquentes (+50%)",
+    "Fréquentes (+20%)",
+    "Occasionnelles (neutre)",
+    "Rares (-20%)",
+)
+_CHURN_FACTORS = (1.4, 1.2, 1.0, 0.8)
+_CHURN_LABELS = ("Élevé (+40%)", "Modéré (+20%)", "Normal (neutre)", "Faible (-20%)")
+_VOLATILITY_FACTORS = (1.3, 1.1, 1.0)
+_VOLATILITY_LABELS = ("Haute (+30%)", "Modérée (+10%)", "Stable (neutre)")
+_BSR_FACTORS = (1.4, 1.2, 1.0, 0.8)
+_BSR_LABELS = (
+    "Forte accélération (+40%)",
+    "Accélération (+20%)",
+    "Stable (neutre)",
+    "Décélération (-20%)",
+)
+
+# Fenêtres par multiplicateur croissant (bornes de _time_multiplier_kernel)
+_WINDOW_BINS = (0.9, 1.1, 1.4, 1.8)
+_WINDOWS = (
+    TimeWindow.EXTENDED,
+    TimeWindow.STANDARD,
+    TimeWindow.ACTIVE,
+    TimeWindow.URGENT,
+    TimeWindow.CRITICAL,
+)
+_WINDOW_DAYS = (180, 90, 60, 30, 14)
+# Poids d'urgence (ranking) et labels, parallèles à _WINDOWS
+_TIME_MULTIPLIERS = (0.7, 1.0, 1.2, 1.5, 2.0)
+_URGENCY_LABELS = (
+    "⚪ ÉTENDU - Pas d'urgence",
+    "🟢 STANDARD - Temps disponible",
+    "🟡 ACTIF - Fenêtre viable",
+    "🟠 URGENT - Action prioritaire",
+    "🔴 CRITIQUE - Agir immédiatement",
+)
+_WINDOW_INDEX = {window: i for i, window in enumerate(_WINDOWS)}
+
+# Labels des facteurs pour chaque combinaison de paliers (4 × 4 × 3 × 4),
+# construits une fois: le hot path ne fait qu'une copie de dict
+_FACTOR_LABEL_SETS = {
+    (s, c, v, b): {
+        "stockouts": _STOCKOUT_LABELS[s],
+        "seller_churn": _CHURN_LABELS[c],
+        "price_volatility": _VOLATILITY_LABELS[v],
+        "bsr_acceleration": _BSR_LABELS[b],
+    }
+    for s in range(len(_STOCKOUT_LABELS))
+    for c in range(len(_CHURN_LABELS))
+    for v in range(len(_VOLATILITY_LABELS))
+    for b in range(len(_BSR_LABELS))
+}
+# Facteurs à la hausse ("+" dans le label) de chaque combinaison, pour la thèse
+_STRONG_FACTOR_SETS = {
+    buckets: tuple(name for name, label in labels.items() if "+" in label)
+    for buckets, labels in _FACTOR_LABEL_SETS.items()
+}
+
+# Coûts par unité de la valeur économique, en fraction du prix Amazon
+# (frais FBA avec un minimum en $)
+_FBA_FEE_RATE = 0.15
+_FBA_FEE_MINIMUM = 3.0
+_REFERRAL_RATE = 0.15
+_PPC_RATE = 0.10
+_RETURN_RATE = 0.05
+
+# Précision des montants Decimal exposés (centimes)
+_CENT = Decimal("0.01")
+
+# Composantes du score de base (max 30 + 25 + 20 + 15 = 90)
+_BASE_COMPONENTS = ("margin", "velocity", "competition", "gap")
+
+# Pool de connexions partagé pour la lecture des devis sourcing
+# (créé au premier usage; les scorers avec une conn injectée ne l'utilisent pas)
+_POOL = None
+_POOL_LOCK = threading.Lock()
+
+
+def _get_component_score(scores: Dict[str, ComponentScore], name: str) -> int:
+    """Score d'une composante, 0 si absente (sans allouer de ComponentScore)."""
+    component = scores.get(name)
+    return component.score if component is not None else 0
+
+
+@lru_cache(maxsize=1)
+def _db_config() -> Dict[str, Any]:
+    """
+    Parse database settings from env once per process.
+
+    Deferred to the first quote lookup (not import time) so that entry
+    points calling load_dotenv() after importing still apply.
+    """
+    return {
+        "host": os.getenv("DATABASE_HOST", "localhost"),
+        "port": int(os.getenv("DATABASE_PORT", "5432")),
+        "dbname": os.getenv("DATABASE_NAME", "smartacus"),
+        "user": os.getenv("DATABASE_USER", "postgres"),
+        "password": os.getenv("DATABASE_PASSWORD", ""),
+        "sslmode": os.getenv("DATABASE_SSL_MODE", "prefer"),
+        "connect_timeout": 5,
+    }
+
+
+def _get_pool():
+    """Get or create the shared psycopg2 connection pool."""
+    global _POOL
+    if _POOL is None:
+        with _POOL_LOCK:
+            if _POOL is None:
+                from psycopg2.pool import ThreadedConnectionPool
+                _POOL = ThreadedConnectionPool(
+                    minconn=1,
+                    maxconn=int(os.getenv("DATABASE_POOL_MAX", "10")),
+                    **_db_config(),
+                )
+                logger.info("Sourcing quotes connection pool created")
+    return _POOL
+
+
+@njit(cache=True)
+def _factor_buckets(stockout_frequency, seller_churn, price_volatility, bsr_acceleration):
+    """Palier (index dans les tables _*_FACTORS) de chacun des quatre facteurs."""
+    # === FACTEUR 1: Fréquence des ruptures ===
+    # Plus de ruptures = demande forte = fenêtre courte
+    if stockout_frequency >= _STOCKOUT_BOUNDS[0]:  # 3+ ruptures/mois
+        stockout_idx = 0
+    elif stockout_frequency >= _STOCKOUT_BOUNDS[1]:
+        stockout_idx = 1
+    elif stockout_frequency >= _STOCKOUT_BOUNDS[2]:
+        stockout_idx = 2
+    else:
+        stockout_idx = 3
+
+    # === FACTEUR 2: Churn des vendeurs ===
+    # Churn élevé = place qui se libère = fenêtre qui s'ouvre
+    if seller_churn > _CHURN_BOUNDS[0]:
+        churn_idx = 0
+    elif seller_churn > _CHURN_BOUNDS[1]:
+        churn_idx = 1
+    elif seller_churn > _CHURN_BOUNDS[2]:
+        churn_idx = 2
+    else:
+        churn_idx = 3
+
+    # === FACTEUR 3: Volatilité des prix ===
+    # Prix volatils = marché instable = agir vite
+    if price_volatility > _VOLATILITY_BOUNDS[0]:
+        volatility_idx = 0
+    elif price_volatility > _VOLATILITY_BOUNDS[1]:
+        volatility_idx = 1
+    else:
+        volatility_idx = 2
+
+    # === FACTEUR 4: Accélération BSR ===
+    # BSR qui accélère = momentum = fenêtre qui rétrécit
+    if bsr_acceleration > _BSR_BOUNDS[0]:  # Amélioration qui s'accélère
+        bsr_idx = 0
+    elif bsr_acceleration > _BSR_BOUNDS[1]:
+        bsr_idx = 1
+    elif bsr_acceleration > _BSR_BOUNDS[2]:
+        bsr_idx = 2
+    else:
+        bsr_idx = 3
+
+    return stockout_idx, churn_idx, volatility_idx, bsr_idx
+
+
+@njit(cache=True)
+def _time_multiplier_kernel(stockout_frequency, seller_churn, price_volatility, bsr_acceleration):
+    """
+    Multiplicateur temporel d'un produit.
+
+    Compilé par numba s'il est installé (cache=True conserve le code machine
+    sur disque entre les processus), exécuté en Python sinon. Pas de
+    fastmath: résultats identiques à score_economic_batch.
+
+    Returns:
+        (multiplier, window_idx, window_days, erosion_rate, confidence, buckets),
+        window_idx indexant _WINDOWS et buckets les paliers de _factor_buckets
+    """
+    buckets = _factor_buckets(
+        stockout_frequency, seller_churn, price_volatility, bsr_acceleration
+    )
+    stockout_idx, churn_idx, volatility_idx, bsr_idx = buckets
+    stockout_factor = _STOCKOUT_FACTORS[stockout_idx]
+    churn_factor = _CHURN_FACTORS[churn_idx]
+    volatility_factor = _VOLATILITY_FACTORS[volatility_idx]
+    bsr_factor = _BSR_FACTORS[bsr_idx]
+
+    # === CALCUL DU MULTIPLICATEUR COMPOSITE ===
+    # Moyenne géométrique pour éviter les extrêmes
+    # Racine 4ème = moyenne géométrique (deux sqrt, moins cher que ** 0.25)
+    raw_multiplier = math.sqrt(math.sqrt(
+        stockout_factor *
+        churn_factor *
+        volatility_factor *
+        bsr_factor
+    ))
+
+    # Clamp entre 0.5 et 2.0
+    multiplier = max(0.5, min(2.0, raw_multiplier))
+
+    # === DÉTERMINER LA FENÊTRE ===
+    window_idx = 0
+    for bound in _WINDOW_BINS:
+        if multiplier >= bound:
+            window_idx += 1
+
+    # Calculer le taux d'érosion
+    erosion_rate = (multiplier - 0.5) / 1.5  # Normaliser [0-1]
+
+    # Confiance basée sur le nombre de signaux forts
+    # bool est un int: 4 comparaisons additionnées, sans liste ni générateur
+    strong_signals = (
+        (stockout_factor >= 1.2) +
+        (churn_factor >= 1.2) +
+        (volatility_factor >= 1.2) +
+        (bsr_factor >= 1.2)
+    )
+    confidence = 0.5 + (strong_signals * 0.125)  # 0.5 - 1.0
+
+    return multiplier, window_idx, _WINDOW_DAYS[window_idx], erosion_rate, confidence, buckets
+
+
+@njit(cache=True)
+def _time_multiplier_batch(stockout_frequency, seller_churn, price_volatility, bsr_acceleration):
+    """
+    _time_multiplier_kernel sur des colonnes float64 alignées.
+
+    Returns:
+        (multiplier, window_idx, erosion_rate, confidence, buckets),
+        buckets étant la matrice N × 4 des paliers de _factor_buckets
+    """
+    n = stockout_frequency.shape[0]
+    multiplier = np.empty(n, dtype=np.float64)
+    window_idx = np.empty(n, dtype=np.int64)
+    erosion_rate = np.empty(n, dtype=np.float64)
+    confidence = np.empty(n, dtype=np.float64)
+    buckets = np.empty((n, 4), dtype=np.int64)
+    for i in range(n):
+        m, w, _, e, c, b = _time_multiplier_kernel(
+            stockout_frequency[i], seller_churn[i], price_volatility[i], bsr_acceleration[i]
+        )
+        multiplier[i] = m
+        window_idx[i] = w
+        erosion_rate[i] = e
+        confidence[i] = c
+        buckets[i, 0], buckets[i, 1], buckets[i, 2], buckets[i, 3] = b
+    return multiplier, window_idx, erosion_rate, confidence, buckets
+
+
+def _monthly_profit_values(amazon_price, cogs, units):
+    """
+    Profit mensuel après tous les coûts, floats ou ndarrays alignés.
+
+    0.0 (jamais -0.0 ni NaN) pour un profit négatif ou nul.
+    """
+    # Coûts complets
+    fba_fees = np.maximum(amazon_price * _FBA_FEE_RATE, _FBA_FEE_MINIMUM)
+    referral = amazon_price * _REFERRAL_RATE
+    ppc_provision = amazon_price * _PPC_RATE
+    return_provision = amazon_price * _RETURN_RATE
+
+    total_cost_per_unit = (
+        cogs +
+        fba_fees +
+        referral +
+        ppc_provision +
+        return_provision
+    )
+
+    monthly_profit = (amazon_price - total_cost_per_unit) * units
+    return np.where(monthly_profit > 0, monthly_profit, 0.0)
+
+
+@dataclass(slots=True)
 class TimeMultiplierResult:
     """
     Résultat du calcul du multiplicateur temporel.
@@ -56,22 +366,19 @@ class TimeMultiplierResult:
     window_days: int
     erosion_rate: float         # Vitesse d'érosion de l'opportunité [0-1]
     confidence: float           # Confiance dans l'estimation [0-1]
-    factors: Dict[str, float] = field(default_factory=dict)
-
-    @property
-    def urgency_label(self) -> str:
-        """Label humain pour l'urgence."""
-        labels = {
-            TimeWindow.CRITICAL: "🔴 CRITIQUE - Agir immédiatement",
-            TimeWindow.URGENT: "🟠 URGENT - Action prioritaire",
-            TimeWindow.ACTIVE: "🟡 ACTIF - Fenêtre viable",
-            TimeWindow.STANDARD: "🟢 STANDARD - Temps disponible",
-            TimeWindow.EXTENDED: "⚪ ÉTENDU - Pas d'urgence",
-        }
-        return labels.get(self.window, "Inconnu")
+    factors: Dict[str, str] = field(default_factory=dict)
+    strong_factors: Tuple[str, ...] = ()    # Facteurs à la hausse (drivers)
+    # Dérivés de la fenêtre une fois pour toutes
+    urgency_label: str = field(init=False)      # Label humain pour l'urgence
+    urgency_weight: float = field(init=False)   # Poids de ranking de la fenêtre
+
+    def __post_init__(self):
+        window_idx = _WINDOW_INDEX[self.window]
+        self.urgency_label = _URGENCY_LABELS[window_idx]
+        self.urgency_weight = _TIME_MULTIPLIERS[window_idx]
 
 
-@dataclass
+@dataclass(slots=True)
 class EconomicOpportunity:
     """
     Opportunité économique avec valeur et ranking.
@@ -131,18 +438,50 @@ class EconomicScorer:
         time_multiplier = f(stockout_freq, seller_churn, price_volatility, bsr_accel)
     """
 
-    # Multiplicateurs temporels par fenêtre
-    TIME_MULTIPLIERS = {
-        TimeWindow.CRITICAL: 2.0,    # Double la valeur perçue
-        TimeWindow.URGENT: 1.5,      # +50%
-        TimeWindow.ACTIVE: 1.2,      # +20%
-        TimeWindow.STANDARD: 1.0,    # Base
-        TimeWindow.EXTENDED: 0.7,    # -30%
-    }
+    # Multiplicateurs temporels par fenêtre (vue de _TIME_MULTIPLIERS):
+    # CRITICAL ×2.0, URGENT +50%, ACTIVE +20%, STANDARD base, EXTENDED -30%
+    TIME_MULTIPLIERS = dict(zip(_WINDOWS, _TIME_MULTIPLIERS))
 
-    def __init__(self):
-        """Initialise le scorer économique."""
+    # Nombre max de scores de base gardés en cache (re-scoring d'un même catalogue)
+    BASE_SCORE_CACHE_SIZE = 4096
+
+    # Taille de lot à partir de laquelle la lecture des devis (I/O) tourne
+    # dans un thread pendant le scoring de base
+    QUOTE_OVERLAP_MIN_ITEMS = 32
+
+    # Durée de validité des devis en cache (valid_until évolue lentement)
+    QUOTE_CACHE_TTL_SECONDS = 300.0
+
+    # Nombre max d'ASIN gardés dans le cache des devis (LRU)
+    QUOTE_CACHE_SIZE = 16384
+
+    _BEST_QUOTES_SQL = """
+        SELECT DISTINCT ON (asin) asin, unit_price_usd, shipping_cost_usd
+        FROM sourcing_quotes
+        WHERE asin = ANY(%s)
+          AND is_active = true
+          AND (valid_until IS NULL OR valid_until > NOW())
+          AND unit_price_usd IS NOT NULL
+        ORDER BY asin, unit_price_usd ASC
+    """
+
+    _HAS_QUOTES_SQL = "SELECT EXISTS (SELECT 1 FROM sourcing_quotes LIMIT 1)"
+
+    def __init__(self, conn=None):
+        """
+        Initialise le scorer économique.
+
+        Args:
+            conn: Connexion psycopg2 optionnelle pour les devis sourcing
+                  (sinon empruntée au pool partagé)
+        """
         self.base_scorer = OpportunityScorer()
+        self.conn = conn
+        self._base_score_cache: "OrderedDict[Tuple, ScoringResult]" = OrderedDict()
+        # asin -> (expire_at monotonic, (unit_price, shipping) ou None)
+        self._quote_cache: "OrderedDict[str, Tuple[float, Optional[Tuple[float, float]]]]" = OrderedDict()
+        # (expire_at monotonic, table sourcing_quotes non vide)
+        self._has_quotes: Optional[Tuple[float, bool]] = None
 
     def calculate_time_multiplier(
         self,
@@ -162,112 +501,44 @@ class EconomicScorer:
         Returns:
             TimeMultiplierResult avec le multiplicateur [0.5-2.0]
         """
-        factors = {}
-
-        # === FACTEUR 1: Fréquence des ruptures ===
-        # Plus de ruptures = demande forte = fenêtre courte
-        if stockout_frequency >= 3:  # 3+ ruptures/mois
-            stockout_factor = 1.5
-            factors["stockouts"] = "Très fréquentes (+50%)"
-        elif stockout_frequency >= 1:
-            stockout_factor = 1.2
-            factors["stockouts"] = "Fréquentes (+20%)"
-        elif stockout_frequency >= 0.5:
-            stockout_factor = 1.0
-            factors["stockouts"] = "Occasionnelles (neutre)"
-        else:
-            stockout_factor = 0.8
-            factors["stockouts"] = "Rares (-20%)"
-
-        # === FACTEUR 2: Churn des vendeurs ===
-        # Churn élevé = place qui se libère = fenêtre qui s'ouvre
-        if seller_churn > 0.30:
-            churn_factor = 1.4
-            factors["seller_churn"] = "Élevé (+40%)"
-        elif seller_churn > 0.20:
-            churn_factor = 1.2
-            factors["seller_churn"] = "Modéré (+20%)"
-        elif seller_churn > 0.10:
-            churn_factor = 1.0
-            factors["seller_churn"] = "Normal (neutre)"
-        else:
-            churn_factor = 0.8
-            factors["seller_churn"] = "Faible (-20%)"
-
-        # === FACTEUR 3: Volatilité des prix ===
-        # Prix volatils = marché instable = agir vite
-        if price_volatility > 0.20:
-            volatility_factor = 1.3
-            factors["price_volatility"] = "Haute (+30%)"
-        elif price_volatility > 0.10:
-            volatility_factor = 1.1
-            factors["price_volatility"] = "Modérée (+10%)"
-        else:
-            volatility_factor = 1.0
-            factors["price_volatility"] = "Stable (neutre)"
-
-        # === FACTEUR 4: Accélération BSR ===
-        # BSR qui accélère = momentum = fenêtre qui rétrécit
-        if bsr_acceleration > 0.10:  # Amélioration qui s'accélère
-            bsr_factor = 1.4
-            factors["bsr_acceleration"] = "Forte accélération (+40%)"
-        elif bsr_acceleration > 0:
-            bsr_factor = 1.2
-            factors["bsr_acceleration"] = "Accélération (+20%)"
-        elif bsr_acceleration > -0.05:
-            bsr_factor = 1.0
-            factors["bsr_acceleration"] = "Stable (neutre)"
-        else:
-            bsr_factor = 0.8
-            factors["bsr_acceleration"] = "Décélération (-20%)"
-
-        # === CALCUL DU MULTIPLICATEUR COMPOSITE ===
-        # Moyenne géométrique pour éviter les extrêmes
-        raw_multiplier = (
-            stockout_factor *
-            churn_factor *
-            volatility_factor *
-            bsr_factor
-        ) ** 0.25  # Racine 4ème = moyenne géométrique
-
-        # Clamp entre 0.5 et 2.0
-        multiplier = max(0.5, min(2.0, raw_multiplier))
-
-        # === DÉTERMINER LA FENÊTRE ===
-        if multiplier >= 1.8:
-            window = TimeWindow.CRITICAL
-            window_days = 14
-        elif multiplier >= 1.4:
-            window = TimeWindow.URGENT
-            window_days = 30
-        elif multiplier >= 1.1:
-            window = TimeWindow.ACTIVE
-            window_days = 60
-        elif multiplier >= 0.9:
-            window = TimeWindow.STANDARD
-            window_days = 90
-        else:
-            window = TimeWindow.EXTENDED
-            window_days = 180
-
-        # Calculer le taux d'érosion
-        erosion_rate = (multiplier - 0.5) / 1.5  # Normaliser [0-1]
-
-        # Confiance basée sur le nombre de signaux forts
-        strong_signals = sum(1 for f in [
-            stockout_factor, churn_factor, volatility_factor, bsr_factor
-        ] if f >= 1.2)
-        confidence = 0.5 + (strong_signals * 0.125)  # 0.5 - 1.0
+        # float() : une seule spécialisation numba quels que soient les types d'entrée
+        signals = (
+            float(stockout_frequency),
+            float(seller_churn),
+            float(price_volatility),
+            float(bsr_acceleration),
+        )
+        multiplier, window_idx, window_days, erosion_rate, confidence, buckets = (
+            _time_multiplier_kernel(*signals)
+        )
 
         return TimeMultiplierResult(
             multiplier=multiplier,
-            window=window,
+            window=_WINDOWS[window_idx],
             window_days=window_days,
             erosion_rate=erosion_rate,
             confidence=confidence,
-            factors=factors,
+            factors=_FACTOR_LABEL_SETS[buckets].copy(),
+            strong_factors=_STRONG_FACTOR_SETS[buckets],
         )
 
+    @contextmanager
+    def _conn(self):
+        """Connexion injectée, ou empruntée au pool et rendue ensuite."""
+        if self.conn is not None:
+            yield self.conn
+            return
+
+        pool = _get_pool()
+        conn = pool.getconn()
+        try:
+            yield conn
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            pool.putconn(conn)
+
     def get_best_quote_cogs(self, asin: str) -> Optional[Tuple[float, float]]:
         """
         Get best COGS from sourcing_quotes table if available.
@@ -275,42 +546,85 @@ class EconomicScorer:
         Returns:
             (unit_price_usd, shipping_cost_usd) or None if no valid quote
         """
-        try:
-            import os
-            import psycopg2
-
-            conn = psycopg2.connect(
-                host=os.getenv("DATABASE_HOST", "localhost"),
-                port=int(os.getenv("DATABASE_PORT", "5432")),
-                dbname=os.getenv("DATABASE_NAME", "smartacus"),
-                user=os.getenv("DATABASE_USER", "postgres"),
-                password=os.getenv("DATABASE_PASSWORD", ""),
-                sslmode=os.getenv("DATABASE_SSL_MODE", "prefer"),
-                connect_timeout=5,
-            )
+        return self.get_best_quote_cogs_batch((asin,)).get(asin)
+
+    def get_best_quote_cogs_batch(
+        self,
+        asins: Iterable[str],
+    ) -> Dict[str, Tuple[float, float]]:
+        """
+        Get best COGS for several ASINs with a single query.
+
+        Results (including misses) are cached for QUOTE_CACHE_TTL_SECONDS,
+        at most QUOTE_CACHE_SIZE ASINs (least recently used evicted first);
+        only ASINs absent from the cache hit the database, and not at all
+        while sourcing_quotes is known to be empty.
+
+        Returns:
+            {asin: (unit_price_usd, shipping_cost_usd)} for ASINs with a valid quote
+        """
+        now = time.monotonic()
+        cache = self._quote_cache
+        quotes = {}
+        missing = []
+        for asin in asins:
+            cached = cache.get(asin)
+            if cached is not None and cached[0] > now:
+                cache.move_to_end(asin)
+                if cached[1] is not None:
+                    quotes[asin] = cached[1]
+            else:
+                missing.append(asin)
+
+        if not missing:
+            return quotes
+
+        has_quotes = self._has_quotes
+        if has_quotes is not None and has_quotes[0] > now and not has_quotes[1]:
+            rows = []
+        else:
             try:
-                with conn.cursor() as cur:
-                    cur.execute("""
-                        SELECT unit_price_usd, shipping_cost_usd
-                        FROM sourcing_quotes
-                        WHERE asin = %s
-                          AND is_active = true
-                          AND (valid_until IS NULL OR valid_until > NOW())
-                          AND unit_price_usd IS NOT NULL
-                        ORDER BY unit_price_usd ASC
-                        LIMIT 1
-                    """, (asin,))
-                    row = cur.fetchone()
-                    if row:
-                        unit_price = float(row[0]) if row[0] else None
-                        shipping = float(row[1]) if row[1] else 0.0
-                        if unit_price:
-                            return (unit_price, shipping)
-            finally:
-                conn.close()
-        except Exception:
-            pass  # Silently fallback to heuristic
-        return None
+                with self._conn() as conn:
+                    with conn.cursor() as cur:
+                        # Table vide (début d'activité): sonder une fois par TTL
+                        if has_quotes is None or has_quotes[0] <= now:
+                            cur.execute(self._HAS_QUOTES_SQL)
+                            self._has_quotes = (
+                                now + self.QUOTE_CACHE_TTL_SECONDS,
+                                bool(cur.fetchone()[0]),
+                            )
+                        if self._has_quotes[1]:
+                            cur.execute(self._BEST_QUOTES_SQL, (missing,))
+                            rows = cur.fetchall()
+                        else:
+                            rows = []
+            except Exception:
+                return quotes  # Silently fallback to heuristic (not cached)
+
+        found = {}
+        for asin, unit_price, shipping in rows:
+            if unit_price:
+                found[asin] = (float(unit_price), float(shipping) if shipping else 0.0)
+
+        expires_at = now + self.QUOTE_CACHE_TTL_SECONDS
+        for asin in missing:
+            quote = found.get(asin)
+            cache[asin] = (expires_at, quote)
+            cache.move_to_end(asin)
+            if quote is not None:
+                quotes[asin] = quote
+        while len(cache) > self.QUOTE_CACHE_SIZE:
+            cache.popitem(last=False)
+        return quotes
+
+    def prefetch_quotes(self, asins: Iterable[str]) -> None:
+        """
+        Load quotes for a whole scoring run into the cache in one query.
+
+        Later get_best_quote_cogs calls for these ASINs (hits and misses)
+        are answered from the cache until QUOTE_CACHE_TTL_SECONDS elapses.
+        """
+        self.get_best_quote_cogs_batch(asins)
 
     def estimate_economic_value(
         self,
@@ -329,6 +643,20 @@ class EconomicScorer:
         Returns:
             (monthly_profit, annual_value, risk_adjusted_value)
         """
+        monthly_profit, _, risk_adjusted = self._economic_values(
+            self._monthly_profit(amazon_price, estimated_cogs, estimated_monthly_units, asin),
+            risk_factor,
+        )
+        return self._as_decimal(monthly_profit, risk_adjusted)
+
+    def _monthly_profit(
+        self,
+        amazon_price: float,
+        estimated_cogs: float,
+        estimated_monthly_units: int,
+        asin: Optional[str] = None,
+    ) -> float:
+        """Profit mensuel (float, >= 0) après tous les coûts."""
         # V2.0: Try to get real COGS from sourcing_quotes
         actual_cogs = estimated_cogs
         if asin:
@@ -336,29 +664,65 @@ class EconomicScorer:
             if quote_data:
                 actual_cogs = quote_data[0] + quote_data[1]  # unit_price + shipping
 
-        # Coûts complets
-        fba_fees = max(amazon_price * 0.15, 3.0)
-        referral = amazon_price * 0.15
-        ppc_provision = amazon_price * 0.10
-        return_provision = amazon_price * 0.05
-
-        total_cost_per_unit = (
-            actual_cogs +
-            fba_fees +
-            referral +
-            ppc_provision +
-            return_provision
-        )
+        return float(_monthly_profit_values(amazon_price, actual_cogs, estimated_monthly_units))
 
-        profit_per_unit = amazon_price - total_cost_per_unit
-        monthly_profit = Decimal(str(max(0, profit_per_unit * estimated_monthly_units)))
+    @staticmethod
+    def _economic_values(
+        monthly_profit,
+        risk_factor: float = 0.3,
+    ):
+        """(mensuel, annuel, ajusté au risque) depuis le profit mensuel (float ou ndarray)."""
         annual_value = monthly_profit * 12
 
         # Ajustement risque
-        risk_adjusted = annual_value * Decimal(str(1 - risk_factor))
+        risk_adjusted = annual_value * (1 - risk_factor)
 
         return monthly_profit, annual_value, risk_adjusted
 
+    @staticmethod
+    def _as_decimal(
+        monthly_profit: float,
+        risk_adjusted: float,
+    ) -> Tuple[Decimal, Decimal, Decimal]:
+        """
+        Montants en Decimal arrondis au centime, uniquement en sortie d'API.
+
+        L'annuel est dérivé du mensuel arrondi (annuel == mensuel × 12).
+        """
+        monthly = Decimal.from_float(monthly_profit).quantize(_CENT)
+        return monthly, monthly * 12, Decimal.from_float(risk_adjusted).quantize(_CENT)
+
+    @staticmethod
+    def _base_score(base_result: ScoringResult) -> float:
+        """Score de base [0-1] (sans time_pressure, géré par le multiplicateur)."""
+        scores = base_result.component_scores
+        return sum(_get_component_score(scores, name) for name in _BASE_COMPONENTS) / 90
+
+    def _score_base_cached(self, product_data: Dict[str, Any]) -> ScoringResult:
+        """
+        Score de base via un cache LRU par scorer.
+
+        Clé: product_data figé; les données non hashables contournent le cache.
+        Les ScoringResult en cache sont partagés entre les opportunités.
+        """
+        try:
+            key = tuple(sorted(product_data.items()))
+            hash(key)
+        except TypeError:
+            return self.base_scorer.score(product_data)
+
+        cache = self._base_score_cache
+        result = cache.get(key)
+        if result is not None:
+            cache.move_to_end(key)
+            return result
+
+        result = self.base_scorer.score(product_data)
+        cache[key] = result
+        if len(cache) > self.BASE_SCORE_CACHE_SIZE:
+            cache.popitem(last=False)
+        return result
+
     def score_economic(
         self,
         product_data: Dict[str, Any],
@@ -384,16 +748,10 @@ class EconomicScorer:
         asin = product_data.get("product_id", "UNKNOWN")
 
         # === 1. SCORE DE BASE ===
-        base_result = self.base_scorer.score(product_data)
+        base_result = self._score_base_cached(product_data)
 
         # Extraire les composantes principales (sans time_pressure, géré différemment)
-        base_components_score = (
-            base_result.component_scores.get("margin", ComponentScore("margin", 0, 30)).score +
-            base_result.component_scores.get("velocity", ComponentScore("velocity", 0, 25)).score +
-            base_result.component_scores.get("competition", ComponentScore("competition", 0, 20)).score +
-            base_result.component_scores.get("gap", ComponentScore("gap", 0, 15)).score
-        )
-        base_score = base_components_score / 90  # Normaliser [0-1]
+        base_score = self._base_score(base_result)
 
         # === 2. MULTIPLICATEUR TEMPOREL ===
         time_result = self.calculate_time_multiplier(
@@ -412,17 +770,17 @@ class EconomicScorer:
         alibaba_price = product_data.get("alibaba_price", amazon_price / 5)
         estimated_units = time_data.get("estimated_monthly_units", 100)
 
-        monthly_profit, annual_value, risk_adjusted = self.estimate_economic_value(
+        # Calcul en float; conversion Decimal seulement pour l'opportunité finale
+        monthly_profit, _, risk_adjusted = self._economic_values(self._monthly_profit(
             amazon_price=amazon_price,
             estimated_cogs=alibaba_price + 3,  # +3$ shipping (fallback heuristic)
             estimated_monthly_units=estimated_units,
             asin=asin,  # V2.0: pass ASIN to lookup real quotes
-        )
+        ))
 
         # === 5. SCORE DE RANKING ===
         # Ranking = valeur ajustée × urgence
-        urgency_weight = self.TIME_MULTIPLIERS.get(time_result.window, 1.0)
-        rank_score = float(risk_adjusted) * urgency_weight
+        rank_score = risk_adjusted * time_result.urgency_weight
 
         # === 6. CONSTRUIRE LA THÈSE ===
         thesis = self._build_thesis(
@@ -431,15 +789,18 @@ class EconomicScorer:
             monthly_profit=monthly_profit,
             base_result=base_result,
         )
+        monthly_value, annual_value, risk_adjusted_value = self._as_decimal(
+            monthly_profit, risk_adjusted
+        )
 
         return EconomicOpportunity(
             asin=asin,
             base_score=base_score,
             time_multiplier=time_result.multiplier,
             final_score=final_score,
-            estimated_monthly_profit=monthly_profit,
+            estimated_monthly_profit=monthly_value,
             estimated_annual_value=annual_value,
-            risk_adjusted_value=risk_adjusted,
+            risk_adjusted_value=risk_adjusted_value,
             window=time_result.window,
             window_days=time_result.window_days,
             urgency_label=time_result.urgency_label,
@@ -449,11 +810,131 @@ class EconomicScorer:
             rank_score=rank_score,
         )
 
+    def score_economic_batch(
+        self,
+        products: List[Dict[str, Any]],
+        time_data: List[Dict[str, Any]],
+        economic_events: Optional[List[Optional[List[str]]]] = None,
+    ) -> List[EconomicOpportunity]:
+        """
+        Score économique d'un lot de produits (mêmes résultats que score_economic).
+
+        Le multiplicateur temporel vient du noyau de calculate_time_multiplier
+        appliqué aux colonnes du lot (_time_multiplier_batch), le score final
+        et la valeur économique de quelques opérations NumPy; seuls le scoring
+        de base et la construction des résultats restent par produit.
+        Pour les lots >= QUOTE_OVERLAP_MIN_ITEMS, la requête des devis
+        sourcing s'exécute dans un thread pendant le scoring de base.
+
+        Args:
+            products: Données produit (voir score_economic)
+            time_data: Données temporelles, alignées sur products
+            economic_events: Événements par produit (optionnel, aligné)
+
+        Returns:
+            Liste d'EconomicOpportunity dans l'ordre des produits
+        """
+        if len(products) != len(time_data):
+            raise ValueError("products and time_data must have the same length")
+        if not products:
+            return []
+
+        # Devis sourcing réels: une seule requête pour tout le lot, lancée
+        # en premier pour recouvrir l'attente réseau par le calcul
+        asins = [p.get("product_id", "UNKNOWN") for p in products]
+        quote_asins = {asin for asin in asins if asin}
+
+        # === 1. SCORES DE BASE (par produit) ===
+        if len(products) >= self.QUOTE_OVERLAP_MIN_ITEMS:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                quotes_future = executor.submit(self.get_best_quote_cogs_batch, quote_asins)
+                base_results = [self._score_base_cached(p) for p in products]
+                quotes = quotes_future.result()
+        else:
+            base_results = [self._score_base_cached(p) for p in products]
+            quotes = self.get_best_quote_cogs_batch(quote_asins)
+        base_score = np.array([self._base_score(r) for r in base_results])
+
+        # === 2. MULTIPLICATEURS TEMPORELS (vectorisés) ===
+        sf = np.array([t.get("stockout_frequency", 0) for t in time_data], dtype=np.float64)
+        sc = np.array([t.get("seller_churn_90d", 0) for t in time_data], dtype=np.float64)
+        pv = np.array([t.get("price_volatility", 0) for t in time_data], dtype=np.float64)
+        ba = np.array([t.get("bsr_acceleration", 0) for t in time_data], dtype=np.float64)
+
+        multiplier, window_idx, erosion_rate, confidence, buckets = _time_multiplier_batch(sf, sc, pv, ba)
+
+        # === 3. SCORES FINAUX ===
+        final_score = np.minimum(100, base_score * multiplier * 100).astype(np.int64)
+
+        # === 4. VALEUR ÉCONOMIQUE ===
+        amazon_price = np.array([p.get("amazon_price", 0) for p in products], dtype=np.float64)
+        cogs = np.array(
+            [p.get("alibaba_price", p.get("amazon_price", 0) / 5) + 3 for p in products],
+            dtype=np.float64,
+        )
+        for i, asin in enumerate(asins):
+            quote_data = quotes.get(asin)
+            if quote_data:
+                cogs[i] = quote_data[0] + quote_data[1]
+        units = np.array(
+            [t.get("estimated_monthly_units", 100) for t in time_data], dtype=np.float64
+        )
+
+        monthly_profit, _, risk_adjusted = self._economic_values(
+            _monthly_profit_values(amazon_price, cogs, units)
+        )
+        rank_score = risk_adjusted * np.take(_TIME_MULTIPLIERS, window_idx)
+
+        # === 5. RÉSULTATS (Decimal uniquement en sortie) ===
+        opportunities = []
+        bucket_rows = buckets.tolist()
+        for i, base_result in enumerate(base_results):
+            item_buckets = tuple(bucket_rows[i])
+            time_result = TimeMultiplierResult(
+                multiplier=float(multiplier[i]),
+                window=_WINDOWS[window_idx[i]],
+                window_days=_WINDOW_DAYS[window_idx[i]],
+                erosion_rate=float(erosion_rate[i]),
+                confidence=float(confidence[i]),
+                factors=_FACTOR_LABEL_SETS[item_buckets].copy(),
+                strong_factors=_STRONG_FACTOR_SETS[item_buckets],
+            )
+            item_monthly_profit = float(monthly_profit[i])
+            monthly_value, annual_value, risk_adjusted_value = self._as_decimal(
+                item_monthly_profit, float(risk_adjusted[i])
+            )
+            item_base_score = float(base_score[i])
+            events = economic_events[i] if economic_events else None
+
+            opportunities.append(EconomicOpportunity(
+                asin=asins[i],
+                base_score=item_base_score,
+                time_multiplier=time_result.multiplier,
+                final_score=int(final_score[i]),
+                estimated_monthly_profit=monthly_value,
+                estimated_annual_value=annual_value,
+                risk_adjusted_value=risk_adjusted_value,
+                window=time_result.window,
+                window_days=time_result.window_days,
+                urgency_label=time_result.urgency_label,
+                thesis=self._build_thesis(
+                    base_score=item_base_score,
+                    time_result=time_result,
+                    monthly_profit=item_monthly_profit,
+                    base_result=base_result,
+                ),
+                component_scores=base_result.component_scores,
+                economic_events=events or [],
+                rank_score=float(rank_score[i]),
+            ))
+
+        return opportunities
+
     def _build_thesis(
         self,
         base_score: float,
         time_result: TimeMultiplierResult,
-        monthly_profit: Decimal,
+        monthly_profit: float,
         base_result: ScoringResult,
     ) -> str:
         """Construit une thèse économique lisible."""
@@ -477,12 +958,8 @@ class EconomicScorer:
         parts.append(f"~${monthly_profit:.0f}/mois estimé")
 
         # Facteurs clés
-        strong_factors = [
-            k for k, v in time_result.factors.items()
-            if "+" in v
-        ]
-        if strong_factors:
-            parts.append(f"drivers: {', '.join(strong_factors)}")
+        if time_result.strong_factors:
+            parts.append(f"drivers: {', '.join(time_result.strong_factors)}")
 
         return " | ".join(parts)
 
@@ -501,13 +978,13 @@ class EconomicScorer:
         Returns:
             Liste ordonnée par rank_score décroissant
         """
-        # Filtrer les opportunités non viables
-        viable = [o for o in opportunities if o.final_score >= 40]
-
-        # Trier par rank_score
-        ranked = sorted(viable, key=lambda x: x.rank_score, reverse=True)
-
-        return ranked[:top_n]
+        # Filtrer les opportunités non viables et garder les top_n par rank_score
+        # (sélection partielle O(N log top_n), même ordre qu'un tri stable)
+        return heapq.nlargest(
+            top_n,
+            (o for o in opportunities if o.final_score >= 40),
+            key=attrgetter("rank_score"),
+        )
 
     def generate_shortlist(
         self,
@@ -529,23 +1006,24 @@ class EconomicScorer:
             Liste de dictionnaires formatés pour affichage
         """
         ranked = self.rank_opportunities(opportunities, top_n=max_items)
+        return [self._shortlist_entry(i, opp) for i, opp in enumerate(ranked, 1)]
 
-        shortlist = []
-        for i, opp in enumerate(ranked, 1):
-            shortlist.append({
-                "rank": i,
-                "asin": opp.asin,
-                "score": opp.final_score,
-                "window_days": opp.window_days,
-                "urgency": opp.urgency_label,
-                "annual_value": f"${opp.estimated_annual_value:,.0f}",
-                "risk_adjusted_value": f"${opp.risk_adjusted_value:,.0f}",
-                "thesis": opp.thesis,
-                "summary": (
-                    f"Score {opp.final_score} | "
-                    f"Fenêtre {opp.window_days}j | "
-                    f"${opp.risk_adjusted_value:,.0f}/an"
-                ),
-            })
-
-        return shortlist
+    @staticmethod
+    def _shortlist_entry(rank: int, opp: EconomicOpportunity) -> Dict[str, Any]:
+        """Entrée de shortlist; chaque montant n'est formaté qu'une fois."""
+        risk_adjusted = f"${opp.risk_adjusted_value:,.0f}"
+        return {
+            "rank": rank,
+            "asin": opp.asin,
+            "score": opp.final_score,
+            "window_days": opp.window_days,
+            "urgency": opp.urgency_label,
+            "annual_value": f"${opp.estimated_annual_value:,.0f}",
+            "risk_adjusted_value": risk_adjusted,
+            "thesis": opp.thesis,
+            "summary": (
+                f"Score {opp.final_score} | "
+                f"Fenêtre {opp.window_days}j | "
+                f"{risk_adjusted}/an"
+            ),
+        }
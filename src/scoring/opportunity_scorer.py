@@ -25,9 +25,27 @@ UTILISATION:
     print(result.explanation)  # Trace complète du calcul
 """
 
+from bisect import bisect_left
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Callable, Dict, List, Optional, Tuple, Any, Union
 from enum import Enum
+from operator import attrgetter, itemgetter
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit (bare or parametrized use)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
 
 from .scoring_config import ScoringConfig, DEFAULT_CONFIG
 
@@ -42,7 +60,7 @@ class OpportunityStatus(Enum):
     INVALID_NO_WINDOW = "invalid_no_window"  # time_pressure < 3
 
 
-@dataclass
+@dataclass(slots=True, init=False)
 class ComponentScore:
     """
     Score détaillé d'une composante.
@@ -51,12 +69,45 @@ class ComponentScore:
     - Le score final de la composante
     - Le détail par sous-composante
     - L'explication textuelle
+
+    explanation accepte un texte ou (fonction, arguments): le texte n'est
+    alors formaté qu'à la lecture de explanation. Un batch dont la plupart
+    des résultats sont filtrés ne formate ainsi jamais leurs explications.
     """
     name: str
     score: int
     max_score: int
     details: Dict[str, Any] = field(default_factory=dict)
-    explanation: str = ""
+    _explanation: Union[str, Tuple[Callable[..., str], Tuple[Any, ...]]] = field(
+        default="", repr=False,
+    )
+
+    def __init__(
+        self,
+        name: str,
+        score: int,
+        max_score: int,
+        details: Optional[Dict[str, Any]] = None,
+        explanation: Union[str, Tuple[Callable[..., str], Tuple[Any, ...]]] = "",
+    ):
+        self.name = name
+        self.score = score
+        self.max_score = max_score
+        self.details = {} if details is None else details
+        self._explanation = explanation
+
+    @property
+    def explanation(self) -> str:
+        """Explication textuelle de la composante."""
+        source = self._explanation
+        if isinstance(source, str):
+            return source
+        format_explanation, args = source
+        return format_explanation(*args)
+
+    @explanation.setter
+    def explanation(self, value: str) -> None:
+        self._explanation = value
 
     @property
     def percentage(self) -> float:
@@ -66,7 +117,7 @@ class ComponentScore:
         return round(self.score / self.max_score * 100, 1)
 
 
-@dataclass
+@dataclass(slots=True)
 class ScoringResult:
     """
     Résultat complet du scoring d'une opportunité.
@@ -75,6 +126,9 @@ class ScoringResult:
     1. Prendre une décision (is_valid, total_score, status)
     2. Comprendre le scoring (component_scores, explanation)
     3. Estimer la fenêtre d'action (window_estimate)
+
+    Sans __dict__ (slots), comme ComponentScore: un batch en alloue six
+    par produit.
     """
     product_id: str
     total_score: int
@@ -94,7 +148,7 @@ class ScoringResult:
     def get_explanation(self) -> str:
         """Génère l'explication complète du scoring."""
         lines = [
-            f"=== SCORING SMARTACUS ===",
+            "=== SCORING SMARTACUS ===",
             f"Produit: {self.product_id}",
             f"Score Total: {self.total_score}/{self.max_score} ({self.percentage}%)",
             f"Statut: {self.status.value.upper()}",
@@ -104,9 +158,11 @@ class ScoringResult:
             "--- DÉTAIL PAR COMPOSANTE ---",
         ]
 
-        for name, comp in self.component_scores.items():
-            lines.append(f"\n{name.upper()} ({comp.score}/{comp.max_score} - {comp.percentage}%):")
-            lines.append(comp.explanation)
+        lines.extend(
+            f"\n{name.upper()} ({comp.score}/{comp.max_score} - {comp.percentage}%):\n"
+            f"{comp.explanation}"
+            for name, comp in self.component_scores.items()
+        )
 
         if self.rejection_reason:
             lines.append(f"\n!!! REJET: {self.rejection_reason} !!!")
@@ -114,6 +170,374 @@ class ScoringResult:
         return "\n".join(lines)
 
 
+@dataclass(slots=True, frozen=True)
+class ProductFeatures:
+    """
+    Données produit typées, alternative au dict product_data de score().
+
+    Mêmes champs et mêmes défauts que les clés du dict; shipping_per_unit
+    None prend shipping_per_unit_mid de la config. Lu par un seul
+    attrgetter (_inputs), sans fusion avec les défauts.
+    """
+    product_id: str = "UNKNOWN"
+    amazon_price: float = 0
+    alibaba_price: float = 0
+    shipping_per_unit: Optional[float] = None
+    fba_fees: Optional[float] = None
+    bsr_current: int = 999999
+    bsr_delta_7d: float = 0
+    bsr_delta_30d: float = 0
+    reviews_per_month: int = 0
+    seller_count: int = 50
+    buybox_rotation: float = 0
+    review_gap_vs_top10: float = 1.0
+    has_amazon_basics: bool = False
+    has_brand_dominance: bool = False
+    negative_review_percent: float = 0
+    wish_mentions_per_100: int = 0
+    unanswered_questions: int = 0
+    has_recurring_problems: bool = False
+    stockout_count_90d: int = 0
+    price_trend_30d: float = 0
+    seller_churn_90d: int = 0
+    bsr_acceleration: float = 0
+
+
+# Entrée de score(): dict product_data ou ProductFeatures
+ProductInput = Union[Dict[str, Any], ProductFeatures]
+
+
+# =============================================================================
+# ENTRÉES ET ÉCHELLES DE SEUILS (scoring batch)
+# =============================================================================
+
+# Statut par niveau de l'échelle de statut (_determine_status), puis invalide
+_STATUS_LEVELS = (
+    OpportunityStatus.REJECTED,
+    OpportunityStatus.WEAK,
+    OpportunityStatus.MODERATE,
+    OpportunityStatus.STRONG,
+    OpportunityStatus.EXCEPTIONAL,
+    OpportunityStatus.INVALID_NO_WINDOW,
+)
+
+# Champs lus dans product_data, dans l'ordre des colonnes du batch
+_INPUT_FIELDS = (
+    "amazon_price", "alibaba_price", "shipping_per_unit", "fba_fees",
+    "bsr_current", "bsr_delta_7d", "bsr_delta_30d", "reviews_per_month",
+    "seller_count", "buybox_rotation", "review_gap_vs_top10",
+    "has_amazon_basics", "has_brand_dominance",
+    "negative_review_percent", "wish_mentions_per_100", "unanswered_questions",
+    "has_recurring_problems",
+    "stockout_count_90d", "price_trend_30d", "seller_churn_90d", "bsr_acceleration",
+)
+
+# Lecture des mêmes champs sur un ProductFeatures
+_FEATURES_GETTER = attrgetter(*_INPUT_FIELDS)
+
+# Champs booléens (évalués par leur valeur de vérité, comme dans score_*)
+_FLAG_FIELDS = frozenset({"has_amazon_basics", "has_brand_dominance", "has_recurring_problems"})
+
+# (nom du sous-score, section de config, attribut des seuils, comparaison)
+_LADDER_SPECS = (
+    ("margin", "margin", "thresholds", ">="),
+    ("bsr_absolute", "velocity", "bsr_thresholds", "<="),
+    ("bsr_delta_7d", "velocity", "bsr_delta_7d_thresholds", "<="),
+    ("bsr_delta_30d", "velocity", "bsr_delta_30d_thresholds", "<="),
+    ("reviews_velocity", "velocity", "reviews_per_month_thresholds", ">="),
+    ("seller_count", "competition", "seller_count_thresholds", "<="),
+    ("buybox_rotation", "competition", "buybox_rotation_thresholds", ">="),
+    ("review_gap", "competition", "review_gap_thresholds", "<="),
+    ("negative_reviews", "gap", "negative_reviews_thresholds", ">="),
+    ("wish_mentions", "gap", "wish_mentions_per_100_thresholds", ">="),
+    ("unanswered_questions", "gap", "unanswered_questions_thresholds", ">="),
+    ("stockout_frequency", "time_pressure", "stockout_frequency_thresholds", ">="),
+    ("price_trend", "time_pressure", "price_trend_thresholds", ">="),
+    ("seller_churn", "time_pressure", "seller_churn_thresholds", ">="),
+    ("bsr_acceleration", "time_pressure", "bsr_acceleration_thresholds", ">="),
+)
+
+
+# Valeur comparée à chaque échelle (ordre de _LADDER_SPECS): net_margin est
+# calculé, les autres sont des colonnes d'entrée
+_LADDER_INPUTS = (
+    "net_margin", "bsr_current", "bsr_delta_7d", "bsr_delta_30d", "reviews_per_month",
+    "seller_count", "buybox_rotation", "review_gap_vs_top10", "negative_review_percent",
+    "wish_mentions_per_100", "unanswered_questions", "stockout_count_90d", "price_trend_30d",
+    "seller_churn_90d", "bsr_acceleration",
+)
+
+
+def _ladder_arrays(
+    thresholds: Tuple[Tuple[float, int], ...],
+    comparison: str,
+) -> Tuple[np.ndarray, np.ndarray, float]:
+    """
+    Convertit une échelle (seuil, points) en tableaux pour np.searchsorted.
+
+    La boucle "premier palier tel que valeur <= seuil" devient une recherche
+    dans des clés croissantes. Pour une échelle ">=", seuils et valeur sont
+    négés (valeur >= seuil ⇔ -valeur <= -seuil). Un palier masqué par un
+    palier précédent n'est jamais atteint: il est ignoré.
+
+    Returns:
+        (clés, points, signe): points[np.searchsorted(clés, signe * valeur)]
+        donne les points de la boucle. Le dernier élément de points est le
+        défaut 0 (aucun palier atteint, NaN compris).
+    """
+    sign = 1.0 if comparison == "<=" else -1.0
+    keys: List[float] = []
+    points: List[int] = []
+    for threshold, pts in thresholds:
+        key = sign * threshold
+        if not keys or key > keys[-1]:
+            keys.append(key)
+            points.append(pts)
+    points.append(0)
+    return np.array(keys, dtype=np.float64), np.array(points, dtype=np.int64), sign
+
+
+def _product_id(product_data: ProductInput) -> str:
+    """Identifiant produit d'un dict product_data ou d'un ProductFeatures."""
+    if isinstance(product_data, ProductFeatures):
+        return product_data.product_id
+    return product_data.get("product_id", "UNKNOWN")
+
+
+def _products_to_soa(rows: List[Tuple[Any, ...]]) -> Dict[str, np.ndarray]:
+    """
+    Transpose les entrées produit (une ligne par produit) en colonnes NumPy.
+
+    Args:
+        rows: Tuples alignés sur _INPUT_FIELDS (voir OpportunityScorer._inputs)
+
+    Returns:
+        Dict champ → np.ndarray (float64, bool pour les drapeaux). fba_fees
+        absent (None) vaut NaN, repéré par la colonne "fba_fees_missing".
+    """
+    n = len(rows)
+    soa: Dict[str, np.ndarray] = {}
+    for name, values in zip(_INPUT_FIELDS, zip(*rows)):
+        if name in _FLAG_FIELDS:
+            soa[name] = np.fromiter(map(bool, values), dtype=bool, count=n)
+        elif name == "fba_fees":
+            soa["fba_fees_missing"] = np.fromiter((v is None for v in values), dtype=bool, count=n)
+            soa[name] = np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+        else:
+            soa[name] = np.fromiter(values, dtype=np.float64, count=n)
+    return soa
+
+
+# Colonnes d'une ligne du noyau compilé: entrées + drapeau fba_fees absent
+_KERNEL_FIELDS = _INPUT_FIELDS + ("fba_fees_missing",)
+
+# Index des colonnes de _KERNEL_FIELDS lues par _score_row
+_X_AMAZON_PRICE = _KERNEL_FIELDS.index("amazon_price")
+_X_ALIBABA_PRICE = _KERNEL_FIELDS.index("alibaba_price")
+_X_SHIPPING = _KERNEL_FIELDS.index("shipping_per_unit")
+_X_FBA_FEES = _KERNEL_FIELDS.index("fba_fees")
+_X_FBA_FEES_MISSING = _KERNEL_FIELDS.index("fba_fees_missing")
+_X_BSR_CURRENT = _KERNEL_FIELDS.index("bsr_current")
+_X_BSR_DELTA_7D = _KERNEL_FIELDS.index("bsr_delta_7d")
+_X_BSR_DELTA_30D = _KERNEL_FIELDS.index("bsr_delta_30d")
+_X_REVIEWS_PER_MONTH = _KERNEL_FIELDS.index("reviews_per_month")
+_X_SELLER_COUNT = _KERNEL_FIELDS.index("seller_count")
+_X_BUYBOX_ROTATION = _KERNEL_FIELDS.index("buybox_rotation")
+_X_REVIEW_GAP = _KERNEL_FIELDS.index("review_gap_vs_top10")
+_X_HAS_AMAZON_BASICS = _KERNEL_FIELDS.index("has_amazon_basics")
+_X_HAS_BRAND_DOMINANCE = _KERNEL_FIELDS.index("has_brand_dominance")
+_X_NEGATIVE_PERCENT = _KERNEL_FIELDS.index("negative_review_percent")
+_X_WISH_MENTIONS = _KERNEL_FIELDS.index("wish_mentions_per_100")
+_X_UNANSWERED = _KERNEL_FIELDS.index("unanswered_questions")
+_X_HAS_RECURRING = _KERNEL_FIELDS.index("has_recurring_problems")
+_X_STOCKOUT_COUNT = _KERNEL_FIELDS.index("stockout_count_90d")
+_X_PRICE_TREND = _KERNEL_FIELDS.index("price_trend_30d")
+_X_SELLER_CHURN = _KERNEL_FIELDS.index("seller_churn_90d")
+_X_BSR_ACCELERATION = _KERNEL_FIELDS.index("bsr_acceleration")
+
+# Valeurs calculées par produit (colonnes de la ligne écrite par _score_row)
+_VALUE_FIELDS = (
+    "fba_fees", "referral_fee", "provisions", "total_cost", "net_margin", "margin",
+    "bsr_absolute", "bsr_delta_7d", "bsr_delta_30d", "reviews_velocity",
+    "is_stagnant", "stagnant_penalty", "velocity",
+    "seller_count", "buybox_rotation", "review_gap", "bonus", "competition",
+    "negative_reviews", "wish_mentions", "unanswered_questions", "gap",
+    "stockout_frequency", "price_trend", "seller_churn", "bsr_acceleration", "time_pressure",
+)
+_N_VALUES = len(_VALUE_FIELDS)
+
+# Index des colonnes de _VALUE_FIELDS écrites par _score_row
+_V_FBA_FEES = _VALUE_FIELDS.index("fba_fees")
+_V_REFERRAL_FEE = _VALUE_FIELDS.index("referral_fee")
+_V_PROVISIONS = _VALUE_FIELDS.index("provisions")
+_V_TOTAL_COST = _VALUE_FIELDS.index("total_cost")
+_V_NET_MARGIN = _VALUE_FIELDS.index("net_margin")
+_V_MARGIN = _VALUE_FIELDS.index("margin")
+_V_BSR_ABSOLUTE = _VALUE_FIELDS.index("bsr_absolute")
+_V_BSR_DELTA_7D = _VALUE_FIELDS.index("bsr_delta_7d")
+_V_BSR_DELTA_30D = _VALUE_FIELDS.index("bsr_delta_30d")
+_V_REVIEWS_VELOCITY = _VALUE_FIELDS.index("reviews_velocity")
+_V_IS_STAGNANT = _VALUE_FIELDS.index("is_stagnant")
+_V_STAGNANT_PENALTY = _VALUE_FIELDS.index("stagnant_penalty")
+_V_VELOCITY = _VALUE_FIELDS.index("velocity")
+_V_SELLER_COUNT = _VALUE_FIELDS.index("seller_count")
+_V_BUYBOX_ROTATION = _VALUE_FIELDS.index("buybox_rotation")
+_V_REVIEW_GAP = _VALUE_FIELDS.index("review_gap")
+_V_BONUS = _VALUE_FIELDS.index("bonus")
+_V_COMPETITION = _VALUE_FIELDS.index("competition")
+_V_NEGATIVE_REVIEWS = _VALUE_FIELDS.index("negative_reviews")
+_V_WISH_MENTIONS = _VALUE_FIELDS.index("wish_mentions")
+_V_UNANSWERED_QUESTIONS = _VALUE_FIELDS.index("unanswered_questions")
+_V_GAP = _VALUE_FIELDS.index("gap")
+_V_STOCKOUT_FREQUENCY = _VALUE_FIELDS.index("stockout_frequency")
+_V_PRICE_TREND = _VALUE_FIELDS.index("price_trend")
+_V_SELLER_CHURN = _VALUE_FIELDS.index("seller_churn")
+_V_BSR_ACCELERATION = _VALUE_FIELDS.index("bsr_acceleration")
+_V_TIME_PRESSURE = _VALUE_FIELDS.index("time_pressure")
+
+# Type de chaque colonne de valeurs hors noyau: montants en float,
+# is_stagnant booléen, points entiers (la ligne du noyau est tout en float64)
+_FLOAT_VALUE_FIELDS = frozenset({"fba_fees", "referral_fee", "provisions", "total_cost", "net_margin"})
+_VALUE_TYPES = tuple(
+    float if name in _FLOAT_VALUE_FIELDS else bool if name == "is_stagnant" else int
+    for name in _VALUE_FIELDS
+)
+
+
+@njit(cache=True)
+def _ladder_scan(value, keys, points, signs, row):
+    """Points du premier palier atteint sur la ligne row des tables (défaut en fin de ligne)."""
+    x = signs[row] * value
+    for j in range(keys.shape[1]):
+        if x <= keys[row, j]:
+            return points[row, j]
+    return points[row, keys.shape[1]]
+
+
+@njit(cache=True)
+def _score_row(x, keys, points, signs, params, out):
+    """
+    Noyau numérique d'un produit: les cinq composantes en une passe.
+
+    x suit _KERNEL_FIELDS, les lignes des tables suivent _LADDER_SPECS et
+    params est OpportunityScorer._kernel_params. Écrit dans out (float64,
+    len(_VALUE_FIELDS)) les valeurs alignées sur _VALUE_FIELDS. Compilé par
+    numba quand il est installé; sans fastmath, les flottants sont
+    identiques à ceux de score_margin.
+    """
+    (fba_fee_percent, fba_fee_minimum, referral_percent, return_rate, ppc_percent,
+     storage_provision, stagnant_penalty_points, velocity_max, no_brand_bonus,
+     amazon_basics_penalty, competition_max, recurring_multiplier, gap_max,
+     time_pressure_max) = (
+        params[0], params[1], params[2], params[3], params[4], params[5], params[6],
+        params[7], params[8], params[9], params[10], params[11], params[12], params[13],
+    )
+
+    # MARGIN
+    amazon_price = x[_X_AMAZON_PRICE]
+    if x[_X_FBA_FEES_MISSING] != 0.0:
+        fba_fees = amazon_price * fba_fee_percent
+        if fba_fee_minimum > fba_fees:
+            fba_fees = fba_fee_minimum
+    else:
+        fba_fees = x[_X_FBA_FEES]
+    referral_fee = amazon_price * referral_percent
+    return_provision = amazon_price * return_rate
+    ppc_provision = amazon_price * ppc_percent
+    total_cost = (
+        x[_X_ALIBABA_PRICE] + x[_X_SHIPPING] +
+        fba_fees +
+        referral_fee +
+        return_provision +
+        ppc_provision +
+        storage_provision
+    )
+    if amazon_price <= 0:
+        net_margin = 0.0
+    else:
+        net_margin = (amazon_price - total_cost) / amazon_price
+    margin = _ladder_scan(net_margin, keys, points, signs, 0)
+    out[_V_FBA_FEES] = fba_fees
+    out[_V_REFERRAL_FEE] = referral_fee
+    out[_V_PROVISIONS] = return_provision + ppc_provision + storage_provision
+    out[_V_TOTAL_COST] = total_cost
+    out[_V_NET_MARGIN] = net_margin
+    out[_V_MARGIN] = margin
+
+    # VELOCITY
+    bsr_delta_7d = x[_X_BSR_DELTA_7D]
+    bsr_delta_30d = x[_X_BSR_DELTA_30D]
+    reviews_per_month = x[_X_REVIEWS_PER_MONTH]
+    bsr_score = _ladder_scan(x[_X_BSR_CURRENT], keys, points, signs, 1)
+    delta_7d_score = _ladder_scan(bsr_delta_7d, keys, points, signs, 2)
+    delta_30d_score = _ladder_scan(bsr_delta_30d, keys, points, signs, 3)
+    reviews_score = _ladder_scan(reviews_per_month, keys, points, signs, 4)
+    is_stagnant = abs(bsr_delta_7d) < 0.05 and abs(bsr_delta_30d) < 0.10 and reviews_per_month < 5
+    stagnant_penalty = int(stagnant_penalty_points) if is_stagnant else 0
+    velocity = bsr_score + delta_7d_score + delta_30d_score + reviews_score + stagnant_penalty
+    out[_V_BSR_ABSOLUTE] = bsr_score
+    out[_V_BSR_DELTA_7D] = delta_7d_score
+    out[_V_BSR_DELTA_30D] = delta_30d_score
+    out[_V_REVIEWS_VELOCITY] = reviews_score
+    out[_V_IS_STAGNANT] = is_stagnant
+    out[_V_STAGNANT_PENALTY] = stagnant_penalty
+    out[_V_VELOCITY] = max(0, min(velocity, int(velocity_max)))
+
+    # COMPETITION
+    seller_score = _ladder_scan(x[_X_SELLER_COUNT], keys, points, signs, 5)
+    buybox_score = _ladder_scan(x[_X_BUYBOX_ROTATION], keys, points, signs, 6)
+    gap_score = _ladder_scan(x[_X_REVIEW_GAP], keys, points, signs, 7)
+    bonus = 0
+    if x[_X_HAS_BRAND_DOMINANCE] == 0.0:
+        bonus += int(no_brand_bonus)
+    if x[_X_HAS_AMAZON_BASICS] != 0.0:
+        bonus += int(amazon_basics_penalty)
+    out[_V_SELLER_COUNT] = seller_score
+    out[_V_BUYBOX_ROTATION] = buybox_score
+    out[_V_REVIEW_GAP] = gap_score
+    out[_V_BONUS] = bonus
+    out[_V_COMPETITION] = max(0, min(seller_score + buybox_score + gap_score + bonus, int(competition_max)))
+
+    # GAP
+    negative_score = _ladder_scan(x[_X_NEGATIVE_PERCENT], keys, points, signs, 8)
+    wish_score = _ladder_scan(x[_X_WISH_MENTIONS], keys, points, signs, 9)
+    questions_score = _ladder_scan(x[_X_UNANSWERED], keys, points, signs, 10)
+    gap = negative_score + wish_score + questions_score
+    if x[_X_HAS_RECURRING] != 0.0:
+        gap = int(gap * recurring_multiplier)
+    out[_V_NEGATIVE_REVIEWS] = negative_score
+    out[_V_WISH_MENTIONS] = wish_score
+    out[_V_UNANSWERED_QUESTIONS] = questions_score
+    out[_V_GAP] = max(0, min(gap, int(gap_max)))
+
+    # TIME_PRESSURE
+    stockout_score = _ladder_scan(x[_X_STOCKOUT_COUNT], keys, points, signs, 11)
+    price_score = _ladder_scan(x[_X_PRICE_TREND], keys, points, signs, 12)
+    churn_score = _ladder_scan(x[_X_SELLER_CHURN], keys, points, signs, 13)
+    acceleration_score = _ladder_scan(x[_X_BSR_ACCELERATION], keys, points, signs, 14)
+    time_pressure = stockout_score + price_score + churn_score + acceleration_score
+    out[_V_STOCKOUT_FREQUENCY] = stockout_score
+    out[_V_PRICE_TREND] = price_score
+    out[_V_SELLER_CHURN] = churn_score
+    out[_V_BSR_ACCELERATION] = acceleration_score
+    out[_V_TIME_PRESSURE] = max(0, min(time_pressure, int(time_pressure_max)))
+
+
+@njit(parallel=True, cache=True)
+def _score_batch_core(X, keys, points, signs, params):
+    """
+    _score_row sur chaque ligne de X (N × len(_KERNEL_FIELDS)), en parallèle.
+
+    Les produits sont indépendants: numba répartit la boucle prange sur
+    tous les cœurs, hors GIL. Renvoie une matrice N × len(_VALUE_FIELDS).
+    """
+    n = X.shape[0]
+    out = np.empty((n, _N_VALUES), dtype=np.float64)
+    for i in prange(n):
+        _score_row(X[i], keys, points, signs, params, out[i])
+    return out
+
+
 class OpportunityScorer:
     """
     Scorer d'opportunités Amazon - 100% déterministe.
@@ -129,6 +553,10 @@ class OpportunityScorer:
     Si time_pressure < 3 → opportunité INVALIDE (rejet automatique)
     """
 
+    # Nombre max de produits dont les valeurs numériques sont gardées en
+    # cache par score() (re-scoring d'un catalogue en grande partie inchangé)
+    SCORE_CACHE_SIZE = 16384
+
     def __init__(self, config: Optional[ScoringConfig] = None):
         """
         Initialise le scorer avec une configuration.
@@ -139,16 +567,114 @@ class OpportunityScorer:
         self.config = config or DEFAULT_CONFIG
         self.config.validate()
 
+        # entrées produit (_inputs) -> valeurs alignées sur _VALUE_FIELDS
+        self._values_cache: "OrderedDict[Tuple, Tuple]" = OrderedDict()
+
+        # Valeurs par défaut des champs absents (mêmes défauts que score_*)
+        self._input_defaults: Dict[str, Any] = {
+            "amazon_price": 0,
+            "alibaba_price": 0,
+            "shipping_per_unit": self.config.margin.shipping_per_unit_mid,
+            "fba_fees": None,
+            "bsr_current": 999999,
+            "bsr_delta_7d": 0,
+            "bsr_delta_30d": 0,
+            "reviews_per_month": 0,
+            "seller_count": 50,
+            "buybox_rotation": 0,
+            "review_gap_vs_top10": 1.0,
+            "has_amazon_basics": False,
+            "has_brand_dominance": False,
+            "negative_review_percent": 0,
+            "wish_mentions_per_100": 0,
+            "unanswered_questions": 0,
+            "has_recurring_problems": False,
+            "stockout_count_90d": 0,
+            "price_trend_30d": 0,
+            "seller_churn_90d": 0,
+            "bsr_acceleration": 0,
+        }
+        self._input_getter = itemgetter(*self._input_defaults)
+
+        # Échelles de seuils précompilées pour le scoring vectorisé
+        self._ladders: Dict[str, Tuple[np.ndarray, np.ndarray, float]] = {
+            name: _ladder_arrays(getattr(getattr(self.config, section), attr), comparison)
+            for name, section, attr, comparison in _LADDER_SPECS
+        }
+
+        # Mêmes échelles en listes Python pour le scoring produit par produit
+        # (bisect sur une liste évite les scalaires NumPy)
+        self._scalar_ladders: Dict[str, Tuple[List[float], List[int], bool]] = {
+            name: (keys.tolist(), points.tolist(), sign < 0)
+            for name, (keys, points, sign) in self._ladders.items()
+        }
+
+        # Mêmes échelles empaquetées en une table (noyau compilé _score_row
+        # et batch NumPy): une ligne par échelle, complétée par +inf (palier
+        # de 0 point). float64: les seuils ne sont pas arrondis
+        width = max(len(keys) for keys, _, _ in self._ladders.values())
+        self._kernel_keys = np.full((len(_LADDER_SPECS), width), np.inf)
+        self._kernel_points = np.zeros((len(_LADDER_SPECS), width + 1), dtype=np.int64)
+        self._kernel_signs = np.empty(len(_LADDER_SPECS))
+        for row, (keys, points, sign) in enumerate(self._ladders.values()):
+            self._kernel_keys[row, :len(keys)] = keys
+            self._kernel_points[row, :len(points)] = points
+            self._kernel_signs[row] = sign
+
+        cfg = self.config
+        self._kernel_params = np.array([
+            cfg.margin.fba_fee_percent,
+            cfg.margin.fba_fee_minimum,
+            cfg.margin.amazon_referral_percent,
+            cfg.margin.return_rate,
+            cfg.margin.ppc_percent_of_revenue,
+            cfg.margin.storage_monthly_per_unit * 2,
+            cfg.velocity.stagnant_penalty,
+            cfg.velocity.max_points,
+            cfg.competition.no_brand_dominance_bonus,
+            cfg.competition.amazon_basics_penalty,
+            cfg.competition.max_points,
+            cfg.gap.recurring_problem_multiplier,
+            cfg.gap.max_points,
+            cfg.time_pressure.max_points,
+        ], dtype=np.float64)
+
+        # Statuts par score total, en échelle comme les seuils des composantes
+        # (premier seuil atteint, dans l'ordre de _determine_status)
+        thresholds = self.config.score_thresholds
+        self._status_ladder = _ladder_arrays(
+            tuple(
+                (thresholds[name][0], level)
+                for level, name in ((4, "exceptional"), (3, "strong"), (2, "moderate"), (1, "weak"))
+            ),
+            ">=",
+        )
+
+        # Fenêtre de chaque score time_pressure possible (0..max_points),
+        # indexée par le score: estimate_window sans parcours des fenêtres
+        self._window_table: Tuple[Tuple[str, int], ...] = tuple(
+            self._scan_windows(score)
+            for score in range(self.config.time_pressure.max_points + 1)
+        )
+
+        # Constantes de config lues à chaque score() (assemblage du résultat)
+        self._minimum_valid = self.config.time_pressure.minimum_valid
+        self._max_total_score = self.config.max_total_score
+        self._status_cutoffs = tuple(
+            thresholds[name][0] for name in ("exceptional", "strong", "moderate", "weak")
+        )
+
     # =========================================================================
     # MÉTHODE PRINCIPALE
     # =========================================================================
 
-    def score(self, product_data: Dict[str, Any]) -> ScoringResult:
+    def score(self, product_data: ProductInput) -> ScoringResult:
         """
         Calcule le score complet d'une opportunité.
 
         Args:
-            product_data: Dictionnaire contenant toutes les données produit.
+            product_data: Dictionnaire contenant toutes les données produit
+                (ou ProductFeatures avec les mêmes champs).
                 Clés attendues:
                 - product_id: str
                 - amazon_price: float
@@ -173,15 +699,67 @@ class OpportunityScorer:
         Returns:
             ScoringResult avec le détail complet du scoring.
         """
-        product_id = product_data.get("product_id", "UNKNOWN")
+        inputs = self._inputs(product_data)
+        return self._result_from_values(
+            _product_id(product_data), inputs, self._cached_values(inputs),
+        )
+
+    def _cached_values(self, inputs: Tuple[Any, ...]) -> Tuple[Any, ...]:
+        """
+        Valeurs numériques d'un produit via un cache LRU par scorer.
+
+        Le scoring est pur: des entrées identiques donnent les mêmes valeurs.
+        Les entrées non hashables contournent le cache.
+        """
+        cache = self._values_cache
+        try:
+            values = cache.get(inputs)
+        except TypeError:
+            return self._compute_values(inputs)
+        if values is not None:
+            cache.move_to_end(inputs)
+            return values
+
+        values = self._compute_values(inputs)
+        cache[inputs] = values
+        if len(cache) > self.SCORE_CACHE_SIZE:
+            cache.popitem(last=False)
+        return values
+
+    def _compute_values(self, inputs: Tuple[Any, ...]) -> Tuple[Any, ...]:
+        """Valeurs alignées sur _VALUE_FIELDS, calculées par les méthodes _X_values."""
+        (amazon_price, alibaba_price, shipping, fba_fees, bsr_current, bsr_delta_7d,
+         bsr_delta_30d, reviews_per_month, seller_count, buybox_rotation, review_gap,
+         has_amazon_basics, has_brand_dominance, negative_percent, wish_mentions,
+         unanswered, has_recurring_problems, stockout_count, price_trend,
+         seller_churn, bsr_acceleration) = inputs
+        return (
+            self._margin_values(amazon_price, alibaba_price, shipping, fba_fees) +
+            self._velocity_values(bsr_current, bsr_delta_7d, bsr_delta_30d, reviews_per_month) +
+            self._competition_values(
+                seller_count, buybox_rotation, review_gap, has_amazon_basics, has_brand_dominance,
+            ) +
+            self._gap_values(negative_percent, wish_mentions, unanswered, has_recurring_problems) +
+            self._time_pressure_values(stockout_count, price_trend, seller_churn, bsr_acceleration)
+        )
 
-        # Calculer chaque composante
-        margin_score = self.score_margin(product_data)
-        velocity_score = self.score_velocity(product_data)
-        competition_score = self.score_competition(product_data)
-        gap_score = self.score_gap(product_data)
-        time_pressure_score = self.score_time_pressure(product_data)
+    def _assemble(
+        self,
+        product_id: str,
+        margin_score: ComponentScore,
+        velocity_score: ComponentScore,
+        competition_score: ComponentScore,
+        gap_score: ComponentScore,
+        time_pressure_score: ComponentScore,
+        status: Optional[OpportunityStatus] = None,
+        window: Optional[Tuple[str, int]] = None,
+    ) -> ScoringResult:
+        """
+        Agrège les cinq composantes: règle critique, statut et fenêtre.
 
+        status et window, s'ils sont fournis, sont ceux déjà calculés pour
+        tout le batch (_batch_statuses, _window_table).
+        """
         # Agréger les scores
         component_scores = {
             "margin": margin_score,
@@ -191,29 +769,35 @@ class OpportunityScorer:
             "time_pressure": time_pressure_score,
         }
 
-        total_score = sum(c.score for c in component_scores.values())
+        total_score = (
+            margin_score.score + velocity_score.score + competition_score.score +
+            gap_score.score + time_pressure_score.score
+        )
 
         # RÈGLE CRITIQUE: Vérifier time_pressure
-        is_valid = time_pressure_score.score >= self.config.time_pressure.minimum_valid
+        is_valid = time_pressure_score.score >= self._minimum_valid
         rejection_reason = None
 
         if not is_valid:
             rejection_reason = (
                 f"Time Pressure ({time_pressure_score.score}) < seuil minimum "
-                f"({self.config.time_pressure.minimum_valid}). "
+                f"({self._minimum_valid}). "
                 f"Pas de fenêtre d'action identifiée."
             )
 
         # Déterminer le statut
-        status = self._determine_status(total_score, is_valid)
+        if status is None:
+            status = self._determine_status(total_score, is_valid)
 
         # Estimer la fenêtre
-        window_estimate, window_days = self.estimate_window(time_pressure_score.score)
+        if window is None:
+            window = self._window_table[time_pressure_score.score]
+        window_estimate, window_days = window
 
         return ScoringResult(
             product_id=product_id,
             total_score=total_score,
-            max_score=self.config.max_total_score,
+            max_score=self._max_total_score,
             status=status,
             is_valid=is_valid,
             window_estimate=window_estimate,
@@ -247,6 +831,21 @@ class OpportunityScorer:
         shipping = product_data.get("shipping_per_unit", cfg.shipping_per_unit_mid)
         fba_fees = product_data.get("fba_fees")
 
+        return self._margin_component(
+            amazon_price, alibaba_price, shipping,
+            *self._margin_values(amazon_price, alibaba_price, shipping, fba_fees),
+        )
+
+    def _margin_values(
+        self,
+        amazon_price: float,
+        alibaba_price: float,
+        shipping: float,
+        fba_fees: Optional[float],
+    ) -> Tuple[float, float, float, float, float, int]:
+        """Calcul MARGIN: (fba_fees, referral_fee, provisions, total_cost, net_margin, score)."""
+        cfg = self.config.margin
+
         # Estimer FBA fees si non fourni
         if fba_fees is None:
             fba_fees = max(
@@ -279,37 +878,70 @@ class OpportunityScorer:
             net_margin = (amazon_price - total_cost) / amazon_price
 
         # Appliquer les seuils
-        score = 0
-        for threshold, points in cfg.thresholds:
-            if net_margin >= threshold:
-                score = points
-                break
-
-        # Construire l'explication
-        explanation = (
-            f"  Prix Amazon: ${amazon_price:.2f}\n"
-            f"  Prix Alibaba: ${alibaba_price:.2f}\n"
-            f"  Shipping/unité: ${shipping:.2f}\n"
-            f"  FBA fees: ${fba_fees:.2f}\n"
-            f"  Referral (15%): ${referral_fee:.2f}\n"
-            f"  Provisions (retours, PPC, stock): ${return_provision + ppc_provision + storage_provision:.2f}\n"
-            f"  ---\n"
-            f"  Coût total: ${total_cost:.2f}\n"
-            f"  Marge nette: {net_margin*100:.1f}%\n"
-            f"  → Score: {score}/{cfg.max_points}"
+        score = self._ladder_score("margin", net_margin)
+
+        return (
+            fba_fees, referral_fee,
+            return_provision + ppc_provision + storage_provision,
+            total_cost, net_margin, score,
         )
 
+    def _margin_component(
+        self,
+        amazon_price: float,
+        alibaba_price: float,
+        shipping: float,
+        fba_fees: float,
+        referral_fee: float,
+        provisions: float,
+        total_cost: float,
+        net_margin: float,
+        score: int,
+    ) -> ComponentScore:
+        """Construit le ComponentScore MARGIN (détails, explication différée)."""
+        max_points = self.config.margin.max_points
+
         return ComponentScore(
             name="margin",
             score=score,
-            max_score=cfg.max_points,
+            max_score=max_points,
             details={
                 "amazon_price": amazon_price,
                 "total_cost": total_cost,
                 "net_margin": net_margin,
                 "net_margin_percent": round(net_margin * 100, 1),
             },
-            explanation=explanation,
+            explanation=(self._margin_explanation, (
+                amazon_price, alibaba_price, shipping, fba_fees, referral_fee, provisions,
+                total_cost, net_margin, score, max_points,
+            )),
+        )
+
+    @staticmethod
+    def _margin_explanation(
+        amazon_price: float,
+        alibaba_price: float,
+        shipping: float,
+        fba_fees: float,
+        referral_fee: float,
+        provisions: float,
+        total_cost: float,
+        net_margin: float,
+        score: int,
+        max_points: int,
+    ) -> str:
+        """Texte de l'explication MARGIN (formaté à la demande)."""
+        return (
+            f"  Prix Amazon: ${amazon_price:.2f}\n"
+            f"  Prix Alibaba: ${alibaba_price:.2f}\n"
+            f"  Shipping/unité: ${shipping:.2f}\n"
+            f"  FBA fees: ${fba_fees:.2f}\n"
+            f"  Referral (15%): ${referral_fee:.2f}\n"
+            f"  Provisions (retours, PPC, stock): ${provisions:.2f}\n"
+            f"  ---\n"
+            f"  Coût total: ${total_cost:.2f}\n"
+            f"  Marge nette: {net_margin*100:.1f}%\n"
+            f"  → Score: {score}/{max_points}"
         )
 
     # =========================================================================
@@ -335,41 +967,38 @@ class OpportunityScorer:
         Le momentum est crucial: mieux vaut un BSR moyen en amélioration
         qu'un bon BSR en déclin.
         """
-        cfg = self.config.velocity
-
         # Extraire les données
         bsr_current = product_data.get("bsr_current", 999999)
         bsr_delta_7d = product_data.get("bsr_delta_7d", 0)  # % variation
         bsr_delta_30d = product_data.get("bsr_delta_30d", 0)  # % variation
         reviews_per_month = product_data.get("reviews_per_month", 0)
 
+        return self._velocity_component(
+            bsr_current, bsr_delta_7d, bsr_delta_30d, reviews_per_month,
+            *self._velocity_values(bsr_current, bsr_delta_7d, bsr_delta_30d, reviews_per_month),
+        )
+
+    def _velocity_values(
+        self,
+        bsr_current: int,
+        bsr_delta_7d: float,
+        bsr_delta_30d: float,
+        reviews_per_month: int,
+    ) -> Tuple[int, int, int, int, bool, int, int]:
+        """Calcul VELOCITY: (sous-scores BSR/deltas/reviews, is_stagnant, pénalité, score)."""
+        cfg = self.config.velocity
+
         # Score BSR absolu
-        bsr_score = 0
-        for threshold, points in cfg.bsr_thresholds:
-            if bsr_current <= threshold:
-                bsr_score = points
-                break
+        bsr_score = self._ladder_score("bsr_absolute", bsr_current)
 
         # Score BSR delta 7j
-        delta_7d_score = 0
-        for threshold, points in cfg.bsr_delta_7d_thresholds:
-            if bsr_delta_7d <= threshold:
-                delta_7d_score = points
-                break
+        delta_7d_score = self._ladder_score("bsr_delta_7d", bsr_delta_7d)
 
         # Score BSR delta 30j
-        delta_30d_score = 0
-        for threshold, points in cfg.bsr_delta_30d_thresholds:
-            if bsr_delta_30d <= threshold:
-                delta_30d_score = points
-                break
+        delta_30d_score = self._ladder_score("bsr_delta_30d", bsr_delta_30d)
 
         # Score reviews velocity
-        reviews_score = 0
-        for threshold, points in cfg.reviews_per_month_thresholds:
-            if reviews_per_month >= threshold:
-                reviews_score = points
-                break
+        reviews_score = self._ladder_score("reviews_velocity", reviews_per_month)
 
         # Pénalité produit stagnant
         # Stagnant = BSR stable (±5%) ET reviews faibles (<5/mois)
@@ -384,22 +1013,35 @@ class OpportunityScorer:
 
         # Score total
         raw_score = bsr_score + delta_7d_score + delta_30d_score + reviews_score + stagnant_penalty
-        score = max(0, min(raw_score, cfg.max_points))
+        max_points = cfg.max_points
+        score = 0 if raw_score < 0 else (max_points if raw_score > max_points else raw_score)
 
-        # Explication
-        explanation = (
-            f"  BSR actuel: {bsr_current:,} → {bsr_score} pts\n"
-            f"  BSR delta 7j: {bsr_delta_7d*100:+.1f}% → {delta_7d_score} pts\n"
-            f"  BSR delta 30j: {bsr_delta_30d*100:+.1f}% → {delta_30d_score} pts\n"
-            f"  Reviews/mois: {reviews_per_month} → {reviews_score} pts\n"
-            f"  Stagnant: {'OUI' if is_stagnant else 'NON'} → {stagnant_penalty} pts\n"
-            f"  → Score: {score}/{cfg.max_points}"
+        return (
+            bsr_score, delta_7d_score, delta_30d_score, reviews_score,
+            is_stagnant, stagnant_penalty, score,
         )
 
+    def _velocity_component(
+        self,
+        bsr_current: int,
+        bsr_delta_7d: float,
+        bsr_delta_30d: float,
+        reviews_per_month: int,
+        bsr_score: int,
+        delta_7d_score: int,
+        delta_30d_score: int,
+        reviews_score: int,
+        is_stagnant: bool,
+        stagnant_penalty: int,
+        score: int,
+    ) -> ComponentScore:
+        """Construit le ComponentScore VELOCITY (détails, explication différée)."""
+        max_points = self.config.velocity.max_points
+
         return ComponentScore(
             name="velocity",
             score=score,
-            max_score=cfg.max_points,
+            max_score=max_points,
             details={
                 "bsr_current": bsr_current,
                 "bsr_delta_7d": bsr_delta_7d,
@@ -414,7 +1056,36 @@ class OpportunityScorer:
                     "stagnant_penalty": stagnant_penalty,
                 }
             },
-            explanation=explanation,
+            explanation=(self._velocity_explanation, (
+                bsr_current, bsr_delta_7d, bsr_delta_30d, reviews_per_month, bsr_score,
+                delta_7d_score, delta_30d_score, reviews_score, is_stagnant, stagnant_penalty,
+                score, max_points,
+            )),
+        )
+
+    @staticmethod
+    def _velocity_explanation(
+        bsr_current: int,
+        bsr_delta_7d: float,
+        bsr_delta_30d: float,
+        reviews_per_month: int,
+        bsr_score: int,
+        delta_7d_score: int,
+        delta_30d_score: int,
+        reviews_score: int,
+        is_stagnant: bool,
+        stagnant_penalty: int,
+        score: int,
+        max_points: int,
+    ) -> str:
+        """Texte de l'explication VELOCITY (formaté à la demande)."""
+        return (
+            f"  BSR actuel: {bsr_current:,} → {bsr_score} pts\n"
+            f"  BSR delta 7j: {bsr_delta_7d*100:+.1f}% → {delta_7d_score} pts\n"
+            f"  BSR delta 30j: {bsr_delta_30d*100:+.1f}% → {delta_30d_score} pts\n"
+            f"  Reviews/mois: {reviews_per_month} → {reviews_score} pts\n"
+            f"  Stagnant: {'OUI' if is_stagnant else 'NON'} → {stagnant_penalty} pts\n"
+            f"  → Score: {score}/{max_points}"
         )
 
     # =========================================================================
@@ -439,8 +1110,6 @@ class OpportunityScorer:
         Un marché avec peu de vendeurs, une buy box instable et un gap
         de reviews rattrapable est idéal.
         """
-        cfg = self.config.competition
-
         # Extraire les données
         seller_count = product_data.get("seller_count", 50)
         buybox_rotation = product_data.get("buybox_rotation", 0)  # % temps hors leader
@@ -448,26 +1117,32 @@ class OpportunityScorer:
         has_amazon_basics = product_data.get("has_amazon_basics", False)
         has_brand_dominance = product_data.get("has_brand_dominance", False)
 
+        return self._competition_component(
+            seller_count, buybox_rotation, review_gap, has_amazon_basics, has_brand_dominance,
+            *self._competition_values(
+                seller_count, buybox_rotation, review_gap, has_amazon_basics, has_brand_dominance,
+            ),
+        )
+
+    def _competition_values(
+        self,
+        seller_count: int,
+        buybox_rotation: float,
+        review_gap: float,
+        has_amazon_basics: bool,
+        has_brand_dominance: bool,
+    ) -> Tuple[int, int, int, int, int]:
+        """Calcul COMPETITION: (sous-scores vendeurs/buy box/gap reviews, bonus, score)."""
+        cfg = self.config.competition
+
         # Score nombre de vendeurs
-        seller_score = 0
-        for threshold, points in cfg.seller_count_thresholds:
-            if seller_count <= threshold:
-                seller_score = points
-                break
+        seller_score = self._ladder_score("seller_count", seller_count)
 
         # Score rotation buy box
-        buybox_score = 0
-        for threshold, points in cfg.buybox_rotation_thresholds:
-            if buybox_rotation >= threshold:
-                buybox_score = points
-                break
+        buybox_score = self._ladder_score("buybox_rotation", buybox_rotation)
 
         # Score gap reviews
-        gap_score = 0
-        for threshold, points in cfg.review_gap_thresholds:
-            if review_gap <= threshold:
-                gap_score = points
-                break
+        gap_score = self._ladder_score("review_gap", review_gap)
 
         # Bonus/malus
         bonus = 0
@@ -478,23 +1153,31 @@ class OpportunityScorer:
 
         # Score total
         raw_score = seller_score + buybox_score + gap_score + bonus
-        score = max(0, min(raw_score, cfg.max_points))
+        max_points = cfg.max_points
+        score = 0 if raw_score < 0 else (max_points if raw_score > max_points else raw_score)
 
-        # Explication
-        explanation = (
-            f"  Vendeurs FBA: {seller_count} → {seller_score} pts\n"
-            f"  Rotation buy box: {buybox_rotation*100:.0f}% → {buybox_score} pts\n"
-            f"  Gap reviews vs top 10: {review_gap*100:.0f}% → {gap_score} pts\n"
-            f"  Amazon Basics: {'OUI (-4)' if has_amazon_basics else 'NON'}\n"
-            f"  Dominance marque: {'OUI' if has_brand_dominance else 'NON (+2)'}\n"
-            f"  Bonus/malus: {bonus:+d}\n"
-            f"  → Score: {score}/{cfg.max_points}"
-        )
+        return seller_score, buybox_score, gap_score, bonus, score
+
+    def _competition_component(
+        self,
+        seller_count: int,
+        buybox_rotation: float,
+        review_gap: float,
+        has_amazon_basics: bool,
+        has_brand_dominance: bool,
+        seller_score: int,
+        buybox_score: int,
+        gap_score: int,
+        bonus: int,
+        score: int,
+    ) -> ComponentScore:
+        """Construit le ComponentScore COMPETITION (détails, explication différée)."""
+        max_points = self.config.competition.max_points
 
         return ComponentScore(
             name="competition",
             score=score,
-            max_score=cfg.max_points,
+            max_score=max_points,
             details={
                 "seller_count": seller_count,
                 "buybox_rotation": buybox_rotation,
@@ -508,7 +1191,35 @@ class OpportunityScorer:
                     "bonus": bonus,
                 }
             },
-            explanation=explanation,
+            explanation=(self._competition_explanation, (
+                seller_count, buybox_rotation, review_gap, has_amazon_basics, has_brand_dominance,
+                seller_score, buybox_score, gap_score, bonus, score, max_points,
+            )),
+        )
+
+    @staticmethod
+    def _competition_explanation(
+        seller_count: int,
+        buybox_rotation: float,
+        review_gap: float,
+        has_amazon_basics: bool,
+        has_brand_dominance: bool,
+        seller_score: int,
+        buybox_score: int,
+        gap_score: int,
+        bonus: int,
+        score: int,
+        max_points: int,
+    ) -> str:
+        """Texte de l'explication COMPETITION (formaté à la demande)."""
+        return (
+            f"  Vendeurs FBA: {seller_count} → {seller_score} pts\n"
+            f"  Rotation buy box: {buybox_rotation*100:.0f}% → {buybox_score} pts\n"
+            f"  Gap reviews vs top 10: {review_gap*100:.0f}% → {gap_score} pts\n"
+            f"  Amazon Basics: {'OUI (-4)' if has_amazon_basics else 'NON'}\n"
+            f"  Dominance marque: {'OUI' if has_brand_dominance else 'NON (+2)'}\n"
+            f"  Bonus/malus: {bonus:+d}\n"
+            f"  → Score: {score}/{max_points}"
         )
 
     # =========================================================================
@@ -533,55 +1244,64 @@ class OpportunityScorer:
         On identifie des problèmes qu'on pourrait résoudre avec un meilleur produit.
         Seul, un gap ne fait pas une opportunité.
         """
-        cfg = self.config.gap
-
         # Extraire les données
         negative_percent = product_data.get("negative_review_percent", 0)
         wish_mentions = product_data.get("wish_mentions_per_100", 0)
         unanswered = product_data.get("unanswered_questions", 0)
         has_recurring_problems = product_data.get("has_recurring_problems", False)
 
+        return self._gap_component(
+            negative_percent, wish_mentions, unanswered, has_recurring_problems,
+            *self._gap_values(negative_percent, wish_mentions, unanswered, has_recurring_problems),
+        )
+
+    def _gap_values(
+        self,
+        negative_percent: float,
+        wish_mentions: int,
+        unanswered: int,
+        has_recurring_problems: bool,
+    ) -> Tuple[int, int, int, int]:
+        """Calcul GAP: (sous-scores reviews négatifs/"I wish"/questions, score)."""
+        cfg = self.config.gap
+
         # Score reviews négatifs
-        negative_score = 0
-        for threshold, points in cfg.negative_reviews_thresholds:
-            if negative_percent >= threshold:
-                negative_score = points
-                break
+        negative_score = self._ladder_score("negative_reviews", negative_percent)
 
         # Score mentions "I wish"
-        wish_score = 0
-        for threshold, points in cfg.wish_mentions_per_100_thresholds:
-            if wish_mentions >= threshold:
-                wish_score = points
-                break
+        wish_score = self._ladder_score("wish_mentions", wish_mentions)
 
         # Score questions sans réponse
-        questions_score = 0
-        for threshold, points in cfg.unanswered_questions_thresholds:
-            if unanswered >= threshold:
-                questions_score = points
-                break
+        questions_score = self._ladder_score("unanswered_questions", unanswered)
 
         # Multiplicateur si problèmes récurrents
         raw_score = negative_score + wish_score + questions_score
         if has_recurring_problems:
             raw_score = int(raw_score * cfg.recurring_problem_multiplier)
 
-        score = max(0, min(raw_score, cfg.max_points))
+        max_points = cfg.max_points
+        score = 0 if raw_score < 0 else (max_points if raw_score > max_points else raw_score)
 
-        # Explication
-        explanation = (
-            f"  Reviews négatifs: {negative_percent*100:.0f}% → {negative_score} pts\n"
-            f"  Mentions 'I wish'/100: {wish_mentions} → {wish_score} pts\n"
-            f"  Questions sans réponse: {unanswered} → {questions_score} pts\n"
-            f"  Problèmes récurrents: {'OUI (x1.3)' if has_recurring_problems else 'NON'}\n"
-            f"  → Score: {score}/{cfg.max_points}"
-        )
+        return negative_score, wish_score, questions_score, score
+
+    def _gap_component(
+        self,
+        negative_percent: float,
+        wish_mentions: int,
+        unanswered: int,
+        has_recurring_problems: bool,
+        negative_score: int,
+        wish_score: int,
+        questions_score: int,
+        score: int,
+    ) -> ComponentScore:
+        """Construit le ComponentScore GAP (détails, explication différée)."""
+        max_points = self.config.gap.max_points
 
         return ComponentScore(
             name="gap",
             score=score,
-            max_score=cfg.max_points,
+            max_score=max_points,
             details={
                 "negative_review_percent": negative_percent,
                 "wish_mentions_per_100": wish_mentions,
@@ -593,7 +1313,31 @@ class OpportunityScorer:
                     "unanswered_questions": questions_score,
                 }
             },
-            explanation=explanation,
+            explanation=(self._gap_explanation, (
+                negative_percent, wish_mentions, unanswered, has_recurring_problems,
+                negative_score, wish_score, questions_score, score, max_points,
+            )),
+        )
+
+    @staticmethod
+    def _gap_explanation(
+        negative_percent: float,
+        wish_mentions: int,
+        unanswered: int,
+        has_recurring_problems: bool,
+        negative_score: int,
+        wish_score: int,
+        questions_score: int,
+        score: int,
+        max_points: int,
+    ) -> str:
+        """Texte de l'explication GAP (formaté à la demande)."""
+        return (
+            f"  Reviews négatifs: {negative_percent*100:.0f}% → {negative_score} pts\n"
+            f"  Mentions 'I wish'/100: {wish_mentions} → {wish_score} pts\n"
+            f"  Questions sans réponse: {unanswered} → {questions_score} pts\n"
+            f"  Problèmes récurrents: {'OUI (x1.3)' if has_recurring_problems else 'NON'}\n"
+            f"  → Score: {score}/{max_points}"
         )
 
     # =========================================================================
@@ -621,72 +1365,76 @@ class OpportunityScorer:
         Sans urgence, pas d'action. On veut des signaux clairs que
         la fenêtre d'opportunité est ouverte MAINTENANT.
         """
-        cfg = self.config.time_pressure
-
         # Extraire les données
         stockout_count = product_data.get("stockout_count_90d", 0)
         price_trend = product_data.get("price_trend_30d", 0)  # % variation
         seller_churn = product_data.get("seller_churn_90d", 0)
         bsr_acceleration = product_data.get("bsr_acceleration", 0)
 
+        return self._time_pressure_component(
+            stockout_count, price_trend, seller_churn, bsr_acceleration,
+            *self._time_pressure_values(stockout_count, price_trend, seller_churn, bsr_acceleration),
+        )
+
+    def _time_pressure_values(
+        self,
+        stockout_count: int,
+        price_trend: float,
+        seller_churn: int,
+        bsr_acceleration: float,
+    ) -> Tuple[int, int, int, int, int]:
+        """Calcul TIME_PRESSURE: (sous-scores ruptures/prix/churn/accélération, score)."""
+        cfg = self.config.time_pressure
+
         # Score ruptures
-        stockout_score = 0
-        for threshold, points in cfg.stockout_frequency_thresholds:
-            if stockout_count >= threshold:
-                stockout_score = points
-                break
+        stockout_score = self._ladder_score("stockout_frequency", stockout_count)
 
         # Score tendance prix
-        price_score = 0
-        for threshold, points in cfg.price_trend_thresholds:
-            if price_trend >= threshold:
-                price_score = points
-                break
+        price_score = self._ladder_score("price_trend", price_trend)
 
         # Score churn vendeurs
-        churn_score = 0
-        for threshold, points in cfg.seller_churn_thresholds:
-            if seller_churn >= threshold:
-                churn_score = points
-                break
+        churn_score = self._ladder_score("seller_churn", seller_churn)
 
         # Score accélération BSR
-        acceleration_score = 0
-        for threshold, points in cfg.bsr_acceleration_thresholds:
-            if bsr_acceleration >= threshold:
-                acceleration_score = points
-                break
+        acceleration_score = self._ladder_score("bsr_acceleration", bsr_acceleration)
 
         # Score total
         raw_score = stockout_score + price_score + churn_score + acceleration_score
-        score = max(0, min(raw_score, cfg.max_points))
+        max_points = cfg.max_points
+        score = 0 if raw_score < 0 else (max_points if raw_score > max_points else raw_score)
 
-        # Vérification seuil critique
-        is_valid = score >= cfg.minimum_valid
+        return stockout_score, price_score, churn_score, acceleration_score, score
 
-        # Explication
-        explanation = (
-            f"  Ruptures 90j: {stockout_count} → {stockout_score} pts\n"
-            f"  Tendance prix 30j: {price_trend*100:+.1f}% → {price_score} pts\n"
-            f"  Churn vendeurs 90j: {seller_churn} → {churn_score} pts\n"
-            f"  Accélération BSR: {bsr_acceleration*100:+.1f}% → {acceleration_score} pts\n"
-            f"  ---\n"
-            f"  SEUIL CRITIQUE: {cfg.minimum_valid} pts minimum\n"
-            f"  STATUT: {'VALIDE' if is_valid else '*** INVALIDE - REJET ***'}\n"
-            f"  → Score: {score}/{cfg.max_points}"
-        )
+    def _time_pressure_component(
+        self,
+        stockout_count: int,
+        price_trend: float,
+        seller_churn: int,
+        bsr_acceleration: float,
+        stockout_score: int,
+        price_score: int,
+        churn_score: int,
+        acceleration_score: int,
+        score: int,
+    ) -> ComponentScore:
+        """Construit le ComponentScore TIME_PRESSURE (détails, explication différée)."""
+        max_points = self.config.time_pressure.max_points
+        minimum_valid = self._minimum_valid
+
+        # Vérification seuil critique
+        is_valid = score >= minimum_valid
 
         return ComponentScore(
             name="time_pressure",
             score=score,
-            max_score=cfg.max_points,
+            max_score=max_points,
             details={
                 "stockout_count_90d": stockout_count,
                 "price_trend_30d": price_trend,
                 "seller_churn_90d": seller_churn,
                 "bsr_acceleration": bsr_acceleration,
                 "is_valid": is_valid,
-                "minimum_required": cfg.minimum_valid,
+                "minimum_required": minimum_valid,
                 "sub_scores": {
                     "stockout_frequency": stockout_score,
                     "price_trend": price_score,
@@ -694,9 +1442,304 @@ class OpportunityScorer:
                     "bsr_acceleration": acceleration_score,
                 }
             },
-            explanation=explanation,
+            explanation=(self._time_pressure_explanation, (
+                stockout_count, price_trend, seller_churn, bsr_acceleration, stockout_score,
+                price_score, churn_score, acceleration_score, is_valid, minimum_valid, score,
+                max_points,
+            )),
+        )
+
+    @staticmethod
+    def _time_pressure_explanation(
+        stockout_count: int,
+        price_trend: float,
+        seller_churn: int,
+        bsr_acceleration: float,
+        stockout_score: int,
+        price_score: int,
+        churn_score: int,
+        acceleration_score: int,
+        is_valid: bool,
+        minimum_valid: int,
+        score: int,
+        max_points: int,
+    ) -> str:
+        """Texte de l'explication TIME_PRESSURE (formaté à la demande)."""
+        return (
+            f"  Ruptures 90j: {stockout_count} → {stockout_score} pts\n"
+            f"  Tendance prix 30j: {price_trend*100:+.1f}% → {price_score} pts\n"
+            f"  Churn vendeurs 90j: {seller_churn} → {churn_score} pts\n"
+            f"  Accélération BSR: {bsr_acceleration*100:+.1f}% → {acceleration_score} pts\n"
+            f"  ---\n"
+            f"  SEUIL CRITIQUE: {minimum_valid} pts minimum\n"
+            f"  STATUT: {'VALIDE' if is_valid else '*** INVALIDE - REJET ***'}\n"
+            f"  → Score: {score}/{max_points}"
         )
 
+    # =========================================================================
+    # SCORING VECTORISÉ (batch)
+    # =========================================================================
+
+    def _inputs(self, product_data: ProductInput) -> Tuple[Any, ...]:
+        """
+        Valeurs brutes de product_data alignées sur _INPUT_FIELDS (défauts appliqués).
+
+        Une fusion de dicts puis un seul itemgetter: les 21 lectures se font
+        en C, sans boucle Python par champ. Un ProductFeatures porte déjà ses
+        défauts: un attrgetter suffit.
+        """
+        if isinstance(product_data, ProductFeatures):
+            inputs = _FEATURES_GETTER(product_data)
+            if inputs[2] is None:  # shipping_per_unit: défaut de la config
+                return inputs[:2] + (self._input_defaults["shipping_per_unit"],) + inputs[3:]
+            return inputs
+        return self._input_getter({**self._input_defaults, **product_data})
+
+    def _ladder_score(self, name: str, value: float) -> int:
+        """
+        Points d'une échelle de seuils pour une valeur (recherche dichotomique).
+
+        Équivaut à la boucle "premier palier atteint" sur les seuils de la
+        configuration; NaN n'atteint aucun palier et vaut 0.
+        """
+        keys, points, negate = self._scalar_ladders[name]
+        if value != value:
+            return 0
+        return points[bisect_left(keys, -value if negate else value)]
+
+    def _ladder_table_points(self, values: np.ndarray) -> np.ndarray:
+        """
+        Points des 15 échelles pour une matrice de valeurs (lignes de _LADDER_SPECS).
+
+        Une comparaison (15 × N) par colonne de la table empaquetée au lieu
+        d'un np.searchsorted par échelle: l'indice du palier est la largeur
+        moins le nombre de clés >= valeur (pads +inf compris), soit
+        searchsorted côté gauche. NaN ne satisfait aucune comparaison et
+        tombe sur le défaut 0.
+        """
+        keys = self._kernel_keys
+        x = values * self._kernel_signs[:, None]
+        idx = np.full(x.shape, keys.shape[1])
+        for j in range(keys.shape[1]):
+            idx -= x <= keys[:, j, None]
+        return np.take_along_axis(self._kernel_points, idx, axis=1)
+
+    def _score_columns(self, cols: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """
+        Calcule les cinq composantes sur des colonnes NumPy (voir _products_to_soa).
+
+        Mêmes règles et même ordre des opérations flottantes que score_margin,
+        score_velocity, score_competition, score_gap et score_time_pressure:
+        les scores sont identiques à ceux du scoring produit par produit.
+
+        Returns:
+            Dict nom → tableau: sous-scores (noms de _LADDER_SPECS), scores des
+            composantes, valeurs intermédiaires de la marge, total et is_valid.
+        """
+        # MARGIN
+        cfg = self.config.margin
+        amazon_price = cols["amazon_price"]
+        fba_fees = np.where(
+            cols["fba_fees_missing"],
+            np.maximum(amazon_price * cfg.fba_fee_percent, cfg.fba_fee_minimum),
+            cols["fba_fees"],
+        )
+        referral_fee = amazon_price * cfg.amazon_referral_percent
+        return_provision = amazon_price * cfg.return_rate
+        ppc_provision = amazon_price * cfg.ppc_percent_of_revenue
+        storage_provision = cfg.storage_monthly_per_unit * 2
+        # Somme accumulée en place, de gauche à droite comme score_margin:
+        # un seul tableau temporaire au lieu d'un par addition
+        total_cost = cols["alibaba_price"] + cols["shipping_per_unit"]
+        total_cost += fba_fees
+        total_cost += referral_fee
+        total_cost += return_provision
+        total_cost += ppc_provision
+        total_cost += storage_provision
+        net_margin = amazon_price - total_cost
+        with np.errstate(divide="ignore", invalid="ignore"):
+            net_margin /= amazon_price
+        net_margin[amazon_price <= 0] = 0.0
+
+        # Les 15 échelles de seuils en une passe (marge nette comprise)
+        ladder_values = np.stack([
+            net_margin if field == "net_margin" else cols[field] for field in _LADDER_INPUTS
+        ])
+        out = dict(zip(
+            (spec[0] for spec in _LADDER_SPECS), self._ladder_table_points(ladder_values),
+        ))
+        out["fba_fees"] = fba_fees
+        out["referral_fee"] = referral_fee
+        out["provisions"] = return_provision + ppc_provision + storage_provision
+        out["total_cost"] = total_cost
+        out["net_margin"] = net_margin
+
+        # VELOCITY
+        cfg = self.config.velocity
+        is_stagnant = (
+            (np.abs(cols["bsr_delta_7d"]) < 0.05) &
+            (np.abs(cols["bsr_delta_30d"]) < 0.10) &
+            (cols["reviews_per_month"] < 5)
+        )
+        out["is_stagnant"] = is_stagnant
+        out["stagnant_penalty"] = np.where(is_stagnant, cfg.stagnant_penalty, 0)
+        velocity = (
+            out["bsr_absolute"] + out["bsr_delta_7d"] + out["bsr_delta_30d"] +
+            out["reviews_velocity"] + out["stagnant_penalty"]
+        )
+        out["velocity"] = np.clip(velocity, 0, cfg.max_points, out=velocity)
+
+        # COMPETITION
+        cfg = self.config.competition
+        out["bonus"] = (
+            np.where(cols["has_brand_dominance"], 0, cfg.no_brand_dominance_bonus) +
+            np.where(cols["has_amazon_basics"], cfg.amazon_basics_penalty, 0)
+        )
+        competition = out["seller_count"] + out["buybox_rotation"] + out["review_gap"] + out["bonus"]
+        out["competition"] = np.clip(competition, 0, cfg.max_points, out=competition)
+
+        # GAP
+        cfg = self.config.gap
+        raw_gap = out["negative_reviews"] + out["wish_mentions"] + out["unanswered_questions"]
+        raw_gap = np.where(
+            cols["has_recurring_problems"],
+            np.trunc(raw_gap * cfg.recurring_problem_multiplier).astype(np.int64),
+            raw_gap,
+        )
+        out["gap"] = np.clip(raw_gap, 0, cfg.max_points, out=raw_gap)
+
+        # TIME_PRESSURE
+        cfg = self.config.time_pressure
+        time_pressure = (
+            out["stockout_frequency"] + out["price_trend"] + out["seller_churn"] +
+            out["bsr_acceleration"]
+        )
+        out["time_pressure"] = np.clip(time_pressure, 0, cfg.max_points, out=time_pressure)
+
+        return self._with_totals(out)
+
+    def _kernel_columns(self, cols: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """Même résultat que _score_columns, calculé par le noyau parallèle _score_batch_core."""
+        values = _score_batch_core(
+            np.column_stack([cols[name] for name in _KERNEL_FIELDS]).astype(np.float64),
+            self._kernel_keys, self._kernel_points, self._kernel_signs, self._kernel_params,
+        )
+        out = {}
+        for k, (name, kind) in enumerate(zip(_VALUE_FIELDS, _VALUE_TYPES)):
+            out[name] = values[:, k] if kind is float else values[:, k].astype(
+                bool if kind is bool else np.int64
+            )
+        return self._with_totals(out)
+
+    def _with_totals(self, out: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """Ajoute le total et is_valid aux colonnes de composantes."""
+        out["total"] = (
+            out["margin"] + out["velocity"] + out["competition"] + out["gap"] +
+            out["time_pressure"]
+        )
+        out["is_valid"] = out["time_pressure"] >= self._minimum_valid
+        return out
+
+    def _batch_columns(
+        self,
+        products: List[ProductInput],
+    ) -> Tuple[List[Tuple[Any, ...]], Dict[str, np.ndarray]]:
+        """Entrées produit et colonnes de scores d'un batch non vide."""
+        rows = [self._inputs(p) for p in products]
+        return rows, self._soa_columns(_products_to_soa(rows))
+
+    def _soa_columns(self, soa: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """Colonnes de scores d'entrées en colonnes: noyau parallèle si numba est là, sinon NumPy."""
+        if HAS_NUMBA:
+            return self._kernel_columns(soa)
+        return self._score_columns(soa)
+
+    def _result_from_values(
+        self,
+        product_id: str,
+        inputs: Tuple[Any, ...],
+        values: Tuple[Any, ...],
+        status: Optional[OpportunityStatus] = None,
+        window: Optional[Tuple[str, int]] = None,
+    ) -> ScoringResult:
+        """Construit le ScoringResult à partir des entrées brutes et des valeurs calculées."""
+        (amazon_price, alibaba_price, shipping, _, bsr_current, bsr_delta_7d,
+         bsr_delta_30d, reviews_per_month, seller_count, buybox_rotation, review_gap,
+         has_amazon_basics, has_brand_dominance, negative_percent, wish_mentions,
+         unanswered, has_recurring_problems, stockout_count, price_trend,
+         seller_churn, bsr_acceleration) = inputs
+        (fba_fees, referral_fee, provisions, total_cost, net_margin, margin,
+         bsr_score, delta_7d_score, delta_30d_score, reviews_score,
+         is_stagnant, stagnant_penalty, velocity,
+         seller_score, buybox_score, gap_score, bonus, competition,
+         negative_score, wish_score, questions_score, gap,
+         stockout_score, price_score, churn_score, acceleration_score, time_pressure) = values
+
+        return self._assemble(
+            product_id,
+            self._margin_component(
+                amazon_price, alibaba_price, shipping, fba_fees, referral_fee, provisions,
+                total_cost, 0 if amazon_price <= 0 else net_margin, margin,
+            ),
+            self._velocity_component(
+                bsr_current, bsr_delta_7d, bsr_delta_30d, reviews_per_month,
+                bsr_score, delta_7d_score, delta_30d_score, reviews_score,
+                is_stagnant, stagnant_penalty, velocity,
+            ),
+            self._competition_component(
+                seller_count, buybox_rotation, review_gap, has_amazon_basics, has_brand_dominance,
+                seller_score, buybox_score, gap_score, bonus, competition,
+            ),
+            self._gap_component(
+                negative_percent, wish_mentions, unanswered, has_recurring_problems,
+                negative_score, wish_score, questions_score, gap,
+            ),
+            self._time_pressure_component(
+                stockout_count, price_trend, seller_churn, bsr_acceleration,
+                stockout_score, price_score, churn_score, acceleration_score, time_pressure,
+            ),
+            status,
+            window,
+        )
+
+    def _materialize(
+        self,
+        products: List[ProductInput],
+        rows: List[Tuple[Any, ...]],
+        columns: Dict[str, np.ndarray],
+        indices: np.ndarray,
+    ) -> List[ScoringResult]:
+        """
+        Construit les ScoringResult des produits d'indices donnés à partir des colonnes.
+
+        Seules les lignes retenues sont extraites des colonnes (get_top_opportunities
+        n'en garde que n).
+        """
+        selected = {
+            name: columns[name][indices] for name in _VALUE_FIELDS + ("total", "is_valid")
+        }
+        values = zip(*(selected[name].tolist() for name in _VALUE_FIELDS))
+        statuses = self._batch_statuses(selected)
+        windows = [self._window_table[score] for score in selected["time_pressure"].tolist()]
+        return [
+            self._result_from_values(
+                _product_id(products[i]), rows[i], product_values, status, window,
+            )
+            for i, product_values, status, window in zip(indices.tolist(), values, statuses, windows)
+        ]
+
+    def _batch_statuses(self, columns: Dict[str, np.ndarray]) -> List[OpportunityStatus]:
+        """
+        Statut de chaque produit du batch (même règle que _determine_status).
+
+        Un np.searchsorted sur l'échelle des seuils de statut pour tout le
+        batch; les produits invalides prennent INVALID_NO_WINDOW.
+        """
+        keys, levels, sign = self._status_ladder
+        level = levels[np.searchsorted(keys, sign * columns["total"])]
+        level[~columns["is_valid"]] = len(_STATUS_LEVELS) - 1
+        return [_STATUS_LEVELS[i] for i in level.tolist()]
+
     # =========================================================================
     # MÉTHODES UTILITAIRES
     # =========================================================================
@@ -715,6 +1758,13 @@ class OpportunityScorer:
         Plus le time_pressure est élevé, plus la fenêtre est courte
         (l'opportunité va se refermer vite si on n'agit pas).
         """
+        table = self._window_table
+        if isinstance(time_pressure_score, int) and 0 <= time_pressure_score < len(table):
+            return table[time_pressure_score]
+        return self._scan_windows(time_pressure_score)
+
+    def _scan_windows(self, time_pressure_score: int) -> Tuple[str, int]:
+        """Première fenêtre de la config contenant le score ("INCONNU", 0 sinon)."""
         for score_min, score_max, label, days in self.config.window_estimation.windows:
             if score_min <= time_pressure_score <= score_max:
                 return label, days
@@ -726,45 +1776,89 @@ class OpportunityScorer:
         if not is_valid:
             return OpportunityStatus.INVALID_NO_WINDOW
 
-        thresholds = self.config.score_thresholds
-        if total_score >= thresholds["exceptional"][0]:
+        exceptional, strong, moderate, weak = self._status_cutoffs
+        if total_score >= exceptional:
             return OpportunityStatus.EXCEPTIONAL
-        elif total_score >= thresholds["strong"][0]:
+        elif total_score >= strong:
             return OpportunityStatus.STRONG
-        elif total_score >= thresholds["moderate"][0]:
+        elif total_score >= moderate:
             return OpportunityStatus.MODERATE
-        elif total_score >= thresholds["weak"][0]:
+        elif total_score >= weak:
             return OpportunityStatus.WEAK
         else:
             return OpportunityStatus.REJECTED
 
-    def score_batch(self, products: List[Dict[str, Any]]) -> List[ScoringResult]:
+    def score_arrays(self, columns: Dict[str, Any]) -> Dict[str, np.ndarray]:
+        """
+        Score des produits fournis en colonnes (dict champ → tableau).
+
+        Entrée et sortie restent en colonnes NumPy: ni dict par produit ni
+        ScoringResult. Un DataFrame s'y passe par
+        {name: df[name].to_numpy() for name in df.columns}.
+
+        Args:
+            columns: Tableaux de même longueur, clés parmi celles de score().
+                Les champs absents prennent les défauts de score(); un
+                fba_fees NaN est estimé comme un fba_fees absent.
+
+        Returns:
+            Dict des valeurs calculées (fba_fees .. time_pressure, voir
+            _VALUE_FIELDS) plus "total" et "is_valid", alignés sur l'entrée.
+
+        Raises:
+            ValueError: Si les colonnes n'ont pas toutes la même longueur.
+        """
+        arrays = {name: np.asarray(columns[name]) for name in _INPUT_FIELDS if name in columns}
+        lengths = {len(values) for values in arrays.values()}
+        if len(lengths) > 1:
+            raise ValueError("all columns must have the same length")
+        n = lengths.pop() if lengths else 0
+
+        soa: Dict[str, np.ndarray] = {}
+        for name in _INPUT_FIELDS:
+            dtype = bool if name in _FLAG_FIELDS else np.float64
+            if name in arrays:
+                soa[name] = arrays[name].astype(dtype)
+            else:
+                default = self._input_defaults[name]
+                soa[name] = np.full(n, np.nan if default is None else default, dtype=dtype)
+        soa["fba_fees_missing"] = np.isnan(soa["fba_fees"])
+        return self._soa_columns(soa)
+
+    def score_batch(self, products: List[ProductInput]) -> List[ScoringResult]:
         """
         Score un batch de produits.
 
+        Les cinq composantes sont calculées sur des colonnes NumPy (une
+        opération par échelle de seuils pour tout le batch au lieu d'une
+        boucle Python par produit), ou par le noyau numba parallèle quand
+        il est disponible; seuls les ScoringResult et leurs explications
+        sont construits produit par produit.
+
         Args:
             products: Liste de dictionnaires product_data
 
         Returns:
             Liste de ScoringResult triée par score décroissant
         """
-        results = [self.score(p) for p in products]
-        # Trier par: valide d'abord, puis score décroissant
-        return sorted(
-            results,
-            key=lambda r: (r.is_valid, r.total_score),
-            reverse=True
-        )
+        if not products:
+            return []
+
+        rows, columns = self._batch_columns(products)
+        return self._materialize(products, rows, columns, self._ranking(columns))
 
     def get_top_opportunities(
         self,
-        products: List[Dict[str, Any]],
+        products: List[ProductInput],
         n: int = 10,
         min_score: int = 55
     ) -> List[ScoringResult]:
         """
         Retourne les N meilleures opportunités valides.
 
+        Le filtre et le tri portent sur les colonnes de scores: seuls les
+        produits retenus sont matérialisés en ScoringResult.
+
         Args:
             products: Liste de dictionnaires product_data
             n: Nombre max d'opportunités à retourner
@@ -773,12 +1867,41 @@ class OpportunityScorer:
         Returns:
             Liste des meilleures opportunités (max n)
         """
-        all_results = self.score_batch(products)
-        valid_above_threshold = [
-            r for r in all_results
-            if r.is_valid and r.total_score >= min_score
-        ]
-        return valid_above_threshold[:n]
+        if not products:
+            return []
+
+        rows, columns = self._batch_columns(products)
+        kept = np.flatnonzero(columns["is_valid"] & (columns["total"] >= min_score))
+        return self._materialize(products, rows, columns, self._top_indices(columns["total"], kept, n))
+
+    def _top_indices(self, totals: np.ndarray, kept: np.ndarray, n: int) -> np.ndarray:
+        """
+        Les n meilleurs indices de kept, dans l'ordre de score_batch.
+
+        Sélection partielle (np.partition) du n-ième meilleur total, puis tri
+        stable des seuls candidats: O(N + n log n) au lieu d'un tri du batch.
+        À égalité sur le seuil, les premiers produits en entrée sont gardés,
+        comme avec le tri stable complet.
+        """
+        kept_totals = totals[kept]
+        if 0 < n < len(kept):
+            cutoff = np.partition(kept_totals, len(kept) - n)[len(kept) - n]
+            above = kept_totals > cutoff
+            tied = np.flatnonzero(kept_totals == cutoff)[:n - np.count_nonzero(above)]
+            above[tied] = True
+            kept, kept_totals = kept[above], kept_totals[above]
+        return kept[np.argsort(-kept_totals, kind="stable")][:n]
+
+    def _ranking(self, columns: Dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Indices du batch triés: valides d'abord, puis score décroissant.
+
+        Clé entière is_valid << 16 | total triée par un argsort stable: même
+        ordre que sorted(key=(is_valid, total_score), reverse=True), ordre
+        d'entrée conservé à égalité.
+        """
+        keys = (columns["is_valid"].astype(np.int64) << 16) | columns["total"]
+        return np.argsort(-keys, kind="stable")
 
 
 # =============================================================================
@@ -0,0 +1,123 @@
+"""
+Tests for Smartacus scoring calibration.
+
+Tests:
+- Built-in niche cases pass against DEFAULT_CONFIG
+- Component bias / variance statistics
+- Report export
+
+Usage:
+    pytest tests/test_calibration.py -v
+"""
+
+import pytest
+
+from src.scoring.calibration import (
+    CalibrationCase,
+    CalibrationRunner,
+    NICHE_CALIBRATION_CASES,
+)
+
+
+def _with_expected(case, **expected_components):
+    """Copy of a built-in case carrying expected component sub-scores."""
+    product_data = dict(case.product_data, _expected_components=expected_components)
+    return CalibrationCase(
+        product_data=product_data,
+        expected_status=case.expected_status,
+        expected_score_range=case.expected_score_range,
+        notes=case.notes,
+    )
+
+
+class TestCalibrationRunner:
+    """Tests for CalibrationRunner.run."""
+
+    def setup_method(self):
+        self.runner = CalibrationRunner()
+
+    def test_builtin_cases_pass(self):
+        report = self.runner.run(NICHE_CALIBRATION_CASES)
+
+        assert report.total_cases == len(NICHE_CALIBRATION_CASES)
+        assert report.failed == 0
+
+    def test_component_stats(self):
+        """Bias is the mean delta, std the population standard deviation."""
+        base = NICHE_CALIBRATION_CASES[0]
+        actual = self.runner.scorer.score(base.product_data).component_scores["margin"].score
+        cases = [
+            _with_expected(base, margin=actual - 2),
+            _with_expected(base, margin=actual + 1),
+            _with_expected(base, margin=actual - 5),
+        ]
+
+        stats = self.runner.run(cases).component_stats
+
+        assert stats["margin"]["n"] == 3
+        assert stats["margin"]["avg_delta"] == pytest.approx(2.0)
+        assert stats["margin"]["std_delta"] == pytest.approx(2.45, abs=0.01)
+
+    def test_failed_case_reported(self):
+        case = CalibrationCase(
+            product_data=NICHE_CALIBRATION_CASES[0].product_data,
+            expected_status="rejected",
+            expected_score_range=(0, 5),
+        )
+
+        report = self.runner.run([case])
+
+        assert report.failed == 1
+        assert report.to_dict()["failed_cases"][0]["expected_status"] == "rejected"
+        assert "--- Failed Cases ---" in report.summary()
+
+    def test_parallel_matches_serial(self):
+        """Process-pool scoring gives the same report as the serial path."""
+        cases = list(NICHE_CALIBRATION_CASES) * 8
+        assert len(cases) >= CalibrationRunner.PARALLEL_MIN_CASES
+
+        serial = self.runner.run(cases).to_dict()
+        parallel = self.runner.run(cases, parallel=2).to_dict()
+
+        for report in (serial, parallel):
+            report.pop("run_at")
+        assert parallel == serial
+
+    def test_save_report_round_trips(self, tmp_path):
+        import json
+
+        report = self.runner.run(NICHE_CALIBRATION_CASES)
+        path = tmp_path / "reports" / "calibration.json"
+        self.runner.save_report(report, path)
+
+        assert json.loads(path.read_text()) == report.to_dict()
+
+    def test_repeated_cases_scored_once(self, monkeypatch):
+        calls = []
+        score = self.runner.scorer.score
+
+        def counting_score(product_data):
+            calls.append(product_data)
+            return score(product_data)
+
+        monkeypatch.setattr(self.runner.scorer, "score", counting_score)
+
+        first = self.runner.run(NICHE_CALIBRATION_CASES).to_dict()
+        second = self.runner.run(NICHE_CALIBRATION_CASES).to_dict()
+
+        assert len(calls) == len(NICHE_CALIBRATION_CASES)
+        for report in (first, second):
+            report.pop("run_at")
+        assert first == second
+
+    def test_summary_truncates_failed_cases(self):
+        case = CalibrationCase(
+            product_data=NICHE_CALIBRATION_CASES[0].product_data,
+            expected_status="rejected",
+            expected_score_range=(0, 5),
+        )
+        report = self.runner.run([case] * 5)
+
+        assert report.summary(max_failed=2).count("CAL_EXCEPTIONAL_01") == 2
+        assert "(+3 more)" in report.summary(max_failed=2)
+        assert "--- Failed Cases ---" not in report.summary(include_failed=False)
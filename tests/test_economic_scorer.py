@@ -211,6 +211,148 @@ class TestEconomicValueEstimation:
         # Monthly = 8.75 * 100 = 875
         assert monthly == Decimal("875.0")
 
+    def test_amounts_rounded_to_cents(self):
+        """Decimal outputs are cent-rounded and annual stays monthly × 12."""
+        monthly, annual, risk_adj = self.scorer.estimate_economic_value(
+            amazon_price=49.99,
+            estimated_cogs=1.0,
+            estimated_monthly_units=7,
+        )
+
+        assert monthly == Decimal("185.46")
+        assert annual == monthly * 12
+        assert risk_adj == Decimal("1557.88")
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self._one = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        if self.conn.error:
+            raise self.conn.error
+        sql = " ".join(sql.split())
+        self.conn.statements.append((sql, params))
+        self._one = (self.conn.has_quotes,) if "EXISTS" in sql else None
+
+    def fetchone(self):
+        return self._one
+
+    def fetchall(self):
+        return self.conn.rows
+
+
+class FakeConnection:
+    """Records statements; every quote query returns the same scripted rows."""
+
+    def __init__(self, rows=None, error=None, has_quotes=True):
+        self.rows = list(rows or [])
+        self.error = error
+        self.has_quotes = has_quotes
+        self.statements = []
+
+    def quote_queries(self):
+        return [params for sql, params in self.statements if "DISTINCT ON" in sql]
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def rollback(self):
+        pass
+
+
+class TestSourcingQuotes:
+    """Tests for the batched sourcing_quotes lookup."""
+
+    def test_batch_single_query(self):
+        conn = FakeConnection([("B09A", Decimal("4.50"), Decimal("1.25")), ("B09B", Decimal("6"), None)])
+        scorer = EconomicScorer(conn=conn)
+
+        quotes = scorer.get_best_quote_cogs_batch(["B09A", "B09B", "B09C"])
+
+        assert quotes == {"B09A": (4.5, 1.25), "B09B": (6.0, 0.0)}
+        assert conn.quote_queries() == [(["B09A", "B09B", "B09C"],)]
+
+    def test_hits_and_misses_cached(self):
+        conn = FakeConnection([("B09A", 4.5, 1.0)])
+        scorer = EconomicScorer(conn=conn)
+        scorer.get_best_quote_cogs_batch(["B09A", "B09C"])
+
+        assert scorer.get_best_quote_cogs("B09A") == (4.5, 1.0)
+        assert scorer.get_best_quote_cogs("B09C") is None
+        assert len(conn.quote_queries()) == 1
+
+    def test_expired_entries_refetched(self):
+        conn = FakeConnection([("B09A", 4.5, 1.0)])
+        scorer = EconomicScorer(conn=conn)
+        scorer.QUOTE_CACHE_TTL_SECONDS = 0
+
+        scorer.get_best_quote_cogs("B09A")
+        scorer.get_best_quote_cogs("B09A")
+
+        assert len(conn.quote_queries()) == 2
+
+    def test_cache_bounded_lru(self):
+        """Past QUOTE_CACHE_SIZE, the least recently used ASINs are evicted."""
+        conn = FakeConnection([("B09A", 4.5, 1.0)])
+        scorer = EconomicScorer(conn=conn)
+        scorer.QUOTE_CACHE_SIZE = 2
+
+        scorer.get_best_quote_cogs_batch(["B09A", "B09B"])
+        scorer.get_best_quote_cogs("B09A")
+        scorer.get_best_quote_cogs("B09C")
+
+        assert list(scorer._quote_cache) == ["B09A", "B09C"]
+        assert scorer.get_best_quote_cogs("B09A") == (4.5, 1.0)
+        assert len(conn.quote_queries()) == 2
+
+    def test_quote_replaces_heuristic_cogs(self):
+        scorer = EconomicScorer(conn=FakeConnection([("B09A", 4.0, 1.0)]))
+
+        monthly, _, _ = scorer.estimate_economic_value(
+            amazon_price=25.0,
+            estimated_cogs=50.0,
+            estimated_monthly_units=100,
+            asin="B09A",
+        )
+
+        # Same as test_costs_include_all_fees: COGS 4 + 1 shipping = 5
+        assert monthly == Decimal("875.0")
+
+    def test_prefetch_serves_later_lookups(self):
+        conn = FakeConnection([("B09A", 4.5, 1.0)])
+        scorer = EconomicScorer(conn=conn)
+        scorer.prefetch_quotes(["B09A", "B09B"])
+
+        assert scorer.get_best_quote_cogs("B09A") == (4.5, 1.0)
+        assert scorer.get_best_quote_cogs("B09B") is None
+        assert len(conn.statements) == 2  # existence probe + one quote query
+
+    def test_empty_table_skips_quote_queries(self):
+        """Once sourcing_quotes is known to be empty, lookups stay local."""
+        conn = FakeConnection(has_quotes=False)
+        scorer = EconomicScorer(conn=conn)
+
+        assert scorer.get_best_quote_cogs("B09A") is None
+        assert scorer.get_best_quote_cogs_batch(["B09B", "B09C"]) == {}
+        assert len(conn.statements) == 1
+        assert conn.quote_queries() == []
+
+    def test_database_error_falls_back(self):
+        """Failed lookups use the heuristic and are not cached."""
+        conn = FakeConnection(error=RuntimeError("connection refused"))
+        scorer = EconomicScorer(conn=conn)
+
+        assert scorer.get_best_quote_cogs("B09A") is None
+        assert scorer._quote_cache == {}
+
 
 class TestScoreEconomic:
     """Tests for the complete economic scoring function."""
@@ -314,6 +456,32 @@ class TestScoreEconomic:
 
         assert result.rank_score > 0
 
+    def test_base_score_cached(self, monkeypatch):
+        """Re-scoring the same product reuses the base scoring result."""
+        calls = []
+        score = self.scorer.base_scorer.score
+
+        def counting_score(product_data):
+            calls.append(product_data)
+            return score(product_data)
+
+        monkeypatch.setattr(self.scorer.base_scorer, "score", counting_score)
+
+        first = self.scorer.score_economic(self.good_product, self.good_time_data)
+        second = self.scorer.score_economic(dict(self.good_product), self.good_time_data)
+        self.scorer.score_economic(dict(self.good_product, tags=["unhashable"]), self.good_time_data)
+
+        assert len(calls) == 2
+        assert second.to_dict() == first.to_dict()
+
+    def test_results_are_slotted(self):
+        """Per-ASIN result objects carry no instance __dict__."""
+        result = self.scorer.score_economic(self.good_product, self.good_time_data)
+        time_result = self.scorer.calculate_time_multiplier(1.0, 0.25, 0.15, 0.1)
+
+        assert not hasattr(result, "__dict__")
+        assert not hasattr(time_result, "__dict__")
+
     def test_to_dict_serializable(self):
         """to_dict should return a fully serializable dict."""
         result = self.scorer.score_economic(
@@ -328,6 +496,73 @@ class TestScoreEconomic:
         assert isinstance(d["estimated_annual_value"], float)
 
 
+class TestScoreEconomicBatch:
+    """Tests for the vectorized batch scoring path."""
+
+    def setup_method(self):
+        self.scorer = EconomicScorer()
+        base = TestScoreEconomic()
+        base.setup_method()
+        self.product = base.good_product
+
+    def test_batch_matches_scalar(self):
+        """Batch results equal per-product score_economic results."""
+        products, time_data = [], []
+        for i, (sf, churn, vol, accel) in enumerate([
+            (0.0, 0.05, 0.0, -1.0),
+            (0.5, 0.10, 0.10, -0.05),
+            (1.0, 0.25, 0.15, 0.0),
+            (3.0, 0.40, 0.25, 0.15),
+            (5.0, 0.31, 0.21, 0.05),
+        ]):
+            products.append(dict(self.product, product_id=f"B09BATCH{i}", amazon_price=10 + 8 * i))
+            time_data.append({
+                "stockout_frequency": sf,
+                "seller_churn_90d": churn,
+                "price_volatility": vol,
+                "bsr_acceleration": accel,
+                "estimated_monthly_units": 50 * (i + 1),
+            })
+        # Marge négative et 0 unité: profit nul (0.00, pas -0.00)
+        products.append(dict(self.product, product_id="B09BATCHLOSS", amazon_price=5.0))
+        time_data.append({"estimated_monthly_units": 0})
+        events = [["supply_shock"], None, None, ["competitor_collapse"], None, None]
+
+        batch = self.scorer.score_economic_batch(products, time_data, events)
+        scalar = [
+            self.scorer.score_economic(p, t, e)
+            for p, t, e in zip(products, time_data, events)
+        ]
+
+        assert [o.to_dict() for o in batch] == [o.to_dict() for o in scalar]
+        assert [o.thesis for o in batch] == [o.thesis for o in scalar]
+        assert [str(o.estimated_monthly_profit) for o in batch] == \
+            [str(o.estimated_monthly_profit) for o in scalar]
+        assert str(batch[-1].estimated_monthly_profit) == "0.00"
+
+    def test_large_batch_prefetches_quotes_once(self):
+        """Quotes for a large batch are fetched in one query, overlapped with scoring."""
+        n = EconomicScorer.QUOTE_OVERLAP_MIN_ITEMS
+        conn = FakeConnection([("B09Q0", 4.0, 1.0)])
+        scorer = EconomicScorer(conn=conn)
+        products = [dict(self.product, product_id=f"B09Q{i}") for i in range(n)]
+        time_data = [{"estimated_monthly_units": 100}] * n
+
+        batch = scorer.score_economic_batch(products, time_data)
+
+        assert len(conn.quote_queries()) == 1
+        assert sorted(conn.quote_queries()[0][0]) == sorted(p["product_id"] for p in products)
+        # B09Q0 uses its quote (COGS 5), the others the heuristic (4 + 3)
+        assert batch[0].estimated_monthly_profit > batch[1].estimated_monthly_profit
+
+    def test_empty_batch(self):
+        assert self.scorer.score_economic_batch([], []) == []
+
+    def test_misaligned_inputs_rejected(self):
+        with pytest.raises(ValueError):
+            self.scorer.score_economic_batch([self.product], [])
+
+
 class TestRankOpportunities:
     """Tests for opportunity ranking."""
 
@@ -385,6 +620,14 @@ class TestRankOpportunities:
 
         assert len(ranked) == 5
 
+    def test_rank_ties_keep_input_order(self):
+        """Equal rank_scores are returned in input order, like a stable sort."""
+        opps = [self._make_opportunity(f"B09T{i}", 60, 1000 * (i % 2)) for i in range(6)]
+
+        ranked = self.scorer.rank_opportunities(opps, top_n=4)
+
+        assert [o.asin for o in ranked] == ["B09T1", "B09T3", "B09T5", "B09T0"]
+
     def test_generate_shortlist_format(self):
         """Shortlist should have correct format."""
         opps = [
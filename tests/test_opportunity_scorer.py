@@ -19,12 +19,15 @@ try:
 except ImportError:
     HAS_PYTEST = False
 
+import numpy as np
+
 import sys
 sys.path.insert(0, '/Users/moussa/Documents/PROJETS/smartacus')
 
 from src.scoring.opportunity_scorer import (
     OpportunityScorer,
     OpportunityStatus,
+    ProductFeatures,
     ScoringResult,
 )
 from src.scoring.scoring_config import ScoringConfig, DEFAULT_CONFIG
@@ -411,6 +414,12 @@ class TestWindowEstimation:
         assert "PAS DE FENÊTRE" in window
         assert days == 0
 
+    def test_window_table_matches_scan(self):
+        """La table indexée par score donne la fenêtre du parcours de la config."""
+        for score in (-1, 0, 3, 7, 10, 11, 8.5):
+            assert self.scorer.estimate_window(score) == self.scorer._scan_windows(score)
+        assert self.scorer.estimate_window(-1) == ("INCONNU", 0)
+
 
 class TestBatchScoring:
     """Tests pour le scoring en batch."""
@@ -485,6 +494,215 @@ class TestBatchScoring:
             assert result.is_valid
             assert result.total_score >= 50
 
+    def test_batch_matches_scalar(self):
+        """Le batch vectorisé donne exactement les résultats de score()."""
+        products = self.products + [
+            # Valeurs sur les seuils, champs absents, prix nul, NaN
+            {"product_id": "B09EDGE1", "amazon_price": 25, "alibaba_price": 5,
+             "bsr_current": 5000, "bsr_delta_7d": -0.30, "reviews_per_month": 50,
+             "seller_count": 3, "buybox_rotation": 0.25, "review_gap_vs_top10": 0.30,
+             "negative_review_percent": 0.25, "has_recurring_problems": True,
+             "stockout_count_90d": 3, "price_trend_30d": 0.0, "fba_fees": 4.0},
+            {"product_id": "B09EDGE2", "amazon_price": 0, "has_amazon_basics": True,
+             "has_brand_dominance": True, "bsr_delta_7d": float("nan")},
+            {"amazon_price": 19.99, "alibaba_price": 4, "bsr_delta_7d": 0.02,
+             "bsr_delta_30d": 0.03, "reviews_per_month": 3, "price_trend_30d": -1.5},
+        ]
+
+        batch = {r.product_id: r for r in self.scorer.score_batch(products)}
+
+        for product in products:
+            expected = self.scorer.score(product)
+            result = batch[expected.product_id]
+            assert result.total_score == expected.total_score
+            assert result.status == expected.status
+            assert result.window_estimate == expected.window_estimate
+            assert result.get_explanation() == expected.get_explanation()
+            for name, comp in expected.component_scores.items():
+                assert repr(result.component_scores[name].details) == repr(comp.details)
+
+    def test_kernel_matches_columns(self):
+        """Le noyau _score_batch_core (compilé ou non) donne les mêmes valeurs que le batch numpy."""
+        from src.scoring.opportunity_scorer import _VALUE_FIELDS, _products_to_soa
+
+        soa = _products_to_soa([self.scorer._inputs(product) for product in self.products])
+        columns = self.scorer._score_columns(soa)
+        kernel = self.scorer._kernel_columns(soa)
+
+        for name in _VALUE_FIELDS + ("total", "is_valid"):
+            assert kernel[name].tolist() == columns[name].tolist(), name
+
+    def test_top_matches_filtered_batch(self):
+        """get_top_opportunities = score_batch filtré (valides, >= min_score), tronqué à n."""
+        products = self.products * 3
+        expected = [
+            r for r in self.scorer.score_batch(products)
+            if r.is_valid and r.total_score >= 40
+        ][:4]
+
+        top = self.scorer.get_top_opportunities(products, n=4, min_score=40)
+
+        assert [(r.product_id, r.total_score) for r in top] == \
+            [(r.product_id, r.total_score) for r in expected]
+
+    def test_top_partial_selection_keeps_batch_order(self):
+        """Sélection partielle: mêmes produits et même ordre à égalité, pour tout n."""
+        products = [
+            dict(product, product_id=f"{product['product_id']}_{copy}")
+            for copy in range(4) for product in self.products
+        ]
+        ranked = [r.product_id for r in self.scorer.score_batch(products) if r.is_valid]
+
+        for n in (0, 1, 2, 3, 5, len(products) + 1):
+            top = self.scorer.get_top_opportunities(products, n=n, min_score=0)
+            assert [r.product_id for r in top] == ranked[:n]
+
+    def test_explanations_formatted_on_access(self):
+        """Les explications du batch ne sont formatées qu'à la lecture."""
+        import pickle
+
+        result = self.scorer.score_batch(self.products)[0]
+        margin = result.component_scores["margin"]
+
+        assert not isinstance(margin._explanation, str)
+        assert margin.explanation.startswith("  Prix Amazon: $")
+        assert pickle.loads(pickle.dumps(result)).get_explanation() == result.get_explanation()
+
+    def test_component_score_text_explanation(self):
+        """explanation reste un argument du constructeur et un attribut modifiable."""
+        from src.scoring.opportunity_scorer import ComponentScore
+
+        component = ComponentScore("margin", 20, 30, explanation="Marge correcte")
+        assert component.explanation == "Marge correcte"
+        assert component.details == {}
+
+        component.explanation = "Marge révisée"
+        assert component.explanation == "Marge révisée"
+        assert component == ComponentScore("margin", 20, 30, {}, "Marge révisée")
+
+    def test_score_arrays_matches_scalar(self):
+        """Entrée en colonnes: mêmes composantes et totaux que score(), défauts compris."""
+        from src.scoring.opportunity_scorer import _INPUT_FIELDS
+
+        rows = [self.scorer._inputs(product) for product in self.products]
+        columns = {
+            name: np.array([np.nan if value is None else value for value in values])
+            for name, values in zip(_INPUT_FIELDS, zip(*rows))
+            if name != "shipping_per_unit"  # absent: défaut de la config
+        }
+
+        scores = self.scorer.score_arrays(columns)
+
+        for i, product in enumerate(self.products):
+            product = {k: v for k, v in product.items() if k != "shipping_per_unit"}
+            expected = self.scorer.score(product)
+            assert scores["total"][i] == expected.total_score
+            assert scores["is_valid"][i] == expected.is_valid
+            for name, comp in expected.component_scores.items():
+                assert scores[name][i] == comp.score
+
+    def test_score_arrays_rejects_ragged_columns(self):
+        try:
+            self.scorer.score_arrays({"amazon_price": [20.0, 30.0], "bsr_current": [1000]})
+            assert False, "ValueError attendue"
+        except ValueError:
+            pass
+        assert len(self.scorer.score_arrays({})["total"]) == 0
+
+    def test_product_features_match_dict_input(self):
+        """ProductFeatures: mêmes résultats que le dict équivalent, défauts compris."""
+        assert self.scorer._inputs(ProductFeatures()) == self.scorer._inputs({})
+
+        features = [ProductFeatures(**product) for product in self.products]
+        for product, feature in zip(self.products, features):
+            assert self.scorer.score(feature).get_explanation() == \
+                self.scorer.score(product).get_explanation()
+
+        mixed = self.scorer.score_batch([features[0]] + self.products[1:])
+        expected = self.scorer.score_batch(self.products)
+        assert [r.get_explanation() for r in mixed] == [r.get_explanation() for r in expected]
+
+    def test_empty_batch(self):
+        assert self.scorer.score_batch([]) == []
+        assert self.scorer.get_top_opportunities([]) == []
+
+
+class TestLadderLookup:
+    """Vérifie la recherche dichotomique dans les échelles de seuils."""
+
+    def setup_method(self):
+        self.scorer = OpportunityScorer()
+
+    def test_matches_linear_scan(self):
+        """Mêmes points que la boucle sur les seuils, seuils exacts et NaN compris."""
+        from src.scoring.opportunity_scorer import _LADDER_SPECS
+
+        for name, section, attr, comparison in _LADDER_SPECS:
+            thresholds = getattr(getattr(DEFAULT_CONFIG, section), attr)
+            values = [float("nan"), float("inf"), -float("inf"), 0, -1, 10**7]
+            for threshold, _ in thresholds:
+                values += [threshold, threshold - 0.001, threshold + 0.001]
+
+            for value in values:
+                expected = 0
+                for threshold, points in thresholds:
+                    if (value <= threshold) if comparison == "<=" else (value >= threshold):
+                        expected = points
+                        break
+                assert self.scorer._ladder_score(name, value) == expected, (name, value)
+
+    def test_batch_statuses_match_determine_status(self):
+        """Statuts du batch = _determine_status pour chaque total, valide ou non."""
+        totals = np.arange(0, 101)
+        for is_valid in (True, False):
+            columns = {"total": totals, "is_valid": np.full(len(totals), is_valid)}
+            statuses = self.scorer._batch_statuses(columns)
+            assert statuses == [
+                self.scorer._determine_status(total, is_valid) for total in totals.tolist()
+            ]
+
+
+class TestScoreCache:
+    """Vérifie le cache des valeurs numériques de score()."""
+
+    def setup_method(self):
+        self.scorer = OpportunityScorer()
+        self.product = {
+            "product_id": "B09CACHE01",
+            "amazon_price": 29.99,
+            "alibaba_price": 6.0,
+            "bsr_current": 8000,
+            "bsr_delta_7d": -0.18,
+            "stockout_count_90d": 3,
+            "price_trend_30d": 0.06,
+        }
+
+    def test_repeated_product_computed_once(self):
+        calls = []
+        compute = self.scorer._compute_values
+        self.scorer._compute_values = lambda inputs: calls.append(inputs) or compute(inputs)
+
+        first = self.scorer.score(self.product)
+        second = self.scorer.score(dict(self.product, product_id="B09CACHE02"))
+
+        assert len(calls) == 1
+        assert second.product_id == "B09CACHE02"
+        assert second.total_score == first.total_score
+        assert second.get_explanation() == first.get_explanation().replace("B09CACHE01", "B09CACHE02")
+
+    def test_cache_bounded(self):
+        self.scorer.SCORE_CACHE_SIZE = 2
+        for price in (10, 20, 30):
+            self.scorer.score(dict(self.product, amazon_price=price))
+
+        assert len(self.scorer._values_cache) == 2
+
+    def test_unhashable_input_bypasses_cache(self):
+        result = self.scorer.score(dict(self.product, has_amazon_basics=["AmazonBasics"]))
+
+        assert result.component_scores["competition"].details["has_amazon_basics"] == ["AmazonBasics"]
+        assert len(self.scorer._values_cache) == 0
+
 
 class TestConfigValidation:
     """Tests pour la validation de configuration."""
@@ -518,6 +736,8 @@ def run_tests():
         TestGapScoring,
         TestWindowEstimation,
         TestBatchScoring,
+        TestLadderLookup,
+        TestScoreCache,
         TestConfigValidation,
     ]
 
@@ -0,0 +1,397 @@
+"""
+Tests for Smartacus Strategy Agent (token allocation).
+
+Tests the deterministic allocation layer:
+- Tri-partition EXPLOIT / EXPLORE / PAUSE
+- Proportional token allocation (largest remainder)
+- Cold start protection
+- Risk notes
+- Optional Thompson sampling
+
+Usage:
+    pytest tests/test_strategy_agent.py -v
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from src.scheduler.strategy_agent import (
+    StrategyAgent,
+    NicheMetrics,
+    NicheStatus,
+)
+
+
+def _niche(niche_id, runs=5, scanned=1000, opps=60, tokens=2000, value=200.0,
+           days=10, events=0, name=None):
+    return NicheMetrics(
+        niche_id=niche_id,
+        name=name or f"niche_{niche_id}",
+        domain="com",
+        total_runs=runs,
+        total_asins_scanned=scanned,
+        total_opportunities=opps,
+        total_tokens_used=tokens,
+        total_value_detected=value,
+        last_scanned_at=datetime.utcnow() - timedelta(days=days, hours=1),
+        recent_critical_events=events,
+    )
+
+
+class TestClassification:
+    """Tests for the EXPLOIT / EXPLORE / PAUSE partition."""
+
+    def setup_method(self):
+        self.agent = StrategyAgent()
+
+    def test_cold_start_goes_to_explore(self):
+        """Niches with < 2 runs are never paused."""
+        decision = self.agent.decide(budget=1000, niches=[_niche(1, runs=0, scanned=0, opps=0, tokens=0, value=0)])
+
+        assert decision.assessments[0].status == NicheStatus.EXPLORE
+
+    def test_low_yield_mature_niche_paused(self):
+        """Mature niche with no value and fresh data is paused."""
+        decision = self.agent.decide(budget=1000, niches=[_niche(1, opps=0, value=0, days=1)])
+
+        assert decision.assessments[0].status == NicheStatus.PAUSE
+        assert decision.assessments[0].tokens_allocated == 0
+
+    def test_force_include_exploits(self):
+        """Forced niches are exploited regardless of score."""
+        decision = self.agent.decide(
+            budget=1000, niches=[_niche(1, opps=0, value=0, days=1)], force_include=[1]
+        )
+
+        assert decision.assessments[0].status == NicheStatus.EXPLOIT
+
+    def test_accepts_streamed_niches(self):
+        """A generator (e.g. iter_niche_metrics_from_db) is consumed once."""
+        decision = self.agent.decide(budget=1000, niches=(_niche(i) for i in (1, 2)))
+
+        assert len(decision.assessments) == 2
+
+    def test_funded_niches_ordered_by_score(self):
+        """EXPLOIT assessments are listed by descending score (scan order)."""
+        niches = [_niche(1, opps=50), _niche(2, opps=90), _niche(3, opps=70)]
+        decision = self.agent.decide(budget=1000, niches=niches)
+
+        exploit_scores = [a.score for a in decision.assessments if a.status == NicheStatus.EXPLOIT]
+        assert exploit_scores == sorted(exploit_scores, reverse=True)
+
+    def test_paused_niches_ordered_by_score(self):
+        """PAUSE assessments are listed by descending score as well."""
+        niches = [_niche(i, opps=opps, value=0, days=1) for i, opps in enumerate([0, 2, 1], start=1)]
+        decision = self.agent.decide(budget=1000, niches=niches)
+
+        assert [a.status for a in decision.assessments] == [NicheStatus.PAUSE] * 3
+        assert [a.niche_id for a in decision.assessments] == [2, 3, 1]
+
+
+class TestScoring:
+    """Tests for the composite niche score."""
+
+    def test_vectorized_matches_scalar(self):
+        """Batch scoring reproduces _score_niche exactly."""
+        agent = StrategyAgent()
+        niches = [
+            _niche(i, runs=runs, opps=opps, value=value, days=days, events=events)
+            for i, (runs, opps, value, days, events) in enumerate([
+                (0, 0, 0.0, 0, 0), (1, 10, 50.0, 1, 0), (2, 80, 400.0, 3, 0),
+                (5, 30, 10.0, 8, 2), (9, 5, 1.0, 14, 0), (3, 120, 900.0, 40, 1),
+            ])
+        ]
+
+        batch = agent._score_niches_vectorized(niches)
+
+        assert batch.tolist() == [agent._score_niche(n) for n in niches]
+
+    def test_subclass_constants_respected(self):
+        """Overridden day/run constants rebuild the curve and cold start bonus."""
+        class Patient(StrategyAgent):
+            MIN_RUNS_BEFORE_PAUSE = 3
+            STALE_DAYS = 21
+            RECENTLY_SCANNED_DAYS = 4
+
+        agent = Patient()
+        niches = [_niche(1, runs=5, days=18), _niche(2, runs=2, days=3), _niche(3, runs=0, days=30)]
+
+        assert Patient._FRESHNESS_LOOKUP[18] == 0.5 + 0.5 * (11 / 14)
+        assert Patient._FRESHNESS_LOOKUP[3] == 0.1
+        assert len(StrategyAgent._FRESHNESS_LOOKUP) == StrategyAgent.STALE_DAYS + 1
+        assert agent._score_niches_vectorized(niches).tolist() == [agent._score_niche(n) for n in niches]
+        young, mature = agent._score_niche(_niche(4, runs=2)), agent._score_niche(_niche(5, runs=5))
+        assert young == pytest.approx(mature + 0.15)
+
+    def test_kernel_matches_vectorized(self):
+        """The fused kernel (numba or plain Python) reproduces the NumPy path."""
+        agent = StrategyAgent()
+        niches = [
+            _niche(i, runs=i % 4, opps=(i * 7) % 90, value=float(i * 13 % 500),
+                   days=i % 16, events=i % 3)
+            for i in range(40)
+        ]
+        arrays = [
+            np.array([getattr(n, f) for n in niches], dtype=dtype)
+            for f, dtype in (("value_per_1k_tokens", np.float64), ("days_since_scan", np.int64),
+                             ("recent_critical_events", np.int64), ("total_runs", np.int64))
+        ]
+        samples = np.linspace(0.0, 0.2, len(niches))
+
+        assert agent._score_niches_kernel(*arrays, niches).tolist() == \
+            agent._score_niches_vectorized(niches).tolist()
+        assert agent._score_niches_kernel(*arrays, niches, samples).tolist() == \
+            agent._score_niches_vectorized(niches, samples).tolist()
+
+    def test_precomputed_scores_used(self):
+        """Scores computed by the SQL loader skip the Python scoring pass."""
+        agent = StrategyAgent()
+        niches = [
+            NicheMetrics(niche_id=i, name=f"n{i}", domain="com", total_runs=5, precomputed_score=score)
+            for i, score in enumerate([0.9, 0.4, 0.1], start=1)
+        ]
+
+        decision = agent.decide(budget=1000, niches=niches)
+
+        statuses = {a.niche_id: (a.status, a.score) for a in decision.assessments}
+        assert statuses[1] == (NicheStatus.EXPLOIT, 0.9)
+        assert statuses[2] == (NicheStatus.EXPLORE, 0.4)
+        assert statuses[3] == (NicheStatus.PAUSE, 0.1)
+
+    def test_aware_last_scanned_at(self):
+        """TIMESTAMPTZ values (tz-aware) are handled like naive UTC."""
+        from datetime import timezone
+
+        now = datetime(2026, 3, 10, 12, 0)
+        aware = NicheMetrics(
+            niche_id=1, name="n", domain="com",
+            last_scanned_at=datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc), now=now,
+        )
+
+        assert aware.days_since_scan == 9
+
+    def test_rotation_penalty_waived_by_events(self):
+        """Recently scanned niches are penalized unless they have events."""
+        agent = StrategyAgent()
+        quiet = agent._score_niche(_niche(1, days=0))
+        eventful = agent._score_niche(_niche(2, days=0, events=1))
+
+        assert quiet < eventful
+
+
+class TestAmbiguity:
+    """Tests for the ambiguity check that gates LLM consultation."""
+
+    @pytest.mark.parametrize("scores,expected", [
+        ([0.56, 0.58], True),           # close pair at threshold
+        ([0.56, 0.70], False),          # near threshold but far apart
+        ([0.64, 0.68], True),           # only one member near threshold
+        ([0.68, 0.69], False),          # close pair, both > 0.1 away
+        ([0.30, 0.31], False),          # close pair far from threshold
+        ([0.40, 0.62, 0.66, 0.90], True),
+    ])
+    def test_ambiguous_cases(self, scores, expected):
+        """Ambiguity = close scores with one near the EXPLOIT threshold."""
+        agent = StrategyAgent()
+        pairs = [(None, s) for s in scores]
+
+        assert agent._has_ambiguous_cases(pairs[:1], pairs[1:]) is expected
+
+
+class TestRecords:
+    """Tests for the strategy record dataclasses."""
+
+    def test_records_are_slotted(self):
+        """Strategy records carry no per-instance __dict__."""
+        niche = _niche(1)
+        decision = StrategyAgent().decide(budget=1000, niches=[niche])
+
+        for obj in (niche, decision, decision.assessments[0]):
+            assert not hasattr(obj, "__dict__")
+        assert niche.density == 0.06  # __post_init__ still runs
+
+
+class TestAllocation:
+    """Tests for proportional token allocation."""
+
+    def setup_method(self):
+        self.agent = StrategyAgent()
+
+    def test_budget_fully_allocated(self):
+        """Largest-remainder rounding hands out the whole bucket budget."""
+        niches = [(_niche(i), s) for i, s in enumerate([0.7, 0.65, 0.6], start=1)]
+        assessments = self.agent._allocate_tokens(niches, 1001, NicheStatus.EXPLOIT)
+
+        assert sum(a.tokens_allocated for a in assessments) == 1001
+
+    def test_cold_start_minimum(self):
+        """Cold start niches get at least COLD_START_TOKENS."""
+        niches = [(_niche(1), 0.9), (_niche(2, runs=0), 0.01)]
+        assessments = self.agent._allocate_tokens(niches, 1000, NicheStatus.EXPLORE)
+
+        assert assessments[1].tokens_allocated >= StrategyAgent.COLD_START_TOKENS
+
+    def test_value_guard_caps_asins(self):
+        """Low-value mature niches are capped to LOW_VALUE_ASIN_CAP ASINs."""
+        niches = [(_niche(1, value=2.0, tokens=2000), 0.6)]
+        assessments = self.agent._allocate_tokens(niches, 5000, NicheStatus.EXPLOIT)
+
+        assert assessments[0].max_asins == StrategyAgent.LOW_VALUE_ASIN_CAP
+        assert "VALUE GUARD" in assessments[0].justification
+
+    def test_zero_scores_split_equally(self):
+        """All-zero scores fall back to an equal split."""
+        niches = [(_niche(i), 0.0) for i in range(1, 4)]
+        assessments = self.agent._allocate_tokens(niches, 900, NicheStatus.EXPLORE)
+
+        assert [a.tokens_allocated for a in assessments] == [300, 300, 300]
+
+    @pytest.mark.parametrize("tokens,expected", [(0, 0), (9, 0), (10, 2), (11, 3), (205, 100)])
+    def test_tokens_to_asins_batch_matches_scalar(self, tokens, expected):
+        """Vectorized ASIN conversion matches the scalar formula."""
+        assert self.agent._tokens_to_asins(tokens) == expected
+        assert self.agent._tokens_to_asins_batch(np.array([tokens]))[0] == expected
+
+
+class TestRiskNotes:
+    """Tests for decision risk notes."""
+
+    def test_stale_and_hypothesis_notes(self):
+        """Stale niches are counted and single-run explores flagged."""
+        agent = StrategyAgent()
+        niches = [_niche(1, days=30), _niche(2, runs=1, name="fresh_bet")]
+        decision = agent.decide(budget=1000, niches=niches)
+
+        assert any(n.startswith("STALE DATA: 1 ") for n in decision.risk_notes)
+        assert any("fresh_bet" in n for n in decision.risk_notes)
+
+
+class TestThompsonSampling:
+    """Tests for optional Thompson sampling on density."""
+
+    def test_default_is_deterministic(self):
+        """Without sampling, identical inputs give identical scores."""
+        niches = [_niche(i, opps=10 * i) for i in range(1, 6)]
+        first = StrategyAgent().decide(budget=1000, niches=niches)
+        second = StrategyAgent().decide(budget=1000, niches=niches)
+
+        assert [a.score for a in first.assessments] == [a.score for a in second.assessments]
+
+    def test_seeded_sampling_reproducible(self):
+        """Same seed, same sampled cycle."""
+        niches = [_niche(i, opps=10 * i) for i in range(1, 6)]
+        first = StrategyAgent(thompson_sampling=True, seed=7).decide(budget=1000, niches=niches)
+        second = StrategyAgent(thompson_sampling=True, seed=7).decide(budget=1000, niches=niches)
+
+        assert [a.score for a in first.assessments] == [a.score for a in second.assessments]
+
+    def test_samples_concentrate_for_mature_niches(self):
+        """Posterior of a heavily scanned niche centers on its density."""
+        agent = StrategyAgent(thompson_sampling=True, seed=0)
+        mature = _niche(1, scanned=100000, opps=5000)
+        samples = agent._sample_density([mature] * 200)
+
+        assert abs(samples.mean() - mature.density) < 0.005
+
+
+class TestLLMResponseCache:
+    """Tests for the SQLite tier of the LLM response cache."""
+
+    def _disk_cache(self, tmp_path):
+        from src.scheduler.strategy_agent import LLMResponseCache
+
+        cache = LLMResponseCache(disk_path=str(tmp_path / "llm_cache.sqlite"))
+        cache._redis_cache = None
+        return cache
+
+    def _rows(self, cache):
+        return [key for key, in cache._get_disk().execute("SELECT key FROM llm_cache ORDER BY key")]
+
+    def test_round_trip(self, tmp_path):
+        cache = self._disk_cache(tmp_path)
+        cache.set("k1", {"should_override": False})
+
+        assert cache.get("k1", ttl_hours=24) == {"should_override": False}
+
+    def test_expired_rows_pruned_on_write(self, tmp_path, monkeypatch):
+        from src.scheduler import strategy_agent as sa
+
+        cache = self._disk_cache(tmp_path)
+        cache.set("old", {"n": 1}, ttl_hours=1)
+        clock = sa.time.time() + 2 * 3600
+        monkeypatch.setattr(sa.time, "time", lambda: clock)
+        cache.set("new", {"n": 2}, ttl_hours=1)
+
+        assert self._rows(cache) == ["new"]
+
+    def test_row_count_capped(self, tmp_path, monkeypatch):
+        from src.scheduler import strategy_agent as sa
+
+        cache = self._disk_cache(tmp_path)
+        cache.DISK_MAX_ENTRIES = 2
+        start = sa.time.time()
+        for offset, key in enumerate(("a", "b", "c")):
+            monkeypatch.setattr(sa.time, "time", lambda: start + offset)
+            cache.set(key, {"key": key})
+
+        assert self._rows(cache) == ["b", "c"]
+
+
+class TestLLMOverride:
+    """Tests for applying LLM reclassifications (veto policy)."""
+
+    def setup_method(self):
+        self.agent = StrategyAgent()
+        self.exploits = [(_niche(1), 0.8), (_niche(2), 0.6)]
+        self.explores = [(_niche(3), 0.5), (_niche(4), 0.2)]
+
+    def test_reclassification_applied(self):
+        """EXPLORE -> EXPLOIT moves are applied."""
+        result = {"rationale": [{"niche_id": 3, "new_status": "EXPLOIT", "reason_codes": []}]}
+        exploits, explores, _ = self.agent._apply_llm_response(result, self.exploits, self.explores, 1000)
+
+        assert [n.niche_id for n, _ in exploits] == [1, 2, 3]
+        assert [n.niche_id for n, _ in explores] == [4]
+
+    def test_veto_low_score_promotion(self):
+        """Promotion below the EXPLORE threshold is vetoed."""
+        result = {"rationale": [{"niche_id": 4, "new_status": "EXPLOIT", "reason_codes": []}]}
+        exploits, explores, _ = self.agent._apply_llm_response(result, self.exploits, self.explores, 1000)
+
+        assert 4 not in [n.niche_id for n, _ in exploits]
+
+    def test_unknown_niche_ignored(self):
+        """Unknown niche ids leave buckets untouched."""
+        result = {"rationale": [{"niche_id": 99, "new_status": "EXPLORE", "reason_codes": []}]}
+        exploits, explores, _ = self.agent._apply_llm_response(result, self.exploits, self.explores, 1000)
+
+        assert exploits == self.exploits
+        assert explores == self.explores
+
+    def test_llm_response_memoized(self, monkeypatch):
+        """Same score signature within TTL reuses the LLM answer."""
+        import json
+        from types import SimpleNamespace
+        from src.scheduler import strategy_agent as sa
+
+        monkeypatch.setattr(sa, "_llm_cache", sa.LLMResponseCache(disk_path=""))
+        payload = json.dumps({"should_override": False, "recommended_order": [],
+                              "rationale": [], "confidence": 1.0})
+        calls = []
+
+        def create(**kwargs):
+            calls.append(kwargs)
+            message = SimpleNamespace(content=payload)
+            return SimpleNamespace(usage=None, choices=[SimpleNamespace(message=message)])
+
+        client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+        agent = StrategyAgent(enable_llm=True, llm_config=sa.LLMConfig(api_key="test"))
+        monkeypatch.setattr(agent, "_get_openai_client", lambda: client)
+
+        for _ in range(2):
+            agent._maybe_consult_llm(self.exploits, self.explores, 1000)
+
+        assert len(calls) == 1
+        assert agent._last_llm_metrics.cache_hit
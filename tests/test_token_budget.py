@@ -0,0 +1,292 @@
+"""
+Tests for Smartacus Token Budget Manager.
+
+Runs against a scripted in-memory connection (no PostgreSQL needed):
+- Single round-trip budget fetch / creation
+- BudgetStatus derivation
+
+Usage:
+    pytest tests/test_token_budget.py -v
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from src.scheduler import token_budget
+from src.scheduler.token_budget import TokenBudgetManager
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self._row = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        self.conn.statements.append((" ".join(sql.split()), params))
+        self._row = self.conn.rows.pop(0) if self.conn.rows else None
+
+    def fetchone(self):
+        return self._row
+
+
+class FakeConnection:
+    """Records statements; each execute() consumes the next scripted row."""
+
+    def __init__(self, rows=None):
+        self.rows = list(rows or [])
+        self.statements = []
+        self.commits = 0
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        pass
+
+
+def _row(month="2026-03", limit=900000, used=1000, runs=3, categories=4, opps=2, discovery=0):
+    return (month, limit, used, limit - used, 20, 80, runs, categories, opps, discovery, used - discovery)
+
+
+class TestBudgetStatus:
+    """Tests for get_status / ensure_budget_exists."""
+
+    def test_get_status_single_round_trip(self):
+        """Insert-if-missing and read happen in one statement and one commit."""
+        conn = FakeConnection([_row()])
+        status = TokenBudgetManager(conn=conn).get_status("2026-03")
+
+        assert len(conn.statements) == 1
+        assert conn.commits == 1
+        assert status.tokens_remaining == 899000
+        assert status.discovery_budget == 180000
+        assert status.scanning_budget == 720000
+        assert status.utilization_pct == pytest.approx(1000 / 900000 * 100)
+
+    def test_concurrent_insert_retried(self):
+        """A row inserted by another writer mid-statement is read on retry."""
+        conn = FakeConnection([None, _row()])
+        status = TokenBudgetManager(conn=conn).get_status("2026-03")
+
+        assert len(conn.statements) == 2
+        assert status.month == "2026-03"
+
+    def test_missing_budget_raises(self):
+        conn = FakeConnection([])
+
+        with pytest.raises(RuntimeError):
+            TokenBudgetManager(conn=conn).get_status("2026-03")
+
+
+class TestCurrentMonth:
+    """Tests for the memoized month string."""
+
+    def test_memoized_until_month_boundary(self, monkeypatch):
+        manager = TokenBudgetManager(conn=FakeConnection())
+        end_of_march = datetime(2026, 3, 31, 23, 59, tzinfo=timezone.utc).timestamp()
+
+        monkeypatch.setattr(token_budget.time, "time", lambda: end_of_march)
+        assert manager._current_month() == "2026-03"
+        assert manager._month_cache[0] == datetime(2026, 4, 1, tzinfo=timezone.utc).timestamp()
+
+        monkeypatch.setattr(token_budget.time, "time", lambda: end_of_march + 60)
+        assert manager._current_month() == "2026-04"
+
+
+class TestDailyBudget:
+    """Tests for get_daily_budget."""
+
+    @pytest.mark.parametrize("day,expected_days", [
+        (datetime(2026, 1, 1, 12, tzinfo=timezone.utc), 31),
+        (datetime(2026, 1, 31, 12, tzinfo=timezone.utc), 1),
+        (datetime(2026, 2, 15, 12, tzinfo=timezone.utc), 14),
+        (datetime(2028, 2, 15, 12, tzinfo=timezone.utc), 15),
+    ])
+    def test_exact_month_length(self, monkeypatch, day, expected_days):
+        manager = TokenBudgetManager(conn=FakeConnection([_row(month=day.strftime("%Y-%m"), used=0)]))
+        monkeypatch.setattr(token_budget.time, "time", lambda: day.timestamp())
+
+        assert manager.get_daily_budget() == 900000 // expected_days
+
+
+class TestStatusCache:
+    """Tests for the short-lived BudgetStatus cache."""
+
+    def test_repeated_status_served_from_cache(self):
+        conn = FakeConnection([_row()])
+        manager = TokenBudgetManager(conn=conn)
+
+        first = manager.get_status("2026-03")
+        second = manager.get_status("2026-03")
+
+        assert len(conn.statements) == 1
+        assert second == first
+
+    def test_ttl_zero_disables_cache(self, monkeypatch):
+        monkeypatch.setenv("BUDGET_STATUS_TTL", "0")
+        monkeypatch.setattr(token_budget, "_budget_settings", token_budget._budget_settings.__wrapped__)
+        conn = FakeConnection([_row(), _row()])
+        manager = TokenBudgetManager(conn=conn)
+
+        manager.get_status("2026-03")
+        manager.get_status("2026-03")
+
+        assert len(conn.statements) == 2
+
+    def test_buffered_usage_reflected_in_status(self, monkeypatch):
+        """Pending (unflushed) usage is applied on top of the cached status."""
+        conn = FakeConnection([_row(used=1000, runs=3)])
+        manager = TokenBudgetManager(conn=conn, buffered=True)
+        monkeypatch.setattr(manager, "_current_month", lambda: "2026-03")
+
+        manager.get_status()
+        manager.record_run(tokens_used=500)
+        status = manager.get_status()
+
+        assert len(conn.statements) == 1
+        assert (status.tokens_used, status.tokens_remaining, status.runs_completed) == (1500, 898500, 4)
+
+
+class FakePool:
+    """Hands out a single FakeConnection (stands in for the shared pool)."""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def getconn(self):
+        return self.conn
+
+    def putconn(self, conn):
+        pass
+
+
+class TestRecordRun:
+    """Tests for the default (synchronous) usage writes."""
+
+    def test_record_run_written_immediately(self):
+        conn = FakeConnection([_row(used=1010, runs=4)])
+        manager = TokenBudgetManager(conn=conn)
+        manager._current_month = lambda: "2026-03"
+
+        manager.record_run(tokens_used=10)
+
+        assert conn.statements[0][1] == (10, 0, 10, 1, 1, 0, "2026-03")
+        assert conn.commits == 1
+        assert manager._pending_count == 0
+
+
+class TestWriteBehind:
+    """Tests for buffered (opt-in) usage writes."""
+
+    def setup_method(self):
+        self.conn = FakeConnection()
+        self.manager = TokenBudgetManager(conn=self.conn, buffered=True)
+        self.manager._current_month = lambda: "2026-03"
+
+    def test_runs_flushed_as_one_update(self):
+        """Buffered deltas are written with a single UPDATE."""
+        self.conn.rows.append(_row(used=1000 + 32 * 10, runs=3 + 32))
+        for _ in range(TokenBudgetManager.FLUSH_MAX_DELTAS):
+            self.manager.record_run(tokens_used=10, categories_scanned=2, opportunities_found=1)
+        self.manager.flush()
+
+        updates = [p for sql, p in self.conn.statements if sql.startswith("UPDATE")]
+        assert updates == [(320, 0, 320, 32, 64, 32, "2026-03")]
+        assert self.manager.get_status().runs_completed == 35
+
+    def test_injected_conn_never_flushed_automatically(self):
+        """No timer, batch-size or exit flush commits the caller's connection."""
+        for _ in range(TokenBudgetManager.FLUSH_MAX_DELTAS + 1):
+            self.manager.record_run(tokens_used=10)
+
+        assert self.conn.statements == []
+        assert self.conn.commits == 0
+        assert self.manager._flush_timer is None
+        assert self.manager not in token_budget._LIVE_MANAGERS
+        self.manager.flush()
+
+    def test_pooled_manager_flushes_automatically(self, monkeypatch):
+        """On pooled connections, FLUSH_MAX_DELTAS deltas trigger a flush."""
+        conn = FakeConnection([_row()])
+        monkeypatch.setattr(token_budget, "_get_pool", lambda: FakePool(conn))
+        manager = TokenBudgetManager(buffered=True)
+        manager._current_month = lambda: "2026-03"
+
+        manager.record_run(tokens_used=10)
+        assert manager._flush_timer is not None
+        for _ in range(TokenBudgetManager.FLUSH_MAX_DELTAS - 1):
+            manager.record_run(tokens_used=10)
+
+        assert [p for _, p in conn.statements] == [(320, 0, 320, 32, 32, 0, "2026-03")]
+        assert manager._flush_timer is None
+
+    def test_close_flushes_pending(self):
+        self.manager.record_run(tokens_used=10)
+        self.manager.close()
+
+        assert self.conn.statements[-1][1] == (10, 0, 10, 1, 1, 0, "2026-03")
+        assert self.manager._pending_count == 0
+
+    def test_reserve_is_one_conditional_update(self):
+        """Admission happens in the UPDATE, counting buffered usage."""
+        self.manager.record_run(tokens_used=500)
+        self.conn.rows.append(_row(used=1100))
+
+        assert self.manager.reserve_tokens(100) is True
+
+        sql, params = self.conn.statements[0]
+        assert "tokens_remaining >= %s" in sql
+        assert "scanning_tokens_used + %s <= monthly_limit * scanning_allocation_pct / 100" in sql
+        assert params == (100, 100, "2026-03", 600, 600)
+        self.manager.flush()
+
+    def test_reserve_refused_when_budget_exceeded(self):
+        self.conn.rows.append(_row())
+        self.manager.get_status()
+        self.conn.rows.append(None)
+
+        assert self.manager.reserve_tokens(10 ** 9) is False
+        assert len(self.conn.statements) == 2
+
+    def test_record_runs_bulk_single_update(self):
+        self.conn.rows.append(_row())
+        self.manager.record_runs_bulk([(100, 1, 2), (50, 2, 0), (10, 1, 1)])
+
+        assert self.conn.statements[0][1] == (160, 0, 160, 3, 4, 3, "2026-03")
+        assert len(self.conn.statements) == 1
+
+    def test_discovery_usage_tracked_separately(self):
+        """Discovery runs are charged to their own allocation."""
+        self.conn.rows.append(_row(used=1000, discovery=200))
+        self.manager.get_status()
+        self.manager.record_run(tokens_used=50, run_type="discovery")
+
+        status = self.manager.get_status()
+        assert (status.discovery_used, status.scanning_used) == (250, 800)
+        assert self.manager.can_run(179750, run_type="discovery") is True
+        assert self.manager.can_run(179751, run_type="discovery") is False
+        self.manager.flush()
+
+    def test_unknown_run_type_rejected(self):
+        with pytest.raises(ValueError):
+            self.manager.reserve_tokens(10, run_type="backfill")
+
+    def test_cached_status_is_immutable(self):
+        """Cached statuses are shared, so they cannot be modified in place."""
+        from dataclasses import FrozenInstanceError
+
+        self.conn.rows.append(_row())
+        status = self.manager.get_status()
+
+        with pytest.raises(FrozenInstanceError):
+            status.tokens_remaining = 0